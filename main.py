@@ -3,20 +3,144 @@
 Student Room Analysis Application Entry Point
 
 This is the main entry point for the application.
+Offline modes (preview, benchmarks) never import the MySQL driver.
 """
 
+import argparse
 import sys
 import os
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from src.application.student_room_analyzer import StudentRoomAnalyzer
 
+def parse_args(argv=None):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Student Room Analysis")
+    parser.add_argument(
+        '--mode',
+        choices=['analyze', 'sharded-analysis', 'serve', 'load-test', 'plan-snapshot', 'plan-check',
+                 'preview', 'startup-benchmark', 'compression-benchmark', 'name-search-benchmark'],
+        default='analyze',
+        help="analyze: full MySQL run; sharded-analysis: consolidated report over AppConfig.shards; "
+             "serve: HTTP/JSON query server over an already loaded database; "
+             "load-test: concurrent latency/throughput harness over an already loaded database; "
+             "plan-snapshot/plan-check: record or verify the analysis query plans on a seeded dataset; "
+             "preview/startup-benchmark/compression-benchmark: offline, no database driver; "
+             "name-search-benchmark: in-memory name index plus indexed SQLite name search"
+    )
+    parser.add_argument('--backend', choices=['mysql', 'sqlite'], default='mysql',
+                        help="database for analyze mode; sqlite needs no server or driver")
+    parser.add_argument('--sqlite-path', metavar='PATH',
+                        help="SQLite database file for --backend sqlite (':memory:' for a throwaway run)")
+    parser.add_argument('--bulk-load', action='store_true',
+                        help="create new tables without indexes, load, then build indexes and check integrity")
+    parser.add_argument('--skip-validation', action='store_true',
+                        help="insert students as they are parsed, without the pre-insert checks")
+    parser.add_argument('--duplicate-policy', choices=['last_write_wins', 'reject'], default='last_write_wins',
+                        help="repeated student/room IDs: keep the last occurrence or fail the load")
+    parser.add_argument('--track-history', action='store_true',
+                        help="record room changes in the assignment history and refresh the daily occupancy rollups")
+    parser.add_argument('--as-of', metavar='YYYY-MM-DD',
+                        help="with --track-history: date the load is recorded under (default today)")
+    parser.add_argument('--name-fulltext', action='store_true',
+                        help="add an ngram FULLTEXT index on student names for substring search (MySQL only)")
+    parser.add_argument('--assign-rooms', action='store_true',
+                        help="after the load, place students without a room into rooms with free capacity")
+    parser.add_argument('--sketch-stats', action='store_true',
+                        help="report approximate per-building age percentiles and occupied rooms from load-time sketches")
+    parser.add_argument('--ranking-index', action='store_true',
+                        help="answer the top-room age rankings from an index fed by the load, checked against SQL")
+    parser.add_argument('--approximate', action='store_true',
+                        help="preview mode: estimate statistics from a sample instead of a full pass")
+    parser.add_argument('--time-budget', type=float, metavar='SECONDS',
+                        help="preview mode: time budget for --approximate sampling")
+    parser.add_argument('--host', default=None, help="serve mode: interface to bind")
+    parser.add_argument('--port', type=int, default=None, help="serve mode: port to listen on")
+    parser.add_argument('--pool-size', type=int, default=None, help="serve mode: warm database connections")
+    parser.add_argument('--threads', type=int, default=4, help="load-test mode: concurrent callers")
+    parser.add_argument('--rate', type=float, help="load-test mode: target requests/s (default: closed loop)")
+    parser.add_argument('--duration', type=float, help="load-test mode: seconds per run")
+    parser.add_argument('--mix', help="load-test mode: weighted analyses, e.g. room-occupancy=3,top-rooms-by-avg-age=1")
+    parser.add_argument('--saturate', action='store_true',
+                        help="load-test mode: double the threads until throughput stops growing")
+    parser.add_argument('--plans', metavar='PATH',
+                        help="plan modes: snapshot file (default plans/<backend>.json)")
+    parser.add_argument('--profile', metavar='PATH',
+                        help="write a per-stage CPU/memory profile as JSON")
+    parser.add_argument('--cprofile-dir', metavar='DIR',
+                        help="also dump one cProfile file per stage (requires --profile)")
+    return parser.parse_args(argv)
 
-def main():
+
+def parse_mix(spec):
+    """Parse 'name=weight,name=weight' into a dict (weight defaults to 1)."""
+    mix = {}
+    for item in spec.split(','):
+        name, _, weight = item.partition('=')
+        mix[name.strip()] = float(weight) if weight else 1.0
+    return mix
+
+
+def main(argv=None):
     """Main entry point for the application."""
-    analyzer = StudentRoomAnalyzer()
-    analyzer.run()
+    args = parse_args(argv)
+
+    if args.mode == 'preview':
+        from src.utils.preview import DatabasePreview
+        from src.data.enums import Constants
+        DatabasePreview(
+            approximate=args.approximate,
+            time_budget=args.time_budget or Constants.PREVIEW_TIME_BUDGET
+        ).run()
+    elif args.mode == 'startup-benchmark':
+        from src.utils.benchmarks import StartupBenchmark
+        StartupBenchmark().run()
+    elif args.mode == 'compression-benchmark':
+        from src.utils.benchmarks import CompressionBenchmark
+        CompressionBenchmark().run()
+    elif args.mode == 'name-search-benchmark':
+        from src.utils.benchmarks import NameSearchBenchmark
+        NameSearchBenchmark().run()
+    else:
+        from dataclasses import replace
+        from src.application import StudentRoomAnalyzer
+        from src.config import APP_CONFIG
+        from src.data.enums import Constants, DatabaseBackend, DuplicatePolicy
+        from src.utils.profiling import StageProfiler
+        config = replace(
+            APP_CONFIG, backend=DatabaseBackend(args.backend), bulk_load=args.bulk_load,
+            validate_before_insert=not args.skip_validation,
+            duplicate_policy=DuplicatePolicy(args.duplicate_policy),
+            track_history=args.track_history, history_date=args.as_of, name_fulltext=args.name_fulltext,
+            assign_rooms=args.assign_rooms, sketch_stats=args.sketch_stats,
+            ranking_index=args.ranking_index
+        )
+        if args.sqlite_path:
+            config = replace(config, sqlite_path=args.sqlite_path)
+        profiler = StageProfiler(enabled=bool(args.profile), cprofile_dir=args.cprofile_dir)
+        analyzer = StudentRoomAnalyzer(config=config, profiler=profiler)
+        try:
+            if args.mode == 'sharded-analysis':
+                analyzer.run_sharded_analysis()
+            elif args.mode in ('plan-snapshot', 'plan-check'):
+                if not analyzer.query_plans(check=args.mode == 'plan-check', path=args.plans):
+                    sys.exit(1)
+            elif args.mode == 'load-test':
+                analyzer.load_test(
+                    args.threads, args.duration or Constants.LOAD_TEST_DURATION, args.rate,
+                    parse_mix(args.mix) if args.mix else None, args.saturate
+                )
+            elif args.mode == 'serve':
+                analyzer.serve(
+                    args.host or Constants.DEFAULT_SERVER_HOST,
+                    Constants.DEFAULT_SERVER_PORT if args.port is None else args.port,
+                    args.pool_size or Constants.DEFAULT_POOL_SIZE
+                )
+            else:
+                analyzer.run()
+        finally:
+            if args.profile:
+                profiler.write(args.profile)
 
 
 if __name__ == "__main__":
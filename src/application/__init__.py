@@ -2,9 +2,15 @@
 Application layer for Student Room Analysis.
 
 This package contains the business logic and application services.
+The analyzer is imported on first attribute access so that importing the
+package stays cheap for offline tools.
 """
 
-from .student_room_analyzer import StudentRoomAnalyzer
-
 __all__ = ['StudentRoomAnalyzer']
 
+
+def __getattr__(name):
+    if name == 'StudentRoomAnalyzer':
+        from .student_room_analyzer import StudentRoomAnalyzer
+        return StudentRoomAnalyzer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,100 +4,394 @@ Student Room Analyzer Application Service.
 This module contains the main business logic for the student room analysis application.
 """
 
+import queue
+import threading
+from dataclasses import replace
+from datetime import date
+from typing import Dict, Optional
 from src.config import APP_CONFIG
-from src.data.loaders import StudentDataLoader, RoomDataLoader
-from src.services.connections import MySQLConnection
+from src.data.enums import Constants, DatabaseBackend
+from src.data.cache import ParseCache
+from src.data.loaders import RoomDataLoader, ShardedStudentDataLoader, PreInsertValidator
+from src.services.connections import MySQLConnection, SQLiteConnection, QueryTimeoutError, ReadWriteRouter
+from src.services.assignment import RoomAssignmentEngine
 from src.services.database import DatabaseManager
-from src.services.queries import StudentRoomQueryService
+from src.services.pipeline import PipelineStage, PipelineScheduler
+from src.services.queries import StudentRoomQueryService, ShardedQueryService
+from src.services.rankings import AgeRankingIndex
 from src.services.reports import ConsoleReportGenerator
+from src.services.sketches import BuildingSketchAnalyzer
+from src.services.server import ConnectionPool, QueryHTTPServer
 from src.utils.optimization import OptimizationAdvisor
+from src.utils.profiling import StageProfiler
 
 
 class StudentRoomAnalyzer:
     """Main application service for student room analysis."""
 
-    def __init__(self, config=None):
+    def __init__(self, config=None, profiler=None):
         self.connection = None
+        self.read_connection = None
         self.db_manager = None
         self.query_service = None
         self.report_generator = None
         self.config = config or APP_CONFIG
+        self.profiler = profiler or StageProfiler()
+        self.parse_cache = ParseCache(self.config.files.cache_dir) if self.config.files.cache_dir else None
+        self.rooms = []
+        self.student_batches = queue.Queue(maxsize=Constants.STUDENT_BATCH_QUEUE_SIZE)
+        self.cancelled = threading.Event()
+        self.validator = None
+        self.validated_batches = None
+        self.sketches = None
+        self.ranking_index = None
+
+    def create_connection(self, with_database: bool = True):
+        """Create a connection to the configured backend."""
+        if self.config.backend == DatabaseBackend.SQLITE:
+            return SQLiteConnection(self.config.sqlite_path)
+        db_config = self.config.database.to_dict()
+        if not with_database:
+            db_config.pop('database', None)
+        return MySQLConnection(db_config)
+
+    def create_database_manager(self) -> DatabaseManager:
+        """Create the database manager for the current connection."""
+        history_date = date.fromisoformat(self.config.history_date) if self.config.history_date else None
+        return DatabaseManager(self.connection, self.config.track_history, history_date,
+                               self.config.name_fulltext)
 
     def setup_database_connection(self):
         """Setup database connection and services."""
-        db_config = self.config.database.to_dict()
-        db_config_no_db = db_config.copy()
-        db_config_no_db.pop('database', None)
-        self.connection = MySQLConnection(db_config_no_db)
+        self.connection = self.create_connection(with_database=False)
         self.connection.connect()
-        self.db_manager = DatabaseManager(self.connection)
-        self.query_service = StudentRoomQueryService(self.connection)
+        self.db_manager = self.create_database_manager()
+        self.query_service = StudentRoomQueryService(self.connection, self.config.analysis_timeout)
         self.report_generator = ConsoleReportGenerator()
         print("✓ Database connection and services initialized successfully")
 
     def create_database_schema(self):
         """Create database and tables."""
         print("Creating database schema...")
-        self.db_manager.create_database()
+        self.db_manager.create_database(self.config.database.database)
         
-        db_config = self.config.database.to_dict()
-        self.connection.disconnect()
-        self.connection = MySQLConnection(db_config)
-        self.connection.connect()
-        self.db_manager = DatabaseManager(self.connection)
-        self.query_service = StudentRoomQueryService(self.connection)
+        if self.connection.dialect.has_databases:
+            self.connection.disconnect()
+            self.connection = self.create_connection()
+            self.connection.connect()
+            self.db_manager = self.create_database_manager()
+        self.read_connection = self.connect_read_replicas()
+        self.query_service = StudentRoomQueryService(self.read_connection, self.config.analysis_timeout)
         
-        self.db_manager.create_schema()
+        self.db_manager.create_schema(bulk_load=self.config.bulk_load)
         print("✓ Database schema created successfully")
 
-    def load_and_insert_data(self):
-        """Load data from JSON files and insert into database."""
-        print("Loading and inserting data...")
-        students_loader = StudentDataLoader(self.config.files.students_file)
-        rooms_loader = RoomDataLoader(self.config.files.rooms_file)
-        students = students_loader.load_models()
-        rooms = rooms_loader.load_models()
-        print(f"✓ Loaded {len(students)} students and {len(rooms)} rooms")
-        self.db_manager.insert_rooms(rooms)
-        self.db_manager.insert_students(students)
-        print("✓ Data inserted successfully")
-
-    def run_analysis(self):
-        """Run all analysis queries."""
-        print("\nRunning analysis queries...")
-        
-        self.report_generator.display_rooms_with_student_count(
-            self.query_service.get_rooms_with_student_count()
-        )
-        
-        self.report_generator.display_top_rooms_by_avg_age(
-            self.query_service.get_top_rooms_by_avg_age()
-        )
-        
-        self.report_generator.display_top_rooms_by_age_difference(
-            self.query_service.get_top_rooms_by_age_difference()
-        )
-        
-        self.report_generator.display_rooms_with_mixed_sex(
-            self.query_service.get_rooms_with_mixed_sex()
+    def connect_read_replicas(self):
+        """Route analysis reads to the configured MySQL replicas, if any."""
+        if not self.config.replicas or self.config.backend == DatabaseBackend.SQLITE:
+            return self.connection
+        replicas = [MySQLConnection(replica.to_dict()) for replica in self.config.replicas]
+        for replica in replicas:
+            replica.connect()
+        print(f"✓ Routing analysis reads to {len(replicas)} replica(s) ({self.config.read_policy.value})")
+        return ReadWriteRouter(self.connection, replicas, self.config.read_policy)
+
+    def parse_rooms(self):
+        """Parse the rooms file into Room models."""
+        rooms_file = self.config.files.rooms_file
+        if self.parse_cache:
+            self.rooms = self.parse_cache.load_rooms(rooms_file, lambda path: RoomDataLoader(path).load_models())
+        else:
+            self.rooms = RoomDataLoader(rooms_file).load_models()
+        if self.config.validate_before_insert:
+            self.validator = PreInsertValidator(self.rooms, self.config.duplicate_policy)
+            self.rooms = self.validator.rooms()
+        if self.config.sketch_stats:
+            self.sketches = BuildingSketchAnalyzer(self.rooms)
+        return len(self.rooms)
+
+    def parse_student_batches(self):
+        """Parse the students file and hand batches to the insert stage.
+
+        The batch queue is bounded, so parsing waits while the insert stage
+        is STUDENT_BATCH_QUEUE_SIZE batches behind.
+        """
+        parsed = 0
+        try:
+            loader = ShardedStudentDataLoader(
+                self.config.files.students_file,
+                workers=self.config.files.parse_workers,
+                cache=self.parse_cache
+            )
+            for batch in loader.load_batches():
+                self._hand_off(batch)
+                parsed += len(batch)
+        finally:
+            if not self.cancelled.is_set():
+                self._hand_off(None)
+        return parsed
+
+    def _hand_off(self, batch):
+        """Queue a batch (None ends the stream), giving up if the pipeline is cancelled."""
+        while True:
+            try:
+                self.student_batches.put(batch, timeout=Constants.PIPELINE_POLL_INTERVAL)
+                return
+            except queue.Full:
+                if self.cancelled.is_set():
+                    raise RuntimeError("Student parsing stopped: the load pipeline was cancelled")
+
+    def insert_rooms(self):
+        """Insert the parsed rooms."""
+        self.db_manager.insert_rooms(self.rooms)
+        return len(self.rooms)
+
+    def validate_student_batches(self):
+        """Check every parsed student batch against the rooms before the insert starts.
+
+        Runs alongside the schema creation; the insert stages depend on it,
+        so a rejected input never sends a row.
+        """
+        self.validated_batches = self.validator.validate(iter(self.student_batches.get, None))
+        print(f"✓ Validated {self.validator.report.students} students "
+              f"against {len(self.validator.room_index)} rooms")
+        return self.validator.report.students
+
+    def insert_student_batches(self):
+        """Insert the validated student batches, or stream them from the parser with --skip-validation.
+
+        With ``ranking_index`` the inserted batches feed an AgeRankingIndex
+        through the database manager's events.
+        """
+        if self.config.ranking_index:
+            self.ranking_index = AgeRankingIndex(
+                self.rooms, query_service=self.query_service,
+                student_repository=self.db_manager.student_repository
+            )
+            self.db_manager.add_event_listener(self.ranking_index.apply)
+        if self.validator:
+            batches = self._release_batches(self.validated_batches)
+        else:
+            batches = iter(self.student_batches.get, None)
+        if self.sketches:
+            batches = self._sketch_batches(batches)
+        inserted = self.db_manager.insert_student_batches(batches)
+        if isinstance(self.read_connection, ReadWriteRouter) and self.config.read_your_writes:
+            self.read_connection.capture_write_position()
+        return inserted
+
+    @staticmethod
+    def _release_batches(batches):
+        """Yield the buffered batches, dropping each one once it is handed over."""
+        batches.reverse()
+        while batches:
+            yield batches.pop()
+
+    def _sketch_batches(self, batches):
+        """Feed each batch into the building sketches on its way to the insert."""
+        for batch in batches:
+            self.sketches.add_batches((batch,))
+            yield batch
+
+    def assign_rooms(self):
+        """Place the loaded students without a room into rooms with free capacity."""
+        engine = RoomAssignmentEngine(
+            self.db_manager.room_repository.get_all(),
+            self.db_manager.student_repository.get_all()
         )
+        result = engine.assign()
+        self.db_manager.apply_room_assignments(result)
+        return len(result.placed)
+
+    def roll_up_occupancy(self):
+        """Refresh the daily occupancy rollups after the load."""
+        return self.db_manager.roll_up_occupancy()
+
+    def finish_bulk_load(self):
+        """Build deferred indexes and validate the bulk-loaded data."""
+        self.db_manager.finish_bulk_load()
+
+    def build_pipeline(self) -> PipelineScheduler:
+        """Build the staged load pipeline with its dependency graph."""
+        stages = [
+            PipelineStage('connect', self.setup_database_connection),
+            PipelineStage('schema', self.create_database_schema, ['connect']),
+            PipelineStage('parse_rooms', self.parse_rooms),
+            PipelineStage('parse_students', self.parse_student_batches),
+        ]
+        insert_after = ['schema', 'parse_rooms']
+        if self.config.validate_before_insert:
+            stages.append(PipelineStage('validate_students', self.validate_student_batches, ['parse_rooms']))
+            insert_after.append('validate_students')
+        stages += [
+            PipelineStage('insert_rooms', self.insert_rooms, insert_after),
+            PipelineStage('insert_students', self.insert_student_batches, ['insert_rooms']),
+        ]
+        loaded = 'insert_students'
+        if self.config.bulk_load:
+            stages.append(PipelineStage('build_indexes', self.finish_bulk_load, ['insert_students']))
+            loaded = 'build_indexes'
+        if self.config.assign_rooms:
+            stages.append(PipelineStage('assign_rooms', self.assign_rooms, [loaded]))
+            loaded = 'assign_rooms'
+        if self.config.track_history:
+            stages.append(PipelineStage('roll_up', self.roll_up_occupancy, [loaded]))
+            loaded = 'roll_up'
+        stages.append(PipelineStage('analyze', self.run_analysis, [loaded, 'parse_students']))
+        return PipelineScheduler(stages, profiler=self.profiler, cancelled=self.cancelled)
+
+    def run_analysis(self, query_service=None):
+        """Run all analysis queries, skipping any that exceed their deadline."""
+        print("\nRunning analysis queries...")
+        query_service = query_service or self.query_service
         
-        self.report_generator.display_room_occupancy_analysis(
-            self.query_service.get_room_occupancy_analysis()
-        )
+        analyses = [
+            (query_service.get_rooms_with_student_count,
+             self.report_generator.display_rooms_with_student_count),
+            (query_service.get_top_rooms_by_avg_age,
+             self.report_generator.display_top_rooms_by_avg_age),
+            (query_service.get_top_rooms_by_age_difference,
+             self.report_generator.display_top_rooms_by_age_difference),
+            (query_service.get_rooms_with_mixed_sex,
+             self.report_generator.display_rooms_with_mixed_sex),
+            (query_service.get_room_occupancy_analysis,
+             self.report_generator.display_room_occupancy_analysis),
+            (query_service.get_age_distribution_by_building,
+             self.report_generator.display_age_distribution_by_building),
+        ]
+        if self.ranking_index and query_service is self.query_service:
+            analyses[1] = (self.ranking_index.get_top_rooms_by_avg_age, analyses[1][1])
+            analyses[2] = (self.ranking_index.get_top_rooms_by_age_difference, analyses[2][1])
+        if self.config.track_history and isinstance(query_service, StudentRoomQueryService):
+            analyses.append((query_service.get_building_occupancy_over_time,
+                             self.report_generator.display_building_occupancy_over_time))
         
-        self.report_generator.display_age_distribution_by_building(
-            self.query_service.get_age_distribution_by_building()
-        )
+        skipped = []
+        for fetch, display in analyses:
+            try:
+                with self.profiler.stage(f"analysis.{fetch.__name__}"):
+                    display(fetch())
+            except QueryTimeoutError as e:
+                print(f"\nSkipping {fetch.__name__}: {e}")
+                skipped.append(fetch.__name__)
+        if self.ranking_index and query_service is self.query_service:
+            with self.profiler.stage("analysis.reconcile_ranking_index"):
+                report = self.ranking_index.reconcile()
+            if report['consistent']:
+                print(f"\n✓ Ranking index matches SQL for {report['rooms_checked']} rooms")
+        if self.sketches and query_service is self.query_service:
+            with self.profiler.stage("analysis.sketch_age_percentiles"):
+                self.report_generator.display_age_percentiles_by_building(
+                    self.sketches.get_age_percentiles_by_building(), self.sketches.error_bounds()
+                )
+        return skipped
+
+    def run_sharded_analysis(self):
+        """Run the analyses on every configured shard and print one consolidated report."""
+        if not self.config.shards:
+            raise ValueError("No shards configured in AppConfig.shards")
+        print(f"Running consolidated analysis over {len(self.config.shards)} shards")
+        connections = {}
+        sharded_service = None
+        try:
+            for shard in self.config.shards:
+                connection = MySQLConnection(shard.to_dict())
+                connection.connect()
+                connections[shard.label()] = connection
+            sharded_service = ShardedQueryService({
+                name: StudentRoomQueryService(connection, self.config.analysis_timeout)
+                for name, connection in connections.items()
+            })
+            self.report_generator = self.report_generator or ConsoleReportGenerator()
+            self.run_analysis(sharded_service)
+            self.report_generator.display_shard_latencies(sharded_service.get_shard_latencies())
+        finally:
+            if sharded_service:
+                sharded_service.close()
+            for connection in connections.values():
+                connection.disconnect()
 
     def generate_optimization_report(self):
         """Generate optimization recommendations."""
         print("\nGenerating optimization recommendations...")
-        advisor = OptimizationAdvisor()
-        advisor.generate_report()
+        with self.profiler.stage('report'):
+            advisor = OptimizationAdvisor()
+            advisor.generate_report()
+
+    def serve(self, host: str = Constants.DEFAULT_SERVER_HOST, port: int = Constants.DEFAULT_SERVER_PORT,
+              pool_size: int = Constants.DEFAULT_POOL_SIZE):
+        """Serve the analyses over HTTP from a warm connection pool until interrupted.
+
+        The database must already be loaded (for example by a previous run).
+        """
+        if self.config.backend == DatabaseBackend.SQLITE and self.config.sqlite_path == ':memory:':
+            raise ValueError("The query server needs a SQLite file; each pooled :memory: connection would be empty")
+        pool = ConnectionPool(self.create_connection, pool_size, self.config.analysis_timeout)
+        pool.open()
+        server = QueryHTTPServer(pool, host, port)
+        print(f"✓ Serving analyses on http://{host}:{server.server_port}/analyses "
+              f"({pool_size} pooled connections)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            print("\nShutting down query server")
+        finally:
+            server.server_close()
+            pool.close()
+
+    def load_test(self, threads: int = 4, duration: float = Constants.LOAD_TEST_DURATION,
+                  rate: Optional[float] = None, mix: Optional[Dict[str, float]] = None,
+                  saturate: bool = False):
+        """Measure analysis latency and throughput under concurrent callers."""
+        from src.utils.benchmarks import QueryLoadHarness
+        harness = QueryLoadHarness(self.create_connection, mix, timeout=self.config.analysis_timeout)
+        if saturate:
+            print("Stepping up concurrency until throughput saturates...")
+            steps, saturated = harness.find_saturation(duration)
+            if saturated:
+                knee = steps[-2]
+                print(f"✓ Saturation at {knee.threads} threads ({knee.throughput:.1f} req/s)")
+            else:
+                knee = steps[-1]
+                print(f"✓ No saturation up to {knee.threads} threads ({knee.throughput:.1f} req/s)")
+            print(harness.format_result(knee))
+            return steps
+        result = harness.run(threads, duration, rate)
+        print(harness.format_result(result))
+        return result
+
+    def query_plans(self, check: bool = False, path: Optional[str] = None) -> bool:
+        """Snapshot (or check against the snapshot) the plans of every analysis query.
+
+        Plans are taken on a scratch database loaded with the seeded plan
+        dataset, never on the live data. Returns False if a plan regressed.
+        """
+        from src.utils.plans import QueryPlanSnapshot, generate_seeded_dataset
+        plan_config = replace(
+            self.config,
+            database=replace(self.config.database, database=Constants.PLAN_CHECK_DATABASE),
+            sqlite_path=':memory:', replicas=[], bulk_load=False, track_history=True
+        )
+        planner = StudentRoomAnalyzer(plan_config)
+        try:
+            planner.setup_database_connection()
+            planner.create_database_schema()
+            rooms, students = generate_seeded_dataset()
+            planner.db_manager.insert_rooms(rooms)
+            planner.db_manager.insert_students(students)
+            snapshot = QueryPlanSnapshot(planner.connection, path)
+            if check:
+                return snapshot.check()
+            snapshot.save(snapshot.capture())
+            return True
+        finally:
+            planner.cleanup()
 
     def cleanup(self):
-        """Cleanup database connection."""
+        """Cleanup database connections."""
+        if isinstance(self.read_connection, ReadWriteRouter):
+            for replica in self.read_connection.replicas:
+                replica.disconnect()
         if self.connection:
             self.connection.disconnect()
 
@@ -105,14 +399,18 @@ class StudentRoomAnalyzer:
         """Run the complete analysis workflow."""
         print("Starting Student Room Analysis Application")
         print("="*60)
-        print(f"Using configuration: {self.config.database.database} on {self.config.database.host}:{self.config.database.port}")
+        if self.config.backend == DatabaseBackend.SQLITE:
+            print(f"Using configuration: SQLite database {self.config.sqlite_path}")
+        else:
+            print(f"Using configuration: {self.config.database.database} on {self.config.database.host}:{self.config.database.port}")
         print("="*60)
         
         try:
-            self.setup_database_connection()
-            self.create_database_schema()
-            self.load_and_insert_data()
-            self.run_analysis()
+            pipeline = self.build_pipeline()
+            results = pipeline.run()
+            print(f"✓ Loaded {results['parse_students']} students and {results['parse_rooms']} rooms "
+                  f"({self.connection.commit_count} commits)")
+            print(pipeline.format_timings())
             self.generate_optimization_report()
             
             print("\n" + "="*60)
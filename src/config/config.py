@@ -4,9 +4,11 @@ Configuration for Student Room Analysis.
 This module provides configuration management using dataclasses.
 """
 
-from dataclasses import dataclass
-from typing import Dict, Any
-from src.data.enums import Constants
+import glob
+import os
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional
+from src.data.enums import Constants, ReadPolicy, DatabaseBackend, DuplicatePolicy
 
 
 @dataclass
@@ -32,28 +34,110 @@ class DatabaseConfig:
             'collation': self.collation
         }
 
+    def label(self) -> str:
+        """Short host:port/database label for reports."""
+        return f"{self.host}:{self.port}/{self.database}"
+
 
 @dataclass
 class FilePaths:
-    """File path configuration."""
+    """File path configuration.
+
+    ``students_file`` may be a single file, a glob pattern or a directory of
+    shards. ``parse_workers`` sets the parser process count (0 = one per CPU).
+    ``cache_dir`` enables the persistent binary parse cache.
+    """
     students_file: str
     rooms_file: str
+    parse_workers: int = 0
+    cache_dir: Optional[str] = None
+
+    @staticmethod
+    def resolve(path_spec: str) -> List[str]:
+        """Expand a file, glob pattern or shard directory into sorted file paths."""
+        if os.path.isdir(path_spec):
+            extensions = ('.json',) + Constants.NDJSON_EXTENSIONS
+            extensions += tuple(
+                extension + codec for extension in extensions for codec in Constants.COMPRESSION_EXTENSIONS
+            )
+            paths = [
+                os.path.join(path_spec, name) for name in os.listdir(path_spec)
+                if name.endswith(extensions)
+            ]
+        elif glob.has_magic(path_spec):
+            paths = glob.glob(path_spec)
+        else:
+            return [path_spec]
+        if not paths:
+            raise FileNotFoundError(f"No input files match: {path_spec}")
+        return sorted(paths)
+
+    def resolve_students_files(self) -> List[str]:
+        """Resolve the students input to its shard paths."""
+        return self.resolve(self.students_file)
 
 
 @dataclass
 class DatabaseSchema:
-    """Database schema configuration."""
+    """Database schema configuration.
+
+    The history and rollup tables are created only when assignment history
+    is tracked.
+    """
     create_database_sql: str
     create_rooms_table_sql: str
     create_students_table_sql: str
+    create_history_table_sql: str
+    create_room_rollup_table_sql: str
+    create_building_rollup_table_sql: str
 
 
 @dataclass
 class AppConfig:
-    """Main application configuration."""
+    """Main application configuration.
+
+    ``database`` is the primary that receives every write. Analyses are read
+    from ``replicas`` when any are configured, picked by ``read_policy``;
+    ``read_your_writes`` makes replicas wait for the primary's GTID set after
+    ingest. ``analysis_timeout`` is the deadline in seconds for each analysis
+    query (None = no deadline). Analyses that exceed it are skipped.
+    ``shards`` lists per-campus databases for the consolidated sharded analysis.
+    ``backend`` selects MySQL or the embedded SQLite file at ``sqlite_path``.
+    ``bulk_load`` defers index builds and constraint checks until after ingest.
+    ``validate_before_insert`` checks room references, duplicate IDs (resolved
+    by ``duplicate_policy``) and capacities of every student batch before any
+    row is inserted; without it batches are inserted as they are parsed.
+    ``track_history`` appends every room change to the assignment history and
+    refreshes the daily occupancy rollups for ``history_date`` (ISO date,
+    default today).
+    ``name_fulltext`` adds an ngram FULLTEXT index on student names (MySQL only).
+    ``assign_rooms`` places students loaded without a room (``room_id`` null)
+    into rooms with free capacity after the load.
+    ``sketch_stats`` builds per-building age and room sketches from the batches
+    as they are inserted and adds their approximate statistics to the report.
+    ``ranking_index`` maintains the age rankings in memory from the load's
+    student events, answers the two top-room analyses from it and checks them
+    against SQL.
+    """
     database: DatabaseConfig
     files: FilePaths
     schema: DatabaseSchema
+    analysis_timeout: Optional[float] = None
+    replicas: List[DatabaseConfig] = field(default_factory=list)
+    read_policy: ReadPolicy = ReadPolicy.ROUND_ROBIN
+    read_your_writes: bool = True
+    shards: List[DatabaseConfig] = field(default_factory=list)
+    backend: DatabaseBackend = DatabaseBackend.MYSQL
+    sqlite_path: str = Constants.DEFAULT_SQLITE_PATH
+    bulk_load: bool = False
+    validate_before_insert: bool = True
+    duplicate_policy: DuplicatePolicy = DuplicatePolicy.LAST_WRITE_WINS
+    track_history: bool = False
+    history_date: Optional[str] = None
+    name_fulltext: bool = False
+    assign_rooms: bool = False
+    sketch_stats: bool = False
+    ranking_index: bool = False
 
 
 DEFAULT_DB_CONFIG = DatabaseConfig(
@@ -86,15 +170,53 @@ DEFAULT_SCHEMA = DatabaseSchema(
     create_students_table_sql=f"""
     CREATE TABLE IF NOT EXISTS students (
         id INT PRIMARY KEY,
-        name VARCHAR({Constants.MAX_NAME_LENGTH}) NOT NULL,
+        name VARCHAR({Constants.MAX_NAME_LENGTH}) COLLATE {Constants.DEFAULT_DB_COLLATION} NOT NULL,
         age INT NOT NULL,
         sex CHAR(1) NOT NULL,
-        room_id INT NOT NULL,
+        room_id INT NULL,
         FOREIGN KEY (room_id) REFERENCES rooms(id),
         INDEX idx_room_id (room_id),
         INDEX idx_age (age),
         INDEX idx_sex (sex),
-        INDEX idx_age_sex (age, sex)
+        INDEX idx_age_sex (age, sex),
+        INDEX idx_name (name)
+    )
+    """,
+    create_history_table_sql=f"""
+    CREATE TABLE IF NOT EXISTS room_assignment_history (
+        changed_on DATE NOT NULL,
+        student_id INT NOT NULL,
+        room_id INT NOT NULL,
+        previous_room_id INT NULL,
+        INDEX idx_history_changed_on (changed_on),
+        INDEX idx_history_student (student_id, changed_on)
+    )
+    PARTITION BY RANGE COLUMNS (changed_on) (
+        PARTITION {Constants.FUTURE_PARTITION} VALUES LESS THAN (MAXVALUE)
+    )
+    """,
+    create_room_rollup_table_sql=f"""
+    CREATE TABLE IF NOT EXISTS room_occupancy_daily (
+        day DATE NOT NULL,
+        room_id INT NOT NULL,
+        building VARCHAR({Constants.MAX_BUILDING_LENGTH}) NOT NULL,
+        capacity INT NOT NULL,
+        occupied INT NOT NULL,
+        PRIMARY KEY (day, room_id),
+        INDEX idx_room_occupancy_room (room_id, day)
+    )
+    PARTITION BY RANGE COLUMNS (day) (
+        PARTITION {Constants.FUTURE_PARTITION} VALUES LESS THAN (MAXVALUE)
+    )
+    """,
+    create_building_rollup_table_sql=f"""
+    CREATE TABLE IF NOT EXISTS building_occupancy_daily (
+        day DATE NOT NULL,
+        building VARCHAR({Constants.MAX_BUILDING_LENGTH}) NOT NULL,
+        rooms INT NOT NULL,
+        capacity INT NOT NULL,
+        occupied INT NOT NULL,
+        PRIMARY KEY (building, day)
     )
     """
 )
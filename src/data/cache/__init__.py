@@ -0,0 +1,7 @@
+"""
+Cache package for persistent parsed-input caches.
+"""
+
+from .parse_cache import ParseCache
+
+__all__ = ['ParseCache']
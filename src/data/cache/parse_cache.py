@@ -0,0 +1,283 @@
+"""
+Parse Cache for Student Room Analysis.
+
+Stores each parsed and validated input file in a compact columnar binary
+form. Numeric columns are raw little-endian arrays and text columns are one
+UTF-8 blob plus character offsets. Entries are memory-mapped on load and are
+valid while the source file's size and mtime match. If only the mtime changed,
+the entry is reused when the content hash (SHA-256) still matches. Least
+recently used entries are evicted once the directory exceeds ``max_bytes``.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Callable, Dict, List, Optional, Tuple
+from src.data.models import Room, StudentBatch
+from src.data.enums import Constants
+
+MAGIC = b'SRPCACHE'
+FORMAT_VERSION = 2
+HEADER_STRUCT = struct.Struct('<8sII')
+CORRUPT_ENTRY_ERRORS = (struct.error, ValueError, KeyError, TypeError)
+
+
+def _file_stat(path: str) -> Tuple[int, int]:
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _content_hash(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _array(typecode: str, view: memoryview) -> array:
+    """Copy a raw column into an array with a single memcpy."""
+    values = array(typecode)
+    values.frombytes(view)
+    return values
+
+
+def _release(mapped: mmap.mmap, *views: Optional[memoryview]):
+    """Release every view into a mapping, then close it."""
+    for view in views:
+        if view is not None:
+            view.release()
+    mapped.close()
+
+
+def _check_lengths(count: int, *columns):
+    """Raise ValueError unless every decoded column holds ``count`` rows."""
+    if any(len(column) != count for column in columns):
+        raise ValueError("column lengths do not match the row count")
+
+
+def _encode_text(values: List[str]) -> Tuple[bytes, array]:
+    """Join strings into one UTF-8 blob with character end offsets."""
+    offsets = array('q')
+    position = 0
+    for value in values:
+        position += len(value)
+        offsets.append(position)
+    return ''.join(values).encode('utf-8'), offsets
+
+
+def _decode_text(blob: memoryview, offsets: memoryview) -> List[str]:
+    text = str(blob, 'utf-8')
+    values, start = [], 0
+    for end in offsets:
+        values.append(text[start:end])
+        start = end
+    return values
+
+
+class ParseCache:
+    """Persistent columnar cache of parsed input files."""
+
+    def __init__(self, cache_dir: str, max_bytes: int = Constants.PARSE_CACHE_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _entry_path(self, source: str, kind: str) -> str:
+        key = hashlib.sha1(os.path.abspath(source).encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{kind}-{key}.bin")
+
+    def _write(self, path: str, meta: dict, columns: Dict[str, bytes]):
+        """Write header and columns atomically (8-byte aligned columns)."""
+        layout, offset = {}, 0
+        for name, data in columns.items():
+            layout[name] = [offset, len(data)]
+            offset += -(-len(data) // 8) * 8
+        meta = dict(meta, columns=layout)
+        header = json.dumps(meta).encode('utf-8')
+        header += b' ' * (-(HEADER_STRUCT.size + len(header)) % 8)
+
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'wb') as file:
+            file.write(HEADER_STRUCT.pack(MAGIC, FORMAT_VERSION, len(header)))
+            file.write(header)
+            for data in columns.values():
+                file.write(data)
+                file.write(b'\0' * (-len(data) % 8))
+        os.replace(temp_path, path)
+        self._evict(keep=path)
+
+    def _open(self, path: str) -> Optional[Tuple[dict, mmap.mmap, int]]:
+        """Map a cache entry and return (meta, mapping, data offset).
+
+        Stale, truncated or corrupt entries are deleted and treated as a miss.
+        """
+        try:
+            with open(path, 'rb') as file:
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (FileNotFoundError, ValueError):
+            return None
+        try:
+            magic, version, header_length = HEADER_STRUCT.unpack_from(mapped, 0)
+            if magic != MAGIC or version != FORMAT_VERSION:
+                raise ValueError(f"format version {version} is not {FORMAT_VERSION}")
+            start = HEADER_STRUCT.size
+            meta = json.loads(mapped[start:start + header_length])
+            data_offset = start + header_length
+            for offset, length in meta['columns'].values():
+                if data_offset + offset + length > len(mapped):
+                    raise ValueError("entry is truncated")
+            for key in ('size', 'mtime_ns', 'sha256', 'byteorder', 'count'):
+                meta[key]
+        except CORRUPT_ENTRY_ERRORS as e:
+            mapped.close()
+            self._discard(path, e)
+            return None
+        return meta, mapped, data_offset
+
+    def _discard(self, path: str, error: Exception):
+        """Delete an unusable cache entry."""
+        print(f"Discarding parse cache entry {path}: {error}")
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def _lookup(self, source: str, kind: str):
+        """Return (meta, columns, mapping) for a valid entry, or None."""
+        path = self._entry_path(source, kind)
+        opened = self._open(path)
+        if opened is None:
+            return None
+        meta, mapped, data_offset = opened
+        size, mtime_ns = _file_stat(source)
+        touched = (meta['size'], meta['mtime_ns']) != (size, mtime_ns)
+        if meta['byteorder'] != sys.byteorder or (
+            touched and (meta['size'] != size or meta['sha256'] != _content_hash(source))
+        ):
+            mapped.close()
+            return None
+        view = memoryview(mapped)
+        columns = {
+            name: view[data_offset + offset:data_offset + offset + length]
+            for name, (offset, length) in meta['columns'].items()
+        }
+        if touched:
+            meta.update(mtime_ns=mtime_ns)
+            meta.pop('columns')
+            self._write(path, meta, {name: bytes(column) for name, column in columns.items()})
+        else:
+            os.utime(path)
+        return meta, columns, mapped
+
+    def _source_meta(self, source: str, kind: str, count: int) -> dict:
+        size, mtime_ns = _file_stat(source)
+        return {
+            'kind': kind, 'source': os.path.abspath(source), 'count': count,
+            'size': size, 'mtime_ns': mtime_ns, 'sha256': _content_hash(source),
+            'byteorder': sys.byteorder
+        }
+
+    def load_students(self, source: str, parse: Callable[[str], StudentBatch]) -> StudentBatch:
+        """Return the cached StudentBatch for a file, parsing and storing it on a miss."""
+        entry = self._lookup(source, 'students')
+        if entry is not None:
+            meta, columns, mapped = entry
+            name_offsets = None
+            try:
+                name_offsets = columns['name_offsets'].cast('q')
+                batch = StudentBatch(
+                    ids=_array('q', columns['ids']),
+                    names=_decode_text(columns['names'], name_offsets),
+                    ages=_array('h', columns['ages']),
+                    sexes=list(str(columns['sexes'], 'ascii')),
+                    room_ids=_array('q', columns['room_ids']),
+                    assigned=_array('b', columns['assigned'])
+                )
+                _check_lengths(meta['count'], batch.ids, batch.names, batch.ages,
+                               batch.sexes, batch.room_ids, batch.assigned)
+            except CORRUPT_ENTRY_ERRORS as e:
+                batch = e
+            finally:
+                _release(mapped, name_offsets, *columns.values())
+            if isinstance(batch, StudentBatch):
+                self.hits += 1
+                return batch
+            self._discard(self._entry_path(source, 'students'), batch)
+
+        self.misses += 1
+        batch = parse(source)
+        names, name_offsets = _encode_text(batch.names)
+        self._write(self._entry_path(source, 'students'), self._source_meta(source, 'students', len(batch)), {
+            'ids': batch.ids.tobytes(),
+            'names': names,
+            'name_offsets': name_offsets.tobytes(),
+            'ages': batch.ages.tobytes(),
+            'sexes': ''.join(batch.sexes).encode('ascii'),
+            'room_ids': batch.room_ids.tobytes(),
+            'assigned': batch.assigned.tobytes()
+        })
+        return batch
+
+    def load_rooms(self, source: str, parse: Callable[[str], List[Room]]) -> List[Room]:
+        """Return the cached rooms for a file, parsing and storing them on a miss."""
+        entry = self._lookup(source, 'rooms')
+        if entry is not None:
+            meta, columns, mapped = entry
+            casts = []
+            try:
+                casts = [columns[name].cast(typecode) for name, typecode in (
+                    ('ids', 'q'), ('number_offsets', 'q'), ('building_offsets', 'q'), ('capacities', 'h')
+                )]
+                ids, number_offsets, building_offsets, capacities = casts
+                numbers = _decode_text(columns['numbers'], number_offsets)
+                buildings = _decode_text(columns['buildings'], building_offsets)
+                _check_lengths(meta['count'], ids, numbers, buildings, capacities)
+                rooms = [
+                    Room(id=room_id, number=number, building=building, capacity=capacity)
+                    for room_id, number, building, capacity in zip(ids, numbers, buildings, capacities)
+                ]
+            except CORRUPT_ENTRY_ERRORS as e:
+                rooms = e
+            finally:
+                _release(mapped, *casts, *columns.values())
+            if isinstance(rooms, list):
+                self.hits += 1
+                return rooms
+            self._discard(self._entry_path(source, 'rooms'), rooms)
+
+        self.misses += 1
+        rooms = parse(source)
+        numbers, number_offsets = _encode_text([room.number for room in rooms])
+        buildings, building_offsets = _encode_text([room.building for room in rooms])
+        self._write(self._entry_path(source, 'rooms'), self._source_meta(source, 'rooms', len(rooms)), {
+            'ids': array('q', (room.id for room in rooms)).tobytes(),
+            'numbers': numbers,
+            'number_offsets': number_offsets.tobytes(),
+            'buildings': buildings,
+            'building_offsets': building_offsets.tobytes(),
+            'capacities': array('h', (room.capacity for room in rooms)).tobytes()
+        })
+        return rooms
+
+    def _evict(self, keep: str):
+        """Delete least recently used entries until the cache fits max_bytes."""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, name)
+            if name.endswith('.bin') and os.path.isfile(path):
+                stat = os.stat(path)
+                entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if path != keep:
+                os.remove(path)
+                total -= size
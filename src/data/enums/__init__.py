@@ -3,11 +3,12 @@ Enums package for Student Room Analysis.
 """
 
 from .enums import (
-    Gender, Building, QueryType,
-    SortOrder, Constants
+    Gender, Building, QueryType, StudentEventType, ReadPolicy, DuplicatePolicy,
+    DatabaseBackend, Compression, ColumnType, TimePeriod, NameMatchType, SortOrder, Constants
 )
 
 __all__ = [
-    'Gender', 'Building', 'QueryType',
-    'SortOrder', 'Constants'
+    'Gender', 'Building', 'QueryType', 'StudentEventType', 'ReadPolicy', 'DuplicatePolicy',
+    'DatabaseBackend', 'Compression', 'ColumnType', 'TimePeriod', 'NameMatchType', 'SortOrder',
+    'Constants'
 ]
@@ -45,6 +45,60 @@ class QueryType(Enum):
     DROP = 'DROP'
 
 
+class StudentEventType(Enum):
+    """Student change event enumeration."""
+    INSERT = 'INSERT'
+    MOVE = 'MOVE'
+    REMOVE = 'REMOVE'
+
+
+class ReadPolicy(Enum):
+    """Replica selection policy enumeration."""
+    ROUND_ROBIN = 'round_robin'
+    LEAST_LATENCY = 'least_latency'
+
+
+class DuplicatePolicy(Enum):
+    """Handling of repeated IDs in the input files."""
+    LAST_WRITE_WINS = 'last_write_wins'
+    REJECT = 'reject'
+
+
+class DatabaseBackend(Enum):
+    """Database backend enumeration."""
+    MYSQL = 'mysql'
+    SQLITE = 'sqlite'
+
+
+class Compression(Enum):
+    """Input compression enumeration; values name the stdlib codec module."""
+    GZIP = 'gzip'
+    XZ = 'lzma'
+    BZIP2 = 'bz2'
+
+
+class ColumnType(Enum):
+    """Declared column types for columnar query results."""
+    INT64 = 'int64'
+    FLOAT64 = 'float64'
+    STRING = 'str'
+
+
+class TimePeriod(Enum):
+    """Bucket size for occupancy-over-time queries."""
+    DAY = 'day'
+    WEEK = 'week'
+    MONTH = 'month'
+
+
+class NameMatchType(Enum):
+    """How a student name search result matched the search term."""
+    PREFIX = 'prefix'
+    WORD_PREFIX = 'word_prefix'
+    FULLTEXT = 'fulltext'
+    FUZZY = 'fuzzy'
+
+
 class SortOrder(Enum):
     """Sort order enumeration."""
     ASC = 'ASC'
@@ -60,18 +114,62 @@ class Constants:
     MAX_NAME_LENGTH = 100
     MAX_ROOM_NUMBER_LENGTH = 10
     MAX_BUILDING_LENGTH = 10
+    UNASSIGNED_ROOM_ID = 0  # StudentBatch placeholder; room IDs are positive
     DEFAULT_QUERY_LIMIT = 10
+    MAX_QUERY_LIMIT = 1000
+    DEFAULT_BATCH_SIZE = 1000
+    STUDENT_BATCH_QUEUE_SIZE = 16
+    PIPELINE_POLL_INTERVAL = 0.1
+    NDJSON_EXTENSIONS = ('.ndjson', '.jsonl')
+    COMPRESSION_EXTENSIONS = ('.gz', '.xz', '.bz2')
+    COMPRESSION_MAGIC = {b'\x1f\x8b': 'gzip', b'\xfd7zXZ\x00': 'lzma', b'BZh': 'bz2'}
+    STREAM_CHUNK_CHARS = 1024 * 1024
+    COMPRESSION_BENCHMARK_STUDENTS = 200000
+    HISTORY_PARTITION_MONTHS_AHEAD = 3
+    FUTURE_PARTITION = 'p_future'
+    NAME_FULLTEXT_INDEX = 'ft_students_name'
+    NAME_SIMILARITY_THRESHOLD = 0.3
+    NAME_SEARCH_BENCHMARK_STUDENTS = 2000000
+    MIN_SPLIT_BYTES = 1024 * 1024
+    SPLITS_PER_WORKER = 4
+    PARSE_CACHE_MAX_BYTES = 512 * 1024 * 1024
+    PREVIEW_SAMPLE_SIZE = 10000
+    PREVIEW_TIME_BUDGET = 2.0
+    PREVIEW_SAMPLE_WINDOWS = 64
+    PREVIEW_WINDOW_BYTES = 64 * 1024
     DEFAULT_STUDENTS_FILE = 'data/students.json'
     DEFAULT_ROOMS_FILE = 'data/rooms.json'
     DEFAULT_DB_HOST = 'localhost'
     DEFAULT_DB_PORT = 3306
     DEFAULT_DB_CHARSET = 'utf8mb4'
     DEFAULT_DB_COLLATION = 'utf8mb4_unicode_ci'
+    QUERY_RETRY_ATTEMPTS = 3
+    QUERY_RETRY_BACKOFF = 0.2
+    QUERY_RETRY_BACKOFF_MAX = 2.0
+    KILL_QUERY_GRACE = 1.0
+    GTID_WAIT_TIMEOUT = 5
+    LATENCY_EWMA_WEIGHT = 0.2
+    DEFAULT_SQLITE_PATH = 'student_room.sqlite3'
+    DEFAULT_SERVER_HOST = '127.0.0.1'
+    DEFAULT_SERVER_PORT = 8080
+    DEFAULT_POOL_SIZE = 4
+    POOL_ACQUIRE_TIMEOUT = 5.0
+    SERVER_CACHE_MAX_AGE = 30
+    LOAD_TEST_DURATION = 10.0
+    LOAD_TEST_MAX_THREADS = 64
+    LOAD_SATURATION_MIN_GAIN = 0.10
+    PLAN_SNAPSHOT_DIR = 'plans'
+    PLAN_CHECK_DATABASE = 'student_room_plan_check'
+    PLAN_DATASET_SEED = 42
+    PLAN_DATASET_ROOMS = 500
+    PLAN_DATASET_STUDENTS = 5000
+    PLAN_ROWS_REGRESSION_FACTOR = 2.0
     ERROR_INVALID_GENDER = "Student sex must be 'M' or 'F'"
     ERROR_INVALID_AGE = f"Student age must be between {MIN_AGE} and {MAX_AGE}"
     ERROR_INVALID_CAPACITY = f"Room capacity must be between {MIN_CAPACITY} and {MAX_CAPACITY}"
     ERROR_INVALID_BUILDING = f"Building must be one of: {', '.join(Building.values())}"
     SUCCESS_DB_CONNECTED = "Successfully connected to MySQL database"
+    SUCCESS_SQLITE_CONNECTED = "Successfully opened SQLite database"
     SUCCESS_DB_CLOSED = "Database connection closed"
     SUCCESS_SCHEMA_CREATED = "Database schema created successfully"
     SUCCESS_DATA_INSERTED = "Data inserted successfully"
@@ -3,11 +3,16 @@ Data loaders package for Student Room Analysis.
 """
 
 from .data_loader import (
-    DataLoader, JsonDataLoader, ModelDataLoader,
-    RoomDataLoader, StudentDataLoader
+    DataLoader, JsonDataLoader, NdjsonDataLoader, ModelDataLoader,
+    RoomDataLoader, StudentDataLoader, create_file_loader, is_ndjson,
+    detect_compression, open_input, decompress, iter_json_array
 )
+from .sharded_loader import ShardedStudentDataLoader
+from .pre_insert_validator import PreInsertValidator, ValidationReport
 
 __all__ = [
-    'DataLoader', 'JsonDataLoader', 'ModelDataLoader',
-    'RoomDataLoader', 'StudentDataLoader'
+    'DataLoader', 'JsonDataLoader', 'NdjsonDataLoader', 'ModelDataLoader',
+    'RoomDataLoader', 'StudentDataLoader', 'ShardedStudentDataLoader',
+    'PreInsertValidator', 'ValidationReport', 'create_file_loader', 'is_ndjson',
+    'detect_compression', 'open_input', 'decompress', 'iter_json_array'
 ]
@@ -4,11 +4,146 @@ Data Loader for Student Room Analysis.
 This module handles loading data from various sources.
 """
 
+import importlib
+import io
 import json
-from typing import List, Dict, Any
+import mmap
+import os
+import re
+from typing import List, Dict, Any, Iterator, Optional, BinaryIO, TextIO, Callable
 from abc import ABC, abstractmethod
 from ..models import Room, Student
-from ..enums import Constants
+from ..enums import Compression, Constants
+
+WHITESPACE = re.compile(r'[ \t\n\r]*')
+EXPECT_ARRAY, EXPECT_FIRST, EXPECT_VALUE, EXPECT_SEPARATOR = range(4)
+NUMBER_CHARS = frozenset('0123456789.eE+-')
+NUMBER_TAIL = re.compile(r'[0-9.eE+-]+')
+# Longest cut-off token a decode error can point into: '-Infinit' or a '\ud83d\ude0' escape pair
+MAX_PARTIAL_TOKEN = 12
+
+
+def detect_compression(file_path: str) -> Optional[Compression]:
+    """Return the file's compression from its magic bytes, or None for plain input."""
+    with open(file_path, 'rb') as file:
+        header = file.read(6)
+    for magic, codec in Constants.COMPRESSION_MAGIC.items():
+        if header.startswith(magic):
+            return Compression(codec)
+    return None
+
+
+def open_input(file_path: str) -> BinaryIO:
+    """Open an input file for binary reading, decompressing it on the fly if needed.
+
+    The codec module is imported only when a compressed file is opened.
+    """
+    compression = detect_compression(file_path)
+    if compression is None:
+        return open(file_path, 'rb')
+    return importlib.import_module(compression.value).open(file_path, 'rb')
+
+
+def decompress(raw: BinaryIO, file_path: str) -> BinaryIO:
+    """Wrap an input file opened in binary mode in its codec's decompressing reader, if any.
+
+    ``raw.tell()`` then reports how much of the file on disk has been consumed.
+    """
+    compression = detect_compression(file_path)
+    if compression is None:
+        return raw
+    return importlib.import_module(compression.value).open(raw, 'rb')
+
+
+def strip_compression_suffix(file_path: str) -> str:
+    """Return the path without a trailing .gz/.xz/.bz2 extension."""
+    for extension in Constants.COMPRESSION_EXTENSIONS:
+        if file_path.endswith(extension):
+            return file_path[:-len(extension)]
+    return file_path
+
+
+def iter_json_array(text: TextIO, source: str,
+                    chunk_chars: int = Constants.STREAM_CHUNK_CHARS) -> Iterator[Any]:
+    """Decode the elements of a top-level JSON array incrementally from a text stream.
+
+    Chunks are appended to a buffer and each element is decoded with
+    ``raw_decode`` as soon as it is complete, so memory is bounded by the chunk
+    size and the largest element rather than by the whole document. More
+    input is read only when a decode error points at a token cut off by the
+    end of the buffer; any other error is raised at once. The read size grows
+    with the pending element, so an element spanning many chunks is decoded
+    a logarithmic number of times rather than once per chunk.
+    """
+    decoder = json.JSONDecoder()
+    buffer, position, offset = '', 0, 0
+    eof = False
+    state = EXPECT_ARRAY
+    while True:
+        position = WHITESPACE.match(buffer, position).end()
+        if position < len(buffer):
+            char = buffer[position]
+            if state == EXPECT_ARRAY:
+                if char != '[':
+                    raise ValueError(f"Expected list in {source}, got {char!r} at char {offset + position}")
+                state = EXPECT_FIRST
+                position += 1
+                continue
+            if char == ']' and state in (EXPECT_FIRST, EXPECT_SEPARATOR):
+                _expect_end(text, buffer, position + 1, offset, source, chunk_chars)
+                return
+            if state == EXPECT_SEPARATOR:
+                if char != ',':
+                    raise ValueError(
+                        f"Invalid JSON in {source}: expected ',' or ']' at char {offset + position}"
+                    )
+                state = EXPECT_VALUE
+                position += 1
+                continue
+            try:
+                record, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError as e:
+                if eof or not _cut_off(buffer, e):
+                    raise ValueError(f"Invalid JSON in {source}: {e.msg} at char {offset + e.pos}")
+            else:
+                # A value that touches the end of the buffer may continue in the next chunk,
+                # and a number cut after '1.' or '1e' decodes as the shorter number '1'
+                if eof or end < len(buffer) and not _number_continues(record, buffer[end]):
+                    yield record
+                    position = end
+                    state = EXPECT_SEPARATOR
+                    continue
+        elif eof:
+            raise ValueError(f"Invalid JSON in {source}: unexpected end of data at char {offset + position}")
+
+        chunk = text.read(max(chunk_chars, len(buffer) - position))
+        eof = not chunk
+        offset += position
+        buffer, position = buffer[position:] + chunk, 0
+
+
+def _cut_off(buffer: str, error: json.JSONDecodeError) -> bool:
+    """True if a decode error may only mean the element continues past the end of the buffer."""
+    tail = buffer[error.pos:]
+    return (error.msg.startswith('Unterminated string') or len(tail) < MAX_PARTIAL_TOKEN
+            or NUMBER_TAIL.fullmatch(tail) is not None)
+
+
+def _number_continues(record: Any, char: str) -> bool:
+    """True if ``char`` may extend the number ``record`` was decoded from."""
+    return isinstance(record, (int, float)) and not isinstance(record, bool) and char in NUMBER_CHARS
+
+
+def _expect_end(text: TextIO, buffer: str, position: int, offset: int, source: str, chunk_chars: int):
+    """Raise ValueError unless only whitespace follows the closing bracket, like ``json.load``."""
+    while True:
+        position = WHITESPACE.match(buffer, position).end()
+        if position < len(buffer):
+            raise ValueError(f"Invalid JSON in {source}: extra data at char {offset + position}")
+        offset += position
+        buffer, position = text.read(chunk_chars), 0
+        if not buffer:
+            return
 
 
 class JsonDataValidator:
@@ -28,16 +163,40 @@ class JsonDataValidator:
 
 
 class DataLoader(ABC):
-    """Abstract base class for data loaders."""
+    """Abstract base class for data loaders.
+
+    While a streaming ``iter_records`` runs, ``raw`` is the underlying file
+    and ``bytes_read`` its position, so callers can tell how far through a
+    (possibly compressed) file they are.
+    """
+
+    raw: Optional[BinaryIO] = None
     
     @abstractmethod
     def load(self) -> List[Dict[str, Any]]:
         """Load data and return as list of dictionaries."""
         pass
 
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over records; loaders that can stream override this."""
+        return iter(self.load())
+
+    @property
+    def bytes_read(self) -> int:
+        """Bytes of the file on disk consumed so far by a streaming ``iter_records``."""
+        if self.raw is None or self.raw.closed:
+            return 0
+        return self.raw.tell()
+
 
 class JsonDataLoader(DataLoader):
-    """JSON file data loader."""
+    """JSON file data loader.
+
+    ``iter_records`` feeds the file to the incremental array parser chunk by
+    chunk, so records are available before the whole file has been read.
+    Gzip, xz and bzip2 files are recognised by their magic bytes and decoded
+    as a stream.
+    """
     
     def __init__(self, file_path: str):
         self.file_path = file_path
@@ -45,6 +204,8 @@ class JsonDataLoader(DataLoader):
     def load(self) -> List[Dict[str, Any]]:
         """Load data from JSON file."""
         try:
+            if detect_compression(self.file_path) is not None:
+                return list(self._iter_stream())
             with open(self.file_path, 'r', encoding='utf-8') as file:
                 data = json.load(file)
             
@@ -57,6 +218,121 @@ class JsonDataLoader(DataLoader):
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in {self.file_path}: {e}")
 
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        """Stream records one by one from plain or compressed files."""
+        if not os.path.exists(self.file_path):
+            raise FileNotFoundError(f"File not found: {self.file_path}")
+        return self._iter_stream()
+
+    def _iter_stream(self) -> Iterator[Dict[str, Any]]:
+        """Decode the array incrementally from the (decompressing) stream."""
+        with open(self.file_path, 'rb') as self.raw, \
+                io.TextIOWrapper(decompress(self.raw, self.file_path), encoding='utf-8') as text:
+            yield from iter_json_array(text, self.file_path)
+
+
+class NdjsonDataLoader(DataLoader):
+    """Newline-delimited JSON file loader.
+
+    The file is memory-mapped and line boundaries are found with
+    ``mmap.find``, so it is never read into one buffer. Each line is copied
+    out of the mapping as ``bytes`` and decoded only when its record is
+    iterated (``json.loads`` does not accept a memoryview). ``start``/``end`` restrict loading to the
+    records whose line starts in that byte range. Compressed files are read
+    line by line from the decompressing stream and cannot be split by range.
+    """
+
+    def __init__(self, file_path: str, start: int = 0, end: Optional[int] = None):
+        self.file_path = file_path
+        self.start = start
+        self.end = end
+
+    def load(self) -> List[Dict[str, Any]]:
+        """Load all records from the NDJSON file."""
+        return list(self.iter_records())
+
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        """Decode records lazily, one line at a time."""
+        try:
+            if detect_compression(self.file_path) is not None:
+                yield from self._iter_stream()
+                return
+            with open(self.file_path, 'rb') as file:
+                if file.seek(0, 2) == 0:
+                    return
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    yield from self._iter_mapped(mapped)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {self.file_path}")
+
+    def _iter_mapped(self, mapped: mmap.mmap) -> Iterator[Dict[str, Any]]:
+        """Yield records from the mapped byte range, copying one line at a time for ``json.loads``."""
+        size = len(mapped)
+        end = size if self.end is None else min(self.end, size)
+        position = self.start
+        if position > 0:
+            newline = mapped.find(b'\n', position - 1)
+            position = size if newline == -1 else newline + 1
+
+        while position < end:
+            newline = mapped.find(b'\n', position)
+            line_end = size if newline == -1 else newline
+            line = mapped[position:line_end]
+            if line.strip():
+                yield self._decode(line, position, lambda: self._line_number(mapped, position))
+            position = line_end + 1
+
+    def _iter_stream(self) -> Iterator[Dict[str, Any]]:
+        """Yield records from a decompressing stream; offsets refer to the decompressed bytes."""
+        if self.start or self.end is not None:
+            raise ValueError(f"Byte ranges are not supported for compressed input: {self.file_path}")
+        with open(self.file_path, 'rb') as self.raw, decompress(self.raw, self.file_path) as stream:
+            pending, position, line_number = b'', 0, 0
+            while True:
+                chunk = stream.read(Constants.STREAM_CHUNK_CHARS)
+                lines = (pending + chunk).split(b'\n')
+                pending = lines.pop() if chunk else b''
+                for line in lines:
+                    line_number += 1
+                    if line.strip():
+                        yield self._decode(line, position, lambda: line_number)
+                    position += len(line) + 1
+                if not chunk:
+                    return
+
+    def _decode(self, line: bytes, position: int, line_number: Callable[[], int]) -> Dict[str, Any]:
+        """Decode one line, reporting its line number and byte offset on error."""
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(
+                f"Invalid JSON in {self.file_path} at line "
+                f"{line_number()} (byte {position}): {e}"
+            )
+        if not isinstance(record, dict):
+            raise ValueError(
+                f"Expected object in {self.file_path} at line "
+                f"{line_number()}, got {type(record)}"
+            )
+        return record
+
+    @staticmethod
+    def _line_number(mapped: mmap.mmap, position: int) -> int:
+        """Return the 1-based line number of a byte offset (error path only)."""
+        return mapped[:position].count(b'\n') + 1
+
+
+def is_ndjson(file_path: str) -> bool:
+    """Return True if the path uses a newline-delimited JSON extension (before any .gz/.xz/.bz2)."""
+    return strip_compression_suffix(file_path).endswith(Constants.NDJSON_EXTENSIONS)
+
+
+def create_file_loader(file_path: str) -> DataLoader:
+    """Return the loader matching the file format (JSON array or NDJSON)."""
+    if is_ndjson(file_path):
+        return NdjsonDataLoader(file_path)
+    return JsonDataLoader(file_path)
+
 
 class ModelDataLoader(ABC):
     """Abstract base class for loading data into models."""
@@ -71,11 +347,11 @@ class RoomDataLoader(ModelDataLoader):
     """Loader for Room models."""
     
     def __init__(self, file_path: str = Constants.DEFAULT_ROOMS_FILE):
-        self.json_loader = JsonDataLoader(file_path)
+        self.json_loader = create_file_loader(file_path)
     
     def load_models(self) -> List[Room]:
-        """Load rooms from JSON and convert to Room objects."""
-        raw_data = self.json_loader.load()
+        """Load rooms from JSON or NDJSON and convert to Room objects."""
+        raw_data = self.json_loader.iter_records()
         rooms = []
         
         for data in raw_data:
@@ -95,11 +371,18 @@ class StudentDataLoader(ModelDataLoader):
     """Loader for Student models."""
     
     def __init__(self, file_path: str = Constants.DEFAULT_STUDENTS_FILE):
-        self.json_loader = JsonDataLoader(file_path)
+        self.json_loader = create_file_loader(file_path)
     
     def load_models(self) -> List[Student]:
         """Load students from JSON and convert to Student objects."""
-        raw_data = self.json_loader.load()
+        students = []
+        for batch in self.load_model_batches():
+            students.extend(batch)
+        return students
+
+    def load_model_batches(self, batch_size: int = Constants.DEFAULT_BATCH_SIZE) -> Iterator[List[Student]]:
+        """Load students from JSON or NDJSON and yield them in batches of Student objects."""
+        raw_data = self.json_loader.iter_records()
         students = []
         
         for data in raw_data:
@@ -112,5 +395,9 @@ class StudentDataLoader(ModelDataLoader):
                     room_id=data['room_id']
                 )
                 students.append(student)
+                if len(students) >= batch_size:
+                    yield students
+                    students = []
         
-        return students
+        if students:
+            yield students
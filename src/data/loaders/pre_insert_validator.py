@@ -0,0 +1,132 @@
+"""
+Pre-insert checks of parsed rooms and students.
+"""
+
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from ..enums import DuplicatePolicy
+from ..models import Room, StudentBatch
+
+
+@dataclass
+class ValidationReport:
+    """Findings of a PreInsertValidator run.
+
+    Duplicate maps hold the number of occurrences of each repeated ID;
+    ``unknown_rooms`` maps a missing room ID to the students referencing it;
+    ``over_capacity`` lists (room_id, capacity, occupants).
+    """
+    students: int = 0
+    duplicate_student_ids: Dict[int, int] = field(default_factory=dict)
+    duplicate_room_ids: Dict[int, int] = field(default_factory=dict)
+    unknown_rooms: Dict[int, int] = field(default_factory=dict)
+    over_capacity: List[Tuple[int, int, int]] = field(default_factory=list)
+
+    def errors(self, policy: DuplicatePolicy) -> List[str]:
+        """Findings that must stop the load."""
+        errors = []
+        if self.unknown_rooms:
+            errors.append(f"{sum(self.unknown_rooms.values())} students reference "
+                          f"{len(self.unknown_rooms)} missing room(s): {self._sample(self.unknown_rooms)}")
+        if policy == DuplicatePolicy.REJECT:
+            if self.duplicate_student_ids:
+                errors.append(f"{len(self.duplicate_student_ids)} duplicate student ID(s): "
+                              f"{self._sample(self.duplicate_student_ids)}")
+            if self.duplicate_room_ids:
+                errors.append(f"{len(self.duplicate_room_ids)} duplicate room ID(s): "
+                              f"{self._sample(self.duplicate_room_ids)}")
+        return errors
+
+    def warnings(self) -> List[str]:
+        """Findings that are reported but do not stop the load."""
+        warnings = []
+        if self.duplicate_student_ids:
+            warnings.append(f"{len(self.duplicate_student_ids)} duplicate student ID(s); "
+                            f"last occurrence kept (last write wins)")
+        if self.duplicate_room_ids:
+            warnings.append(f"{len(self.duplicate_room_ids)} duplicate room ID(s); last definition kept")
+        for room_id, capacity, occupants in self.over_capacity:
+            warnings.append(f"room {room_id} is over capacity: {occupants} students for {capacity} places")
+        return warnings
+
+    @staticmethod
+    def _sample(counts: Dict[int, int], limit: int = 10) -> str:
+        items = sorted(counts.items())[:limit]
+        more = f", ... ({len(counts) - limit} more)" if len(counts) > limit else ""
+        return ", ".join(f"{key} (x{count})" for key, count in items) + more
+
+
+class PreInsertValidator:
+    """Checks every student batch against the parsed rooms before any student is inserted.
+
+    Rooms go into a hashed index (dict) by ID and each batch's room_ids are
+    looked up in it as the batch is parsed, so a reference to a missing room
+    fails the load at the first batch that has one. Student IDs already seen
+    are kept with their room: under ``DuplicatePolicy.REJECT`` the first
+    repeat fails the load, otherwise the upsert makes the last occurrence
+    win. Occupancy is compared with capacity once the stream ends. The
+    checked batches are returned for the insert, so no student SQL is sent
+    until the whole input has passed.
+    """
+
+    def __init__(self, rooms: Iterable[Room], duplicate_policy: DuplicatePolicy = DuplicatePolicy.LAST_WRITE_WINS):
+        self.duplicate_policy = duplicate_policy
+        self.report = ValidationReport()
+        self.room_index: Dict[int, Room] = {}
+        self.student_rooms: Dict[int, Optional[int]] = {}
+        for room in rooms:
+            if room.id in self.room_index:
+                self.report.duplicate_room_ids[room.id] = self.report.duplicate_room_ids.get(room.id, 1) + 1
+            self.room_index[room.id] = room
+        self._raise_errors()
+
+    def rooms(self) -> List[Room]:
+        """The rooms to insert, one per ID."""
+        return list(self.room_index.values())
+
+    def validate(self, batches: Iterable[StudentBatch]) -> List[StudentBatch]:
+        """Check every batch, report capacity warnings and return the batches to insert.
+
+        Raises ValueError at the first batch referencing a missing room and
+        (under REJECT) at the first duplicate student ID.
+        """
+        checked = []
+        for batch in batches:
+            self.check(batch)
+            checked.append(batch)
+        self.finish()
+        return checked
+
+    def check(self, batch: StudentBatch):
+        """Look up one batch's rooms and record its student IDs."""
+        report = self.report
+        report.students += len(batch)
+        duplicates = report.duplicate_student_ids
+        student_rooms = self.student_rooms
+        for student_id, room_id in zip(batch.ids, batch.nullable_room_ids()):
+            if room_id is not None and room_id not in self.room_index:
+                report.unknown_rooms[room_id] = report.unknown_rooms.get(room_id, 0) + 1
+            if student_id in student_rooms:
+                duplicates[student_id] = duplicates.get(student_id, 1) + 1
+            student_rooms[student_id] = room_id
+        self._raise_errors()
+
+    def finish(self) -> ValidationReport:
+        """Compare the final occupancy of each room with its capacity and print the warnings."""
+        occupancy = Counter(self.student_rooms.values())
+        occupancy.pop(None, None)
+        for room_id, occupants in sorted(occupancy.items()):
+            room = self.room_index[room_id]
+            if occupants > room.capacity:
+                self.report.over_capacity.append((room_id, room.capacity, occupants))
+        for warning in self.report.warnings():
+            print(f"Validation warning: {warning}")
+        return self.report
+
+    def _raise_errors(self):
+        errors = self.report.errors(self.duplicate_policy)
+        if errors:
+            for error in errors:
+                print(f"Validation error: {error}")
+            raise ValueError("Input rejected: " + "; ".join(errors))
@@ -0,0 +1,130 @@
+"""
+Sharded Student Loader for Student Room Analysis.
+
+This module parses sharded or newline-delimited student inputs in a process
+pool. Workers validate records and hand back columnar StudentBatch objects.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Iterator, Tuple, Optional
+from src.config import FilePaths
+from .data_loader import (
+    JsonDataValidator, ModelDataLoader, NdjsonDataLoader, create_file_loader, is_ndjson,
+    detect_compression
+)
+from ..models import Student, StudentBatch
+from ..enums import Constants
+
+ShardTask = Tuple[str, Optional[int], Optional[int]]
+
+
+def iter_student_shard(task: ShardTask, batch_size: int = Constants.DEFAULT_BATCH_SIZE) -> Iterator[StudentBatch]:
+    """Parse one shard or byte range, yielding a StudentBatch every batch_size students."""
+    file_path, start, end = task
+    if start is None:
+        records = create_file_loader(file_path).iter_records()
+    else:
+        records = NdjsonDataLoader(file_path, start, end).iter_records()
+
+    batch = StudentBatch()
+    for data in records:
+        if JsonDataValidator.validate_student_data(data):
+            batch.append(Student(
+                id=data['id'],
+                name=data['name'],
+                age=data['age'],
+                sex=data['sex'],
+                room_id=data['room_id']
+            ))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = StudentBatch()
+    if batch:
+        yield batch
+
+
+def parse_student_shard(task: ShardTask) -> StudentBatch:
+    """Parse one shard or byte range into a single StudentBatch (process-pool worker)."""
+    batch = StudentBatch()
+    for part in iter_student_shard(task):
+        batch.extend(part)
+    return batch
+
+
+class ShardedStudentDataLoader(ModelDataLoader):
+    """Loader that parses student shards in parallel worker processes."""
+
+    def __init__(self, path_spec: str = Constants.DEFAULT_STUDENTS_FILE, workers: int = 0, cache=None):
+        self.file_paths = FilePaths.resolve(path_spec)
+        self.workers = workers or os.cpu_count() or 1
+        self.cache = cache
+
+    def plan_tasks(self, file_paths: Optional[List[str]] = None) -> List[ShardTask]:
+        """Split the inputs into tasks: whole files, or byte ranges of large uncompressed NDJSON files."""
+        tasks = []
+        for file_path in file_paths or self.file_paths:
+            splittable = is_ndjson(file_path) and detect_compression(file_path) is None
+            size = os.path.getsize(file_path) if splittable else 0
+            splits = min(
+                self.workers * Constants.SPLITS_PER_WORKER,
+                size // Constants.MIN_SPLIT_BYTES
+            )
+            if splits <= 1:
+                tasks.append((file_path, None, None))
+                continue
+            step = -(-size // splits)
+            tasks.extend(
+                (file_path, offset, min(offset + step, size))
+                for offset in range(0, size, step)
+            )
+        return tasks
+
+    def load_batches(self, batch_size: int = Constants.DEFAULT_BATCH_SIZE) -> Iterator[StudentBatch]:
+        """Yield columnar student batches in input order."""
+        if self.cache is not None:
+            for file_path in self.file_paths:
+                batch = self.cache.load_students(file_path, self._parse_file)
+                yield from self._rebatch([batch], batch_size)
+            return
+        yield from self._rebatch(self._parse_tasks(self.plan_tasks(), batch_size), batch_size)
+
+    def _parse_tasks(self, tasks: List[ShardTask],
+                     batch_size: int = Constants.DEFAULT_BATCH_SIZE) -> Iterator[StudentBatch]:
+        """Parse tasks inline or in the process pool, preserving order.
+
+        Inline parsing yields each batch as soon as it is full, so a single
+        input file starts feeding the insert stage before it is fully read.
+        """
+        if self.workers == 1 or len(tasks) == 1:
+            for task in tasks:
+                yield from iter_student_shard(task, batch_size)
+            return
+        with ProcessPoolExecutor(max_workers=min(self.workers, len(tasks))) as executor:
+            yield from executor.map(parse_student_shard, tasks)
+
+    def _parse_file(self, file_path: str) -> StudentBatch:
+        """Parse one whole file (possibly split across workers) into a single batch."""
+        batch = StudentBatch()
+        for part in self._parse_tasks(self.plan_tasks([file_path])):
+            batch.extend(part)
+        return batch
+
+    @staticmethod
+    def _rebatch(results: Iterator[StudentBatch], batch_size: int) -> Iterator[StudentBatch]:
+        """Cut worker results into batches of at most batch_size rows."""
+        for batch in results:
+            for start in range(0, len(batch), batch_size):
+                yield batch.slice(start, start + batch_size)
+
+    def load_model_batches(self, batch_size: int = Constants.DEFAULT_BATCH_SIZE) -> Iterator[List[Student]]:
+        """Load students in batches of Student objects."""
+        for batch in self.load_batches(batch_size):
+            yield batch.to_models()
+
+    def load_models(self) -> List[Student]:
+        """Load all students as Student objects."""
+        students = []
+        for batch in self.load_batches():
+            students.extend(batch.to_models())
+        return students
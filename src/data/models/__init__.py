@@ -2,6 +2,6 @@
 Data models package for Student Room Analysis.
 """
 
-from .models import Room, Student
+from .models import Room, Student, StudentBatch, StudentEvent, NameMatch
 
-__all__ = ['Room', 'Student']
+__all__ = ['Room', 'Student', 'StudentBatch', 'StudentEvent', 'NameMatch']
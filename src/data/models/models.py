@@ -2,8 +2,10 @@
 Data models for the student room analysis application.
 """
 
-from dataclasses import dataclass
-from ..enums import Gender, Building, Constants
+from array import array
+from dataclasses import dataclass, field
+from typing import List, Optional
+from ..enums import Gender, Building, Constants, NameMatchType, StudentEventType
 
 
 @dataclass
@@ -32,12 +34,12 @@ class Room:
 
 @dataclass
 class Student:
-    """Data model for a student."""
+    """Data model for a student. ``room_id`` is None for unassigned students."""
     id: int
     name: str
     age: int
     sex: str
-    room_id: int
+    room_id: Optional[int]
     
     def __post_init__(self):
         """Validate student data after initialization."""
@@ -51,5 +53,128 @@ class Student:
             raise ValueError(Constants.ERROR_INVALID_AGE)
         if not Gender.is_valid(self.sex):
             raise ValueError(Constants.ERROR_INVALID_GENDER)
-        if self.room_id <= 0:
+        if self.room_id is not None and self.room_id <= 0:
             raise ValueError("Room ID must be positive")
+
+
+@dataclass
+class StudentBatch:
+    """Columnar batch of validated students.
+
+    Pickles as a handful of flat buffers instead of one object per student,
+    which keeps process-pool hand-offs cheap. Unassigned students hold
+    ``Constants.UNASSIGNED_ROOM_ID`` in ``room_ids`` and 0 in ``assigned``.
+    """
+    ids: array = field(default_factory=lambda: array('q'))
+    names: List[str] = field(default_factory=list)
+    ages: array = field(default_factory=lambda: array('h'))
+    sexes: List[str] = field(default_factory=list)
+    room_ids: array = field(default_factory=lambda: array('q'))
+    assigned: array = field(default_factory=lambda: array('b'))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def append(self, student: Student):
+        """Append a validated student."""
+        self.ids.append(student.id)
+        self.names.append(student.name)
+        self.ages.append(student.age)
+        self.sexes.append(student.sex)
+        if student.room_id is None:
+            self.room_ids.append(Constants.UNASSIGNED_ROOM_ID)
+            self.assigned.append(0)
+        else:
+            self.room_ids.append(student.room_id)
+            self.assigned.append(1)
+
+    def extend(self, other: 'StudentBatch'):
+        """Append all rows of another batch."""
+        self.ids.extend(other.ids)
+        self.names.extend(other.names)
+        self.ages.extend(other.ages)
+        self.sexes.extend(other.sexes)
+        self.room_ids.extend(other.room_ids)
+        self.assigned.extend(other.assigned)
+
+    def slice(self, start: int, stop: int) -> 'StudentBatch':
+        """Return the rows in [start, stop) as a new batch."""
+        return StudentBatch(
+            ids=self.ids[start:stop],
+            names=self.names[start:stop],
+            ages=self.ages[start:stop],
+            sexes=self.sexes[start:stop],
+            room_ids=self.room_ids[start:stop],
+            assigned=self.assigned[start:stop]
+        )
+
+    def take(self, rows: List[int]) -> 'StudentBatch':
+        """Return the rows at the given positions, in order, as a new batch."""
+        return StudentBatch(
+            ids=array('q', (self.ids[row] for row in rows)),
+            names=[self.names[row] for row in rows],
+            ages=array('h', (self.ages[row] for row in rows)),
+            sexes=[self.sexes[row] for row in rows],
+            room_ids=array('q', (self.room_ids[row] for row in rows)),
+            assigned=array('b', (self.assigned[row] for row in rows))
+        )
+
+    def nullable_room_ids(self) -> List[Optional[int]]:
+        """Room IDs with None for unassigned students."""
+        return [room_id if assigned else None for room_id, assigned in zip(self.room_ids, self.assigned)]
+
+    def to_rows(self) -> List[tuple]:
+        """Return (id, name, age, sex, room_id) rows for bulk inserts."""
+        return list(zip(self.ids, self.names, self.ages, self.sexes, self.nullable_room_ids()))
+
+    def to_models(self) -> List[Student]:
+        """Convert the batch back into Student objects."""
+        return [Student(*row) for row in self.to_rows()]
+
+
+@dataclass
+class StudentEvent:
+    """A student insert, move or remove. Moves and removes only need the ID."""
+    type: StudentEventType
+    student_id: int
+    room_id: Optional[int] = None
+    age: Optional[int] = None
+
+    @classmethod
+    def insert(cls, student: Student) -> 'StudentEvent':
+        return cls(StudentEventType.INSERT, student.id, student.room_id, student.age)
+
+    @classmethod
+    def inserts(cls, batch: StudentBatch) -> List['StudentEvent']:
+        """One insert event per row of a columnar batch."""
+        return [
+            cls(StudentEventType.INSERT, student_id, room_id, age)
+            for student_id, room_id, age in zip(batch.ids, batch.nullable_room_ids(), batch.ages)
+        ]
+
+    @classmethod
+    def move(cls, student_id: int, room_id: int) -> 'StudentEvent':
+        return cls(StudentEventType.MOVE, student_id, room_id)
+
+    @classmethod
+    def remove(cls, student_id: int) -> 'StudentEvent':
+        return cls(StudentEventType.REMOVE, student_id)
+
+
+@dataclass
+class NameMatch:
+    """A student name search result with the student's room.
+
+    ``score`` is 1.0 for prefix matches, the FULLTEXT relevance for FULLTEXT
+    matches and the trigram similarity for fuzzy matches. Room fields are None
+    for unassigned students.
+    """
+    student_id: int
+    name: str
+    age: int
+    sex: str
+    room_id: Optional[int]
+    room_number: Optional[str]
+    building: Optional[str]
+    match_type: NameMatchType
+    score: float
@@ -0,0 +1,7 @@
+"""
+Assignment package for placing students into rooms.
+"""
+
+from .room_assignment_engine import AssignmentResult, RoomAssignmentEngine
+
+__all__ = ['AssignmentResult', 'RoomAssignmentEngine']
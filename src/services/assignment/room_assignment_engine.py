@@ -0,0 +1,140 @@
+"""
+Room Assignment Engine for placing unassigned students into rooms.
+
+Rooms with free places are indexed in buckets keyed by
+(building, occupant sex, free places). Capacity is bounded by
+Constants.MAX_CAPACITY, so finding a room for a student takes constant work
+per building and a full run is near-linear in rooms plus students.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from src.data.models import Room, Student, StudentBatch
+from src.data.enums import Constants, Gender
+
+MIXED = 'X'
+
+
+@dataclass
+class AssignmentResult:
+    """Outcome of an assignment run."""
+    placed: StudentBatch = field(default_factory=StudentBatch)
+    unplaced: List[Student] = field(default_factory=list)
+
+    def to_update_rows(self) -> List[Tuple[int, int]]:
+        """Return (room_id, student_id) rows for a bulk room_id update."""
+        return list(zip(self.placed.room_ids, self.placed.ids))
+
+
+@dataclass
+class _RoomState:
+    """Mutable occupancy state for one room."""
+    room: Room
+    free: int
+    sex: Optional[str] = None
+    min_age: Optional[int] = None
+    max_age: Optional[int] = None
+
+    def add(self, student: Student):
+        """Record a student as an occupant."""
+        if self.sex is None:
+            self.sex = student.sex
+        elif self.sex != student.sex:
+            self.sex = MIXED
+        self.min_age = student.age if self.min_age is None else min(self.min_age, student.age)
+        self.max_age = student.age if self.max_age is None else max(self.max_age, student.age)
+        self.free -= 1
+
+
+class RoomAssignmentEngine:
+    """Places unassigned students into rooms with free capacity."""
+
+    def __init__(self, rooms: List[Room], students: List[Student],
+                 avoid_mixed_sex: bool = True, minimize_age_spread: bool = False):
+        self.avoid_mixed_sex = avoid_mixed_sex
+        self.minimize_age_spread = minimize_age_spread
+        self.states: Dict[int, _RoomState] = {
+            room.id: _RoomState(room=room, free=room.capacity) for room in rooms
+        }
+        self.buildings = sorted({room.building for room in rooms})
+        self.unassigned = [student for student in students if student.room_id is None]
+        for student in students:
+            if student.room_id is not None and student.room_id in self.states:
+                self.states[student.room_id].add(student)
+        self.buckets: Dict[tuple, Dict[int, None]] = {}
+        for state in self.states.values():
+            self._index(state)
+
+    def _index(self, state: _RoomState):
+        """Insert a room into the bucket matching its current state."""
+        if state.free > 0:
+            key = (state.room.building, state.sex, state.free)
+            self.buckets.setdefault(key, {})[state.room.id] = None
+
+    def _unindex(self, state: _RoomState):
+        """Remove a room from its current bucket."""
+        key = (state.room.building, state.sex, state.free)
+        bucket = self.buckets.get(key)
+        if bucket is not None:
+            bucket.pop(state.room.id, None)
+
+    def _sex_keys(self, student: Student) -> List[Optional[str]]:
+        """Occupant-sex keys a student may join, partially filled rooms first."""
+        if self.avoid_mixed_sex:
+            return [student.sex, None]
+        other = [sex for sex in Gender.values() if sex != student.sex]
+        return [student.sex, MIXED] + other + [None]
+
+    def _find_room(self, student: Student) -> Optional[_RoomState]:
+        """Best fit: the compatible room with the fewest free places."""
+        for sex in self._sex_keys(student):
+            for free in range(1, Constants.MAX_CAPACITY + 1):
+                for building in self.buildings:
+                    bucket = self.buckets.get((building, sex, free))
+                    if bucket:
+                        return self.states[next(iter(bucket))]
+        return None
+
+    def _can_join(self, state: _RoomState, student: Student) -> bool:
+        """Check capacity and the sex constraint for one room."""
+        if state.free <= 0:
+            return False
+        return not self.avoid_mixed_sex or state.sex in (None, student.sex)
+
+    def assign(self) -> AssignmentResult:
+        """Place every unassigned student that fits and return the update batch."""
+        result = AssignmentResult()
+        students = self.unassigned
+        if self.minimize_age_spread:
+            students = sorted(students, key=lambda student: (student.sex, student.age))
+        last_room: Dict[str, _RoomState] = {}
+
+        for student in students:
+            state = last_room.get(student.sex) if self.minimize_age_spread else None
+            if state is None or not self._can_join(state, student):
+                state = self._find_room(student)
+            if state is None:
+                result.unplaced.append(student)
+                continue
+
+            self._unindex(state)
+            state.add(student)
+            self._index(state)
+            last_room[student.sex] = state
+            result.placed.append(Student(
+                id=student.id,
+                name=student.name,
+                age=student.age,
+                sex=student.sex,
+                room_id=state.room.id
+            ))
+
+        return result
+
+    def age_spread(self) -> Dict[int, int]:
+        """Return the current max-min age spread of every occupied room."""
+        return {
+            room_id: state.max_age - state.min_age
+            for room_id, state in self.states.items()
+            if state.min_age is not None
+        }
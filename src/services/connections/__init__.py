@@ -1,8 +1,20 @@
 """
 Connections package for database connections.
+
+Driver-backed implementations are imported on first attribute access.
 """
 
+from .columnar_result import ColumnarResult
 from .database_connection import DatabaseConnection
-from .mysql_connection import MySQLConnection
+from .query_timeout_error import QueryTimeoutError
+from .read_write_router import ReadWriteRouter
+from .sqlite_connection import SQLiteConnection
+
+__all__ = ['ColumnarResult', 'DatabaseConnection', 'MySQLConnection', 'QueryTimeoutError', 'ReadWriteRouter', 'SQLiteConnection']
+
 
-__all__ = ['DatabaseConnection', 'MySQLConnection']
+def __getattr__(name):
+    if name == 'MySQLConnection':
+        from .mysql_connection import MySQLConnection
+        return MySQLConnection
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,67 @@
+"""
+Columnar conversion of query results.
+
+Rows are transposed into one typed array per column: NumPy arrays when NumPy
+is installed, ``array.array`` otherwise (plain lists for strings).
+"""
+
+from array import array
+from typing import Any, Dict, List, Sequence, Union
+from src.data.enums import ColumnType
+
+TYPECODES = {ColumnType.INT64: 'q', ColumnType.FLOAT64: 'd'}
+
+# One typed array (or list of strings) per column, in SELECT order
+ColumnarResult = Dict[str, Any]
+
+_numpy = None
+
+
+def numpy_module():
+    """Import NumPy on first use; None when it is not installed."""
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+            _numpy = numpy
+        except ImportError:
+            _numpy = False
+    return _numpy or None
+
+
+def convert_column(name: str, values: Sequence, column_type: ColumnType) -> Any:
+    """Convert one column of driver values (native, Decimal, str or raw bytes) to a typed array.
+
+    STRING columns also take dates and other values, as their ``str()``.
+    """
+    numpy = numpy_module()
+    if column_type is ColumnType.STRING:
+        strings = [
+            value.decode('utf-8') if isinstance(value, (bytes, bytearray))
+            else value if value is None or isinstance(value, str) else str(value)
+            for value in values
+        ]
+        return numpy.array(strings, dtype=object) if numpy else strings
+    if column_type is ColumnType.FLOAT64:
+        numbers = (float('nan') if value is None else float(value) for value in values)
+    else:
+        if any(value is None for value in values):
+            raise ValueError(f"NULL in INT64 column {name!r}; declare it FLOAT64")
+        numbers = map(int, values)
+    if numpy:
+        return numpy.fromiter(numbers, dtype=column_type.value, count=len(values))
+    return array(TYPECODES[column_type], numbers)
+
+
+def build_columns(rows: List[Sequence], dtypes: Dict[str, Union[ColumnType, str]]) -> ColumnarResult:
+    """Transpose result rows into ``{column: array}`` following the declared dtype map.
+
+    ``dtypes`` names every result column in SELECT order.
+    """
+    if rows and len(rows[0]) != len(dtypes):
+        raise ValueError(f"Query returned {len(rows[0])} columns but {len(dtypes)} dtypes were declared")
+    columns = list(zip(*rows)) if rows else [()] * len(dtypes)
+    return {
+        name: convert_column(name, values, ColumnType(column_type))
+        for (name, column_type), values in zip(dtypes.items(), columns)
+    }
@@ -4,13 +4,41 @@ Database Connection abstract base class.
 This module defines the interface for database connections.
 """
 
-from typing import List
+import itertools
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
 from abc import ABC, abstractmethod
+from src.services.dialects import MySQLDialect
+from .columnar_result import ColumnarResult, build_columns
 
 
 class DatabaseConnection(ABC):
-    """Abstract base class for database connections."""
-    
+    """Abstract base class for database connections.
+
+    ``execute`` commits each statement on its own unless it runs inside
+    ``transaction()``, which groups every statement into a single commit.
+    Nested ``transaction()`` blocks and ``savepoint()`` roll back only their
+    own statements on error. ``commit_count`` counts commits issued.
+    ``dialect`` rewrites the MySQL-syntax SQL used across the application.
+    Transaction state is per connection and unlocked: a connection is used by
+    one thread at a time (pipeline stages sharing it run one after another).
+
+    Subclasses that only implement the abstract methods keep committing each
+    statement in ``execute``: the default ``begin``/``commit``/``rollback`` do
+    nothing and ``savepoint()`` sends no SQL. Drivers with real transactions
+    override the three methods and set ``supports_transactions``.
+    """
+
+    dialect = MySQLDialect()
+    supports_transactions = False
+    commit_count = 0
+    _transaction_depth = 0
+    _savepoint_ids = itertools.count(1)
+
+    def __init__(self):
+        self.commit_count = 0
+        self._transaction_depth = 0
+
     @abstractmethod
     def connect(self):
         """Establish database connection."""
@@ -27,6 +55,87 @@ class DatabaseConnection(ABC):
         pass
     
     @abstractmethod
-    def fetch_all(self, query: str, params: tuple = None) -> List[tuple]:
-        """Fetch all results from a query."""
+    def fetch_all(self, query: str, params: tuple = None, timeout: Optional[float] = None) -> List[tuple]:
+        """Fetch all results from a query.
+
+        Implementations raise QueryTimeoutError when ``timeout`` seconds pass.
+        """
         pass
+
+    def fetch_columnar(self, query: str, dtypes: Dict[str, Any], params: tuple = None,
+                       timeout: Optional[float] = None) -> ColumnarResult:
+        """Fetch a result as one typed array per column.
+
+        ``dtypes`` maps every result column, in SELECT order, to a ColumnType.
+        Arrays are NumPy arrays when NumPy is installed and ``array.array``
+        otherwise (lists for strings). FLOAT64 columns map NULL to NaN.
+        """
+        return build_columns(self.fetch_all(query, params, timeout=timeout), dtypes)
+
+    def begin(self):
+        """Start a transaction on the underlying driver (nothing to start by default)."""
+        pass
+
+    def commit(self):
+        """Commit the current transaction (statements were already committed by default)."""
+        pass
+
+    def rollback(self):
+        """Roll back the current transaction (committed statements stay by default)."""
+        pass
+
+    @property
+    def in_transaction(self) -> bool:
+        """True while inside a transaction() block."""
+        return self._transaction_depth > 0
+
+    @contextmanager
+    def transaction(self):
+        """Unit of work: commit once on success, roll back on error or a failed commit."""
+        if self.in_transaction:
+            with self.savepoint():
+                yield self
+            return
+
+        self.begin()
+        self._transaction_depth = 1
+        try:
+            yield self
+        except BaseException:
+            self._transaction_depth = 0
+            self.rollback()
+            raise
+        self._transaction_depth = 0
+        try:
+            self.commit()
+        except BaseException:
+            try:
+                self.rollback()
+            except Exception as e:
+                print(f"Rollback after a failed commit also failed: {e}")
+            raise
+
+    @contextmanager
+    def savepoint(self, name: Optional[str] = None):
+        """Partial rollback point inside a transaction; errors undo only this block."""
+        if not self.in_transaction:
+            raise RuntimeError("savepoint() must be used inside transaction()")
+        if not self.supports_transactions:
+            self._transaction_depth += 1
+            try:
+                yield self
+            finally:
+                self._transaction_depth -= 1
+            return
+        name = name or f"sp_{next(self._savepoint_ids)}"
+        self.execute(f"SAVEPOINT {name}")
+        self._transaction_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self.execute(f"ROLLBACK TO SAVEPOINT {name}")
+            raise
+        else:
+            self.execute(f"RELEASE SAVEPOINT {name}")
+        finally:
+            self._transaction_depth -= 1
@@ -2,27 +2,62 @@
 MySQL Connection implementation for Student Room Analysis.
 """
 
-import mysql.connector
-from typing import List
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional
 from .database_connection import DatabaseConnection
+from .query_timeout_error import QueryTimeoutError
+from .columnar_result import ColumnarResult, build_columns
 from src.data.enums import Constants
 
+ER_QUERY_INTERRUPTED = 1317
+ER_QUERY_TIMEOUT = 3024
+CONNECTION_LOST_ERRNOS = (2006, 2013, 2055)
+
+SELECT_PREFIX = re.compile(r'^\s*SELECT\b', re.IGNORECASE)
+
+
+def _mysql_connector():
+    """Import the MySQL driver on first use."""
+    import mysql.connector
+    return mysql.connector
+
 
 class MySQLConnection(DatabaseConnection):
-    """MySQL database connection implementation."""
+    """MySQL database connection implementation.
+
+    SELECTs with a timeout carry a MAX_EXECUTION_TIME hint; a watchdog issues
+    KILL QUERY from a separate connection if the server has not stopped the
+    statement shortly after the deadline. Reads that lose the connection
+    outside a transaction are retried with bounded exponential backoff.
+    Columnar fetches use a raw cursor, so numeric cells arrive as bytes and
+    are parsed straight into the column arrays without building Decimals.
+    """
+
+    supports_transactions = True
 
-    def __init__(self, config: dict):
+    def __init__(self, config: dict, default_timeout: Optional[float] = None,
+                 retry_attempts: int = Constants.QUERY_RETRY_ATTEMPTS):
+        super().__init__()
         self.config = config
         self.connection = None
         self.cursor = None
+        self.raw_cursor = None
+        self.default_timeout = default_timeout
+        self.retry_attempts = retry_attempts
+        self._active_query = 0
+        self._active_lock = threading.Lock()
 
     def connect(self):
         """Establish MySQL connection."""
+        connector = _mysql_connector()
         try:
-            self.connection = mysql.connector.connect(**self.config)
+            self.connection = connector.connect(**self.config)
             self.cursor = self.connection.cursor()
+            self.raw_cursor = self.connection.cursor(raw=True)
             print(Constants.SUCCESS_DB_CONNECTED)
-        except mysql.connector.Error as e:
+        except connector.Error as e:
             print(f"Error connecting to MySQL: {e}")
             raise
 
@@ -30,33 +65,146 @@ class MySQLConnection(DatabaseConnection):
         """Close MySQL connection."""
         if self.cursor:
             self.cursor.close()
+        if self.raw_cursor:
+            self.raw_cursor.close()
         if self.connection:
             self.connection.close()
             print(Constants.SUCCESS_DB_CLOSED)
 
     def execute(self, query: str, params: tuple = None):
-        """Execute a SQL query."""
+        """Execute a SQL query, committing unless inside a transaction."""
         try:
             self.cursor.execute(query, params)
-            self.connection.commit()
-        except mysql.connector.Error as e:
+            if not self.in_transaction:
+                self.commit()
+        except _mysql_connector().Error as e:
             print(f"Error executing query: {e}")
             raise
 
     def execute_many(self, query: str, params_list: List[tuple]):
-        """Execute a SQL query with multiple parameter sets."""
+        """Execute a SQL query with multiple parameter sets, committing unless inside a transaction."""
         try:
             self.cursor.executemany(query, params_list)
-            self.connection.commit()
-        except mysql.connector.Error as e:
+            if not self.in_transaction:
+                self.commit()
+        except _mysql_connector().Error as e:
             print(f"Error executing batch query: {e}")
             raise
 
-    def fetch_all(self, query: str, params: tuple = None) -> List[tuple]:
-        """Fetch all results from a query."""
+    def begin(self):
+        """Start a transaction unless the driver already has one open."""
+        if not self.connection.in_transaction:
+            self.connection.start_transaction()
+
+    def commit(self):
+        """Commit the current transaction."""
+        self.connection.commit()
+        self.commit_count += 1
+
+    def rollback(self):
+        """Roll back the current transaction."""
+        self.connection.rollback()
+
+    def fetch_all(self, query: str, params: tuple = None, timeout: Optional[float] = None) -> List[tuple]:
+        """Fetch all results from a query, honoring the deadline and retrying lost connections."""
+        return self._fetch(query, params, timeout)
+
+    def fetch_columnar(self, query: str, dtypes: Dict[str, Any], params: tuple = None,
+                       timeout: Optional[float] = None) -> ColumnarResult:
+        """Fetch a result through the raw cursor and return one typed array per column."""
+        return build_columns(self._fetch(query, params, timeout, raw=True), dtypes)
+
+    def _fetch(self, query: str, params: tuple, timeout: Optional[float], raw: bool = False) -> List[tuple]:
+        """Run a fetch with the deadline and connection-loss retries.
+
+        The deadline covers every attempt, reconnect and backoff; each attempt
+        gets what is left of it.
+        """
+        timeout = timeout if timeout is not None else self.default_timeout
+        deadline = time.monotonic() + timeout if timeout else None
+        connector = _mysql_connector()
+        reconnect = False
+        for attempt in range(self.retry_attempts + 1):
+            try:
+                if reconnect:
+                    self._reconnect()
+                    reconnect = False
+                remaining = None
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise QueryTimeoutError(query, timeout)
+                return self._fetch_with_deadline(query, params, remaining, raw)
+            except connector.Error as e:
+                if e.errno in (ER_QUERY_TIMEOUT, ER_QUERY_INTERRUPTED) and timeout:
+                    raise QueryTimeoutError(query, timeout) from e
+                retryable = (reconnect or e.errno in CONNECTION_LOST_ERRNOS) and not self.in_transaction
+                if not retryable or attempt == self.retry_attempts:
+                    print(f"Error fetching data: {e}")
+                    raise
+                delay = min(Constants.QUERY_RETRY_BACKOFF * 2 ** attempt, Constants.QUERY_RETRY_BACKOFF_MAX)
+                if deadline is not None and time.monotonic() + delay >= deadline:
+                    raise QueryTimeoutError(query, timeout) from e
+                print(f"Connection lost ({e.errno}), retrying in {delay:.1f}s")
+                time.sleep(delay)
+                reconnect = True
+
+    def _fetch_with_deadline(self, query: str, params: tuple, timeout: Optional[float],
+                             raw: bool = False) -> List[tuple]:
+        """Run one fetch attempt under the server hint and the KILL QUERY watchdog."""
+        cursor = self.raw_cursor if raw else self.cursor
+        if not timeout:
+            cursor.execute(query, params)
+            return cursor.fetchall()
+
+        if SELECT_PREFIX.match(query):
+            query = SELECT_PREFIX.sub(f"SELECT /*+ MAX_EXECUTION_TIME({max(1, int(timeout * 1000))}) */", query, count=1)
+            grace = Constants.KILL_QUERY_GRACE
+        else:
+            grace = 0.0
+
+        with self._active_lock:
+            self._active_query += 1
+            query_number = self._active_query
+        watchdog = threading.Timer(
+            timeout + grace, self._kill_query,
+            args=(self.connection.connection_id, query_number)
+        )
+        watchdog.daemon = True
+        watchdog.start()
         try:
-            self.cursor.execute(query, params)
-            return self.cursor.fetchall()
-        except mysql.connector.Error as e:
-            print(f"Error fetching data: {e}")
-            raise
+            cursor.execute(query, params)
+            return cursor.fetchall()
+        finally:
+            with self._active_lock:
+                self._active_query += 1
+            watchdog.cancel()
+
+    def _kill_query(self, connection_id: int, query_number: int):
+        """Cancel a running statement from a separate watchdog connection.
+
+        The lock is held through the KILL, so the statement cannot finish and
+        the next one on this connection cannot start until it has been sent.
+        """
+        connector = _mysql_connector()
+        with self._active_lock:
+            if self._active_query != query_number:
+                return
+            try:
+                watchdog = connector.connect(**self.config)
+                try:
+                    cursor = watchdog.cursor()
+                    cursor.execute(f"KILL QUERY {int(connection_id)}")
+                    cursor.close()
+                finally:
+                    watchdog.close()
+            except connector.Error as e:
+                print(f"Watchdog could not cancel query on connection {connection_id}: {e}")
+
+    def _reconnect(self):
+        """Drop the broken connection and open a new one."""
+        try:
+            self.disconnect()
+        except _mysql_connector().Error:
+            pass
+        self.connect()
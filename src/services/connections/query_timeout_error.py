@@ -0,0 +1,15 @@
+"""
+Query timeout error raised when a query exceeds its deadline.
+"""
+
+from typing import Optional
+
+
+class QueryTimeoutError(Exception):
+    """A query was cancelled because it exceeded its deadline."""
+
+    def __init__(self, query: str, timeout: Optional[float]):
+        self.query = query
+        self.timeout = timeout
+        first_line = query.strip().splitlines()[0] if query.strip() else query
+        super().__init__(f"Query exceeded its {timeout}s deadline: {first_line}")
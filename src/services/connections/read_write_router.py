@@ -0,0 +1,144 @@
+"""
+Read/write splitting connection for a primary with read replicas.
+"""
+
+import itertools
+import time
+from typing import Any, Callable, Dict, List, Optional
+from .database_connection import DatabaseConnection
+from .query_timeout_error import QueryTimeoutError
+from .columnar_result import ColumnarResult
+from src.data.enums import Constants, ReadPolicy
+
+
+class ReadWriteRouter(DatabaseConnection):
+    """Sends writes to the primary and reads to replicas.
+
+    After ``capture_write_position()`` a replica must have applied the
+    primary's GTID set (WAIT_FOR_EXECUTED_GTID_SET) before serving a read;
+    replicas that do not catch up in time, or fail, fall back to the primary.
+    """
+
+    def __init__(self, primary: DatabaseConnection, replicas: List[DatabaseConnection],
+                 policy: ReadPolicy = ReadPolicy.ROUND_ROBIN):
+        self.primary = primary
+        self.replicas = replicas
+        self.policy = policy
+        self.latencies: Dict[int, float] = {}
+        self.write_gtid_set: Optional[str] = None
+        self._caught_up = set()
+        self._round_robin = itertools.count()
+
+    @property
+    def config(self) -> dict:
+        return self.primary.config
+
+    def connect(self):
+        """Connect the primary and every replica."""
+        self.primary.connect()
+        for replica in self.replicas:
+            replica.connect()
+
+    def disconnect(self):
+        """Close the primary and every replica."""
+        for replica in self.replicas:
+            replica.disconnect()
+        self.primary.disconnect()
+
+    def execute(self, query: str, params: tuple = None):
+        """Execute a write on the primary."""
+        self.primary.execute(query, params)
+
+    def execute_many(self, query: str, params_list: List[tuple]):
+        """Execute a batch write on the primary."""
+        self.primary.execute_many(query, params_list)
+
+    def begin(self):
+        """Start a transaction on the primary."""
+        self.primary.begin()
+
+    def commit(self):
+        """Commit the primary's transaction."""
+        self.primary.commit()
+
+    def rollback(self):
+        """Roll back the primary's transaction."""
+        self.primary.rollback()
+
+    @property
+    def in_transaction(self) -> bool:
+        return self.primary.in_transaction
+
+    @property
+    def dialect(self):
+        return self.primary.dialect
+
+    @property
+    def commit_count(self) -> int:
+        return self.primary.commit_count
+
+    def transaction(self):
+        """Unit of work on the primary."""
+        return self.primary.transaction()
+
+    def savepoint(self, name: Optional[str] = None):
+        """Savepoint on the primary."""
+        return self.primary.savepoint(name)
+
+    def capture_write_position(self):
+        """Record the primary's executed GTID set for read-your-writes."""
+        rows = self.primary.fetch_all("SELECT @@GLOBAL.gtid_executed")
+        self.write_gtid_set = rows[0][0] if rows else None
+        self._caught_up = set()
+
+    def _select_replica(self) -> int:
+        """Pick a replica index according to the read policy."""
+        if self.policy is ReadPolicy.LEAST_LATENCY:
+            return min(range(len(self.replicas)), key=lambda index: self.latencies.get(index, 0.0))
+        return next(self._round_robin) % len(self.replicas)
+
+    def _wait_for_writes(self, index: int) -> bool:
+        """Wait until a replica has applied the captured GTID set."""
+        if not self.write_gtid_set or index in self._caught_up:
+            return True
+        rows = self.replicas[index].fetch_all(
+            "SELECT WAIT_FOR_EXECUTED_GTID_SET(%s, %s)",
+            (self.write_gtid_set, Constants.GTID_WAIT_TIMEOUT)
+        )
+        if rows and rows[0][0] == 0:
+            self._caught_up.add(index)
+            return True
+        return False
+
+    def fetch_all(self, query: str, params: tuple = None, timeout: Optional[float] = None) -> List[tuple]:
+        """Read from a replica, falling back to the primary."""
+        return self._read(lambda connection: connection.fetch_all(query, params, timeout=timeout))
+
+    def fetch_columnar(self, query: str, dtypes: Dict[str, Any], params: tuple = None,
+                       timeout: Optional[float] = None) -> ColumnarResult:
+        """Columnar read from a replica, falling back to the primary."""
+        return self._read(lambda connection: connection.fetch_columnar(query, dtypes, params, timeout=timeout))
+
+    def _read(self, fetch: Callable[[DatabaseConnection], Any]) -> Any:
+        """Run a read on the selected replica, or on the primary as a fallback."""
+        if not self.replicas:
+            return fetch(self.primary)
+
+        index = self._select_replica()
+        try:
+            if not self._wait_for_writes(index):
+                print(f"Replica {index} has not caught up with the primary; reading from primary")
+                return fetch(self.primary)
+            started = time.perf_counter()
+            result = fetch(self.replicas[index])
+        except QueryTimeoutError:
+            raise
+        except Exception as e:
+            print(f"Replica {index} failed ({e}); reading from primary")
+            return fetch(self.primary)
+
+        elapsed = time.perf_counter() - started
+        weight = Constants.LATENCY_EWMA_WEIGHT
+        previous = self.latencies.get(index, elapsed)
+        self.latencies[index] = (1 - weight) * previous + weight * elapsed
+        return result
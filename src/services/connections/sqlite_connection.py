@@ -0,0 +1,118 @@
+"""
+SQLite Connection implementation for Student Room Analysis.
+
+An embedded backend on the standard library's sqlite3: no server, no driver
+install. Statements are written in MySQL syntax and translated by
+SQLiteDialect.
+"""
+
+import sqlite3
+import time
+from typing import List, Optional
+from .database_connection import DatabaseConnection
+from .query_timeout_error import QueryTimeoutError
+from src.data.enums import Constants
+from src.services.dialects import SQLiteDialect
+
+PROGRESS_INTERVAL = 10000
+
+
+class SQLiteConnection(DatabaseConnection):
+    """SQLite database connection implementation.
+
+    The driver runs in autocommit mode; ``transaction()`` issues explicit
+    BEGIN/COMMIT so savepoints and commit counts behave as with MySQL.
+    Deadlines abort the statement from sqlite3's progress handler.
+    """
+
+    dialect = SQLiteDialect()
+    supports_transactions = True
+
+    def __init__(self, path: str = ':memory:', default_timeout: Optional[float] = None):
+        super().__init__()
+        self.path = path
+        self.connection = None
+        self.cursor = None
+        self.default_timeout = default_timeout
+
+    def connect(self):
+        """Open the SQLite database file (created if missing)."""
+        try:
+            self.connection = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+            self.connection.execute("PRAGMA foreign_keys = ON")
+            self.dialect.register_functions(self.connection)
+            self.cursor = self.connection.cursor()
+            print(f"{Constants.SUCCESS_SQLITE_CONNECTED} {self.path}")
+        except sqlite3.Error as e:
+            print(f"Error connecting to SQLite: {e}")
+            raise
+
+    def disconnect(self):
+        """Close SQLite connection."""
+        if self.cursor:
+            self.cursor.close()
+        if self.connection:
+            self.connection.close()
+            print(Constants.SUCCESS_DB_CLOSED)
+
+    def execute(self, query: str, params: tuple = None):
+        """Execute a SQL query, committing unless inside a transaction."""
+        try:
+            self.cursor.execute(self.dialect.translate(query), params or ())
+            if not self.in_transaction:
+                self.commit_count += 1
+        except sqlite3.Error as e:
+            print(f"Error executing query: {e}")
+            raise
+
+    def execute_many(self, query: str, params_list: List[tuple]):
+        """Execute a SQL query with multiple parameter sets, committing unless inside a transaction."""
+        own_transaction = not self.in_transaction
+        try:
+            if own_transaction:
+                self.begin()
+            self.cursor.executemany(self.dialect.translate(query), params_list)
+            if own_transaction:
+                self.commit()
+        except sqlite3.Error as e:
+            if own_transaction and self.connection.in_transaction:
+                self.rollback()
+            print(f"Error executing batch query: {e}")
+            raise
+
+    def begin(self):
+        """Start a transaction unless one is already open."""
+        if not self.connection.in_transaction:
+            self.cursor.execute("BEGIN")
+
+    def commit(self):
+        """Commit the current transaction."""
+        if self.connection.in_transaction:
+            self.cursor.execute("COMMIT")
+        self.commit_count += 1
+
+    def rollback(self):
+        """Roll back the current transaction."""
+        if self.connection.in_transaction:
+            self.cursor.execute("ROLLBACK")
+
+    def fetch_all(self, query: str, params: tuple = None, timeout: Optional[float] = None) -> List[tuple]:
+        """Fetch all results from a query, aborting it once the deadline passes."""
+        timeout = timeout if timeout is not None else self.default_timeout
+        if timeout:
+            deadline = time.monotonic() + timeout
+            self.connection.set_progress_handler(lambda: time.monotonic() > deadline, PROGRESS_INTERVAL)
+        try:
+            self.cursor.execute(self.dialect.translate(query), params or ())
+            return self.cursor.fetchall()
+        except sqlite3.OperationalError as e:
+            if timeout and str(e) == 'interrupted':
+                raise QueryTimeoutError(query, timeout) from e
+            print(f"Error fetching data: {e}")
+            raise
+        except sqlite3.Error as e:
+            print(f"Error fetching data: {e}")
+            raise
+        finally:
+            if timeout:
+                self.connection.set_progress_handler(None, PROGRESS_INTERVAL)
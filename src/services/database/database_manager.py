@@ -4,62 +4,266 @@ Database Manager for Student Room Analysis.
 This module handles database operations and schema management.
 """
 
-import mysql.connector
-from typing import List
-from src.config.config import *
-from src.data.models import Room, Student
+from contextlib import contextmanager, nullcontext
+from datetime import date
+from typing import Callable, List, Iterable, Optional
+from src.config import DEFAULT_SCHEMA
+from src.data.models import Room, Student, StudentBatch, StudentEvent
 from src.data.enums import Constants
 from ..connections import DatabaseConnection
 from ..repositories import MySQLRoomRepository, MySQLStudentRepository
+from ..history import AssignmentHistory
 
 
 class DatabaseManager:
-    """Manages database operations for the student room analysis."""
+    """Manages database operations for the student room analysis.
 
-    def __init__(self, connection: DatabaseConnection):
+    In bulk-load mode ``create_schema`` creates new tables without their
+    secondary indexes and foreign keys and switches off FK/unique checks for
+    the session; ``finish_bulk_load`` then builds the indexes (one ALTER TABLE
+    per table on MySQL), restores the checks and validates referential
+    integrity with a single anti-join.
+
+    With ``track_history`` every student insert or room assignment first
+    appends the room changes it makes to the assignment history, dated
+    ``history_date``. With ``name_fulltext`` the ngram FULLTEXT index on
+    student names is added with the schema, or after a bulk load.
+
+    Callbacks passed to ``add_event_listener`` receive a list of
+    StudentEvents for every inserted batch and room assignment run, once the
+    transaction that wrote them has committed.
+    """
+
+    def __init__(self, connection: DatabaseConnection, track_history: bool = False,
+                 history_date: Optional[date] = None, name_fulltext: bool = False):
         self.connection = connection
         self.room_repository = MySQLRoomRepository(connection)
         self.student_repository = MySQLStudentRepository(connection)
+        self.history = AssignmentHistory(connection, history_date) if track_history else None
+        self.name_fulltext = name_fulltext
+        self.deferred_statements = []
+        self.bulk_loading = False
+        self.event_listeners: List[Callable[[List[StudentEvent]], None]] = []
+        self.pending_events: Optional[List[List[StudentEvent]]] = None
 
-    def create_database(self):
-        """Create the database if it doesn't exist."""
+    def create_database(self, name: Optional[str] = None):
+        """Create the database if it doesn't exist (``name`` defaults to the schema's).
+
+        Backends without a database namespace (SQLite files) skip this step.
+        """
+        if not self.connection.dialect.has_databases:
+            return
+        import mysql.connector
         try:
             db_config = self.connection.config.copy()
             db_config.pop('database', None)
             temp_connection = mysql.connector.connect(**db_config)
             temp_cursor = temp_connection.cursor()
-            temp_cursor.execute(CREATE_DATABASE_SQL)
+            temp_cursor.execute(
+                f"CREATE DATABASE IF NOT EXISTS {name}" if name else DEFAULT_SCHEMA.create_database_sql
+            )
             temp_cursor.close()
             temp_connection.close()
         except mysql.connector.Error as e:
             print(f"Error creating database: {e}")
             raise
 
-    def create_schema(self):
-        """Create database tables."""
+    def create_schema(self, bulk_load: bool = False):
+        """Create database tables in the connection's dialect.
+
+        With ``bulk_load`` the index builds of tables created here are
+        deferred to ``finish_bulk_load``; tables that already exist keep
+        their indexes. Backends with transactional DDL create the schema in
+        one transaction.
+        """
+        dialect = self.connection.dialect
         try:
-            self.connection.execute(CREATE_ROOMS_TABLE_SQL)
-            self.connection.execute(CREATE_STUDENTS_TABLE_SQL)
+            if not bulk_load:
+                with self.connection.transaction() if dialect.transactional_ddl else nullcontext():
+                    if self.history:
+                        self.history.create_tables()
+                    for statement in dialect.schema_statements(DEFAULT_SCHEMA):
+                        self.connection.execute(statement)
+                    self.create_name_fulltext_index()
+                print(Constants.SUCCESS_SCHEMA_CREATED)
+                return
+            if self.history:
+                self.history.create_tables()
+            for create_table_sql in (DEFAULT_SCHEMA.create_rooms_table_sql,
+                                     DEFAULT_SCHEMA.create_students_table_sql):
+                if self.table_exists(dialect.table_name(create_table_sql)):
+                    continue
+                table_sql, index_statements = dialect.deferred_table(create_table_sql)
+                self.connection.execute(table_sql)
+                self.deferred_statements.extend(index_statements)
+            for statement in dialect.relax_constraints():
+                self.connection.execute(statement)
+            self.bulk_loading = True
             print(Constants.SUCCESS_SCHEMA_CREATED)
-        except mysql.connector.Error as e:
+            print(f"Bulk load: constraint checks off, {len(self.deferred_statements)} index build(s) deferred")
+        except Exception as e:
             print(f"Error creating schema: {e}")
             raise
 
+    def create_name_fulltext_index(self):
+        """Add the FULLTEXT name index when ``name_fulltext`` is set."""
+        if not self.name_fulltext:
+            return
+        if self.student_repository.create_name_fulltext_index():
+            print(f"Created FULLTEXT index {Constants.NAME_FULLTEXT_INDEX} on students.name")
+        elif not self.connection.dialect.has_fulltext:
+            print(f"FULLTEXT indexes are not supported by {self.connection.dialect.name}; "
+                  "name search falls back to prefix matching")
+
+    def table_exists(self, table: str) -> bool:
+        """Check whether a table exists in the current database."""
+        return self.connection.fetch_all(self.connection.dialect.table_exists_query(), (table,))[0][0] > 0
+
+    def finish_bulk_load(self):
+        """Build the deferred indexes, restore constraint checks and validate the load."""
+        if not self.bulk_loading:
+            return
+        try:
+            for statement in self.deferred_statements:
+                self.connection.execute(statement)
+            print(f"Built deferred indexes ({len(self.deferred_statements)} statement(s))")
+            self.create_name_fulltext_index()
+        except Exception as e:
+            print(f"Error building deferred indexes: {e}")
+            raise
+        finally:
+            for statement in self.connection.dialect.restore_constraints():
+                self.connection.execute(statement)
+            self.deferred_statements = []
+            self.bulk_loading = False
+
+        orphans = self.check_referential_integrity()
+        if orphans:
+            missing = ", ".join(f"{room_id} ({count} students)" for room_id, count in orphans)
+            print(f"Referential integrity check failed: missing rooms {missing}")
+            raise ValueError(f"Students reference {len(orphans)} missing room(s): {missing}")
+        print("✓ Referential integrity verified")
+
+    def check_referential_integrity(self) -> List[tuple]:
+        """Return (room_id, student_count) for every room_id with no matching room."""
+        query = """
+        SELECT s.room_id, COUNT(*) as student_count
+        FROM students s
+        LEFT JOIN rooms r ON r.id = s.room_id
+        WHERE s.room_id IS NOT NULL AND r.id IS NULL
+        GROUP BY s.room_id
+        ORDER BY s.room_id
+        """
+        return self.connection.fetch_all(query)
+
     def insert_rooms(self, rooms: List[Room]):
-        """Insert rooms into the database."""
+        """Insert rooms into the database in one transaction."""
         try:
-            self.room_repository.bulk_create(rooms)
+            with self.connection.transaction():
+                self.room_repository.bulk_create(rooms)
             print(f"Inserted {len(rooms)} rooms")
         except Exception as e:
             print(f"Error inserting rooms: {e}")
             raise
 
     def insert_students(self, students: List[Student]):
-        """Insert students into the database."""
+        """Insert students into the database in one transaction."""
         try:
-            self.student_repository.bulk_create(students)
+            with self.unit_of_work():
+                self.record_history((student.id, student.room_id) for student in students)
+                self.student_repository.bulk_create(students)
+                self.publish([StudentEvent.insert(student) for student in students])
             print(f"Inserted {len(students)} students")
             print(Constants.SUCCESS_DATA_INSERTED)
         except Exception as e:
             print(f"Error inserting students: {e}")
             raise
+
+    def insert_student_batches(self, batches: Iterable):
+        """Insert students batch by batch as the batches become available.
+
+        Batches may be lists of Student objects or columnar StudentBatch objects.
+        The whole load is one transaction: a failure part-way through rolls
+        back every batch.
+        """
+        total = 0
+        try:
+            with self.unit_of_work():
+                for batch in batches:
+                    if isinstance(batch, StudentBatch):
+                        self.record_history(zip(batch.ids, batch.nullable_room_ids()))
+                        self.student_repository.bulk_create_rows(batch.to_rows())
+                        self.publish(StudentEvent.inserts(batch))
+                    else:
+                        self.record_history((student.id, student.room_id) for student in batch)
+                        self.student_repository.bulk_create(batch)
+                        self.publish([StudentEvent.insert(student) for student in batch])
+                    total += len(batch)
+            print(f"Inserted {total} students")
+            print(Constants.SUCCESS_DATA_INSERTED)
+        except Exception as e:
+            print(f"Error inserting students after {total} rows, rolled back: {e}")
+            raise
+        return total
+
+    def apply_room_assignments(self, result):
+        """Move the students placed by a RoomAssignmentEngine run into their new rooms."""
+        try:
+            if len(result.placed):
+                with self.unit_of_work():
+                    self.record_history(zip(result.placed.ids, result.placed.room_ids))
+                    self.student_repository.bulk_update_rooms(result.to_update_rows())
+                    self.publish([StudentEvent.move(student_id, room_id)
+                                  for student_id, room_id in zip(result.placed.ids, result.placed.room_ids)])
+            print(f"Assigned {len(result.placed)} students, {len(result.unplaced)} left unplaced")
+        except Exception as e:
+            print(f"Error applying room assignments: {e}")
+            raise
+
+    def add_event_listener(self, listener: Callable[[List[StudentEvent]], None]):
+        """Call ``listener`` with the StudentEvents of every insert and assignment."""
+        self.event_listeners.append(listener)
+
+    @contextmanager
+    def unit_of_work(self):
+        """``connection.transaction()`` whose published events reach the listeners after the commit.
+
+        Events of a rolled-back transaction are dropped, so listeners never
+        see rows the database does not have.
+        """
+        self.pending_events = []
+        try:
+            with self.connection.transaction():
+                yield
+            pending = self.pending_events
+        finally:
+            self.pending_events = None
+        for events in pending:
+            self.publish(events)
+
+    def publish(self, events: List[StudentEvent]):
+        """Pass a batch of StudentEvents to every listener, or hold it until the commit."""
+        if not self.event_listeners:
+            return
+        if self.pending_events is not None:
+            self.pending_events.append(events)
+            return
+        for listener in self.event_listeners:
+            listener(events)
+
+    def record_history(self, assignments: Iterable):
+        """Append the room changes in (student_id, room_id) pairs to the history, if tracked."""
+        if self.history:
+            self.history.record(assignments)
+
+    def roll_up_occupancy(self) -> int:
+        """Refresh the daily occupancy rollups for the history date."""
+        if not self.history:
+            return 0
+        try:
+            rooms = self.history.roll_up()
+            print(f"Rolled up occupancy of {rooms} rooms for {self.history.day.isoformat()}")
+            return rooms
+        except Exception as e:
+            print(f"Error rolling up occupancy: {e}")
+            raise
@@ -0,0 +1,9 @@
+"""
+Dialects package for backend-specific SQL generation.
+"""
+
+from .sql_dialect import SQLDialect
+from .mysql_dialect import MySQLDialect
+from .sqlite_dialect import SQLiteDialect
+
+__all__ = ['SQLDialect', 'MySQLDialect', 'SQLiteDialect']
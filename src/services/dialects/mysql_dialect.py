@@ -0,0 +1,116 @@
+"""
+MySQL dialect: the native syntax of the application's queries.
+"""
+
+import json
+from typing import Any, Dict, List, Optional, Tuple
+from src.data.enums import Constants, TimePeriod
+from .sql_dialect import SQLDialect
+
+
+class MySQLDialect(SQLDialect):
+    """MySQL dialect (queries pass through unchanged)."""
+
+    name = 'mysql'
+    has_databases = True
+    has_fulltext = True
+    transactional_ddl = False
+    access_types = [
+        'system', 'const', 'eq_ref', 'ref', 'fulltext', 'ref_or_null', 'index_merge',
+        'unique_subquery', 'index_subquery', 'range', 'index', 'ALL'
+    ]
+
+    def translate(self, query: str) -> str:
+        return query
+
+    def deferred_table(self, create_table_sql: str) -> Tuple[str, List[str]]:
+        """Indexes and foreign keys are added back in a single ALTER TABLE."""
+        table = self.table_name(create_table_sql)
+        sql, indexes, foreign_keys = self.strip_clauses(create_table_sql, foreign_keys=True)
+        clauses = [f"ADD INDEX {name} ({columns})" for name, columns in indexes]
+        clauses += [f"ADD {constraint}" for constraint in foreign_keys]
+        if not clauses:
+            return sql, []
+        return sql, [f"ALTER TABLE {table} " + ", ".join(clauses)]
+
+    def relax_constraints(self) -> List[str]:
+        return ["SET SESSION foreign_key_checks = 0", "SET SESSION unique_checks = 0"]
+
+    def restore_constraints(self) -> List[str]:
+        return ["SET SESSION unique_checks = 1", "SET SESSION foreign_key_checks = 1"]
+
+    def table_exists_query(self) -> str:
+        return ("SELECT COUNT(*) FROM information_schema.tables "
+                "WHERE table_schema = DATABASE() AND table_name = %s")
+
+    def index_exists_query(self) -> str:
+        return ("SELECT COUNT(*) FROM information_schema.statistics "
+                "WHERE table_schema = DATABASE() AND table_name = %s AND index_name = %s")
+
+    def fulltext_index_statement(self, table: str, column: str, name: str) -> Optional[str]:
+        return f"ALTER TABLE {table} ADD FULLTEXT INDEX {name} ({column}) WITH PARSER ngram"
+
+    def fulltext_match(self, column: str) -> Optional[str]:
+        return f"MATCH({column}) AGAINST (%s IN NATURAL LANGUAGE MODE)"
+
+    def partition_bounds_query(self) -> Optional[str]:
+        return ("SELECT PARTITION_DESCRIPTION FROM information_schema.partitions "
+                "WHERE table_schema = DATABASE() AND table_name = %s AND PARTITION_DESCRIPTION <> 'MAXVALUE'")
+
+    def add_partition_statement(self, table: str, name: str, bound: str) -> Optional[str]:
+        future = Constants.FUTURE_PARTITION
+        return (f"ALTER TABLE {table} REORGANIZE PARTITION {future} INTO ("
+                f"PARTITION {name} VALUES LESS THAN ('{bound}'), "
+                f"PARTITION {future} VALUES LESS THAN (MAXVALUE))")
+
+    def period_start(self, column: str, period: TimePeriod) -> str:
+        if period is TimePeriod.WEEK:
+            return f"DATE_SUB({column}, INTERVAL WEEKDAY({column}) DAY)"
+        if period is TimePeriod.MONTH:
+            return f"DATE_SUB({column}, INTERVAL DAYOFMONTH({column}) - 1 DAY)"
+        return column
+
+    def analyze_statements(self) -> List[str]:
+        return ["ANALYZE TABLE rooms, students"]
+
+    def explain_query(self, query: str) -> str:
+        return f"EXPLAIN FORMAT=JSON {query}"
+
+    def normalize_plan(self, rows: List[tuple]) -> Dict[str, Any]:
+        """Collect every table access and the temp-table/filesort flags from the JSON tree."""
+        plan = {'tables': [], 'using_temporary': False, 'using_filesort': False}
+
+        def walk(node):
+            if isinstance(node, list):
+                for item in node:
+                    walk(item)
+                return
+            if not isinstance(node, dict):
+                return
+            if node.get('using_temporary_table'):
+                plan['using_temporary'] = True
+            if node.get('using_filesort'):
+                plan['using_filesort'] = True
+            table = node.get('table')
+            if isinstance(table, dict) and 'table_name' in table:
+                plan['tables'].append({
+                    'table': table['table_name'],
+                    'access_type': table.get('access_type'),
+                    'key': table.get('key'),
+                    'rows': table.get('rows_examined_per_scan'),
+                })
+            for key, value in node.items():
+                if key != 'table':
+                    walk(value)
+
+        walk(json.loads(rows[0][0]))
+        return plan
+
+    def avg(self, expression: str) -> str:
+        return f"AVG({expression})"
+
+    def round_decimal(self, expression: str, scale: int) -> str:
+        return f"ROUND({expression}, {scale})"
+
+    def divide(self, numerator: str, denominator: str) -> str:
+        return f"({numerator} / {denominator})"
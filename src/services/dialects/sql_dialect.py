@@ -0,0 +1,159 @@
+"""
+SQL Dialect abstract base class.
+
+Queries and DDL are written in MySQL syntax; a dialect rewrites the few
+constructs that differ between backends so every backend returns values that
+format identically in reports.
+"""
+
+import re
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Tuple
+from src.data.enums import TimePeriod
+
+TABLE_NAME = re.compile(r'CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?(\w+)', re.IGNORECASE)
+INLINE_INDEX = re.compile(r'^[ \t]*INDEX\s+(\w+)\s*\(([^)]*)\)[ \t]*,?[ \t]*\n?', re.IGNORECASE | re.MULTILINE)
+INLINE_FOREIGN_KEY = re.compile(
+    r'^[ \t]*(FOREIGN\s+KEY\s*\([^)]*\)\s*REFERENCES\s+\w+\s*\([^)]*\))[ \t]*,?[ \t]*\n?',
+    re.IGNORECASE | re.MULTILINE
+)
+TRAILING_COMMA = re.compile(r',(\s*\)\s*)$')
+
+
+class SQLDialect(ABC):
+    """Abstract base class for SQL dialects."""
+
+    name = ''
+    has_databases = True
+    has_fulltext = False
+    transactional_ddl = False
+    access_types: List[str] = []
+
+    @abstractmethod
+    def translate(self, query: str) -> str:
+        """Rewrite a MySQL-syntax statement for this backend."""
+        pass
+
+    def schema_statements(self, schema) -> List[str]:
+        """Return the DDL statements that create the DatabaseSchema tables."""
+        return [
+            statement
+            for sql in (schema.create_rooms_table_sql, schema.create_students_table_sql)
+            for statement in self.table_statements(sql)
+        ]
+
+    def table_statements(self, create_table_sql: str) -> List[str]:
+        """Return the DDL statements that create one table with its indexes."""
+        return [create_table_sql]
+
+    def partition_bounds_query(self) -> Optional[str]:
+        """Query listing a table's range partition bounds (one parameter: the
+        table name), or None when the backend does not partition."""
+        return None
+
+    def add_partition_statement(self, table: str, name: str, bound: str) -> Optional[str]:
+        """Statement that splits a partition for values below ``bound`` off the
+        catch-all partition, or None when the backend does not partition."""
+        return None
+
+    @abstractmethod
+    def period_start(self, column: str, period: TimePeriod) -> str:
+        """Expression for the first day of the day/week (Monday)/month of a DATE column."""
+        pass
+
+    @abstractmethod
+    def deferred_table(self, create_table_sql: str) -> Tuple[str, List[str]]:
+        """Split a CREATE TABLE into a bare table and the statements that add
+        its secondary indexes (and constraints, where supported) after a load."""
+        pass
+
+    @abstractmethod
+    def relax_constraints(self) -> List[str]:
+        """Session statements that switch off FK/unique checks for a bulk load."""
+        pass
+
+    @abstractmethod
+    def restore_constraints(self) -> List[str]:
+        """Session statements that switch the checks back on."""
+        pass
+
+    @abstractmethod
+    def table_exists_query(self) -> str:
+        """Query returning a count of tables named by its single parameter."""
+        pass
+
+    @abstractmethod
+    def index_exists_query(self) -> str:
+        """Query returning a count of indexes on the table named by its first
+        parameter with the name given by its second."""
+        pass
+
+    def fulltext_index_statement(self, table: str, column: str, name: str) -> Optional[str]:
+        """Statement that adds an ngram FULLTEXT index on a column, or None when
+        the backend has no FULLTEXT indexes."""
+        return None
+
+    def fulltext_match(self, column: str) -> Optional[str]:
+        """Relevance expression of a FULLTEXT match against one parameter, or
+        None when the backend has no FULLTEXT indexes."""
+        return None
+
+    @abstractmethod
+    def analyze_statements(self) -> List[str]:
+        """Statements that refresh optimizer statistics for both tables."""
+        pass
+
+    @abstractmethod
+    def explain_query(self, query: str) -> str:
+        """Wrap a query so it returns its execution plan."""
+        pass
+
+    @abstractmethod
+    def normalize_plan(self, rows: List[tuple]) -> Dict[str, Any]:
+        """Reduce the EXPLAIN output to a stable, comparable plan.
+
+        Returns ``{'tables': [{'table', 'access_type', 'key', 'rows'}, ...],
+        'using_temporary': bool, 'using_filesort': bool}``.
+        """
+        pass
+
+    def access_rank(self, access_type: str) -> int:
+        """Cost rank of an access type (higher is worse); unknown types rank worst."""
+        if access_type in self.access_types:
+            return self.access_types.index(access_type)
+        return len(self.access_types)
+
+    @abstractmethod
+    def avg(self, expression: str) -> str:
+        """AVG over an integer column, as a 4-decimal value like MySQL's."""
+        pass
+
+    @abstractmethod
+    def round_decimal(self, expression: str, scale: int) -> str:
+        """ROUND of a decimal value to a fixed scale."""
+        pass
+
+    @abstractmethod
+    def divide(self, numerator: str, denominator: str) -> str:
+        """Exact (non-integer) division as a 4-decimal value like MySQL's."""
+        pass
+
+    @staticmethod
+    def table_name(create_table_sql: str) -> str:
+        """Name of the table a CREATE TABLE statement creates."""
+        return TABLE_NAME.search(create_table_sql).group(1)
+
+    @staticmethod
+    def strip_clauses(create_table_sql: str, foreign_keys: bool = False):
+        """Remove inline INDEX (and optionally FOREIGN KEY) clauses.
+
+        Returns the bare statement, the (name, columns) index pairs and the
+        removed FOREIGN KEY clauses.
+        """
+        indexes = INLINE_INDEX.findall(create_table_sql)
+        sql = INLINE_INDEX.sub('', create_table_sql)
+        constraints = []
+        if foreign_keys:
+            constraints = INLINE_FOREIGN_KEY.findall(sql)
+            sql = INLINE_FOREIGN_KEY.sub('', sql)
+        return TRAILING_COMMA.sub(r'\1', sql.rstrip()), indexes, constraints
@@ -0,0 +1,159 @@
+"""
+SQLite dialect: translates MySQL syntax for the stdlib sqlite3 backend.
+
+- ``%s`` placeholders become ``?``
+- ``ON DUPLICATE KEY UPDATE c = VALUES(c)`` becomes
+  ``ON CONFLICT(id) DO UPDATE SET c = excluded.c``
+- inline ``INDEX name (cols)`` clauses become ``CREATE INDEX`` statements
+- case-insensitive MySQL collations (``COLLATE ..._ci``) become
+  ``COLLATE NOCASE``, so the name index also serves case-insensitive
+  ``LIKE 'prefix%'`` searches
+- ``PARTITION BY`` clauses are dropped; date-range reads rely on the
+  leading date column of an index instead of partition pruning
+- bulk loads switch off ``PRAGMA foreign_keys`` (unique checks cannot be relaxed)
+- decimal results are produced by the registered MYSQL_DECIMAL function as
+  fixed-scale strings, so reports print the same digits as MySQL's DECIMAL
+"""
+
+import re
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Any, Dict, List, Optional, Tuple
+from .sql_dialect import SQLDialect
+from src.data.enums import TimePeriod
+
+UPSERT = re.compile(r'ON\s+DUPLICATE\s+KEY\s+UPDATE', re.IGNORECASE)
+VALUES_REFERENCE = re.compile(r'VALUES\((\w+)\)', re.IGNORECASE)
+CASE_INSENSITIVE_COLLATION = re.compile(r'COLLATE\s+\w+_ci\b', re.IGNORECASE)
+PARTITION_CLAUSE = re.compile(r'\)\s*PARTITION\s+BY\b.*$', re.IGNORECASE | re.DOTALL)
+PLAN_ACCESS = re.compile(r'^(SCAN|SEARCH) (\w+)(?: AS \w+)?(?: USING (?:COVERING )?(?:INDEX (\w+)|(INTEGER PRIMARY KEY)))?')
+
+
+def mysql_decimal(value, scale: int) -> Optional[str]:
+    """Format a number with MySQL DECIMAL rounding (half up) at a fixed scale."""
+    if value is None:
+        return None
+    return str(Decimal(str(value)).quantize(Decimal(1).scaleb(-scale), rounding=ROUND_HALF_UP))
+
+
+class PopulationStdDev:
+    """STDDEV aggregate (population standard deviation, as in MySQL)."""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.squares = 0.0
+
+    def step(self, value):
+        if value is None:
+            return
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.squares += delta * (value - self.mean)
+
+    def finalize(self):
+        if not self.count:
+            return None
+        return (self.squares / self.count) ** 0.5
+
+
+class SQLiteDialect(SQLDialect):
+    """SQLite dialect."""
+
+    name = 'sqlite'
+    has_databases = False
+    transactional_ddl = True
+    access_types = ['SEARCH', 'SCAN INDEX', 'SCAN']
+
+    def translate(self, query: str) -> str:
+        query = query.replace('%s', '?')
+        match = UPSERT.search(query)
+        if match:
+            head, tail = query[:match.start()], query[match.end():]
+            tail = VALUES_REFERENCE.sub(r'excluded.\1', tail)
+            query = f"{head}ON CONFLICT(id) DO UPDATE SET{tail}"
+        return query
+
+    def table_statements(self, create_table_sql: str) -> List[str]:
+        table_sql, index_statements = self.deferred_table(PARTITION_CLAUSE.sub(')', create_table_sql))
+        return [table_sql] + index_statements
+
+    def deferred_table(self, create_table_sql: str) -> Tuple[str, List[str]]:
+        """Foreign keys stay inline (SQLite cannot add them later); indexes
+        become CREATE INDEX statements."""
+        table = self.table_name(create_table_sql)
+        sql, indexes, _ = self.strip_clauses(CASE_INSENSITIVE_COLLATION.sub('COLLATE NOCASE', create_table_sql))
+        return sql, [
+            f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns})"
+            for name, columns in indexes
+        ]
+
+    def relax_constraints(self) -> List[str]:
+        return ["PRAGMA foreign_keys = OFF"]
+
+    def restore_constraints(self) -> List[str]:
+        return ["PRAGMA foreign_keys = ON"]
+
+    def table_exists_query(self) -> str:
+        return "SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' AND name = %s"
+
+    def index_exists_query(self) -> str:
+        return "SELECT COUNT(*) FROM sqlite_master WHERE type = 'index' AND tbl_name = %s AND name = %s"
+
+    def analyze_statements(self) -> List[str]:
+        return ["ANALYZE"]
+
+    def explain_query(self, query: str) -> str:
+        return f"EXPLAIN QUERY PLAN {query}"
+
+    def normalize_plan(self, rows: List[tuple]) -> Dict[str, Any]:
+        """Map EXPLAIN QUERY PLAN detail lines onto the MySQL-style plan shape.
+
+        SEARCH is an index lookup, SCAN INDEX a covering-index scan and SCAN a
+        full table scan; temp B-trees for GROUP BY / ORDER BY stand in for
+        MySQL's temporary table and filesort. SQLite gives no row estimates.
+        """
+        plan = {'tables': [], 'using_temporary': False, 'using_filesort': False}
+        for row in rows:
+            detail = row[-1]
+            if detail.startswith('USE TEMP B-TREE FOR'):
+                if 'ORDER BY' in detail:
+                    plan['using_filesort'] = True
+                else:
+                    plan['using_temporary'] = True
+                continue
+            match = PLAN_ACCESS.match(detail)
+            if not match:
+                continue
+            operation, table, index, primary = match.groups()
+            access_type = operation
+            if operation == 'SCAN' and (index or primary):
+                access_type = 'SCAN INDEX'
+            plan['tables'].append({
+                'table': table,
+                'access_type': access_type,
+                'key': 'PRIMARY' if primary else index,
+                'rows': None,
+            })
+        return plan
+
+    def period_start(self, column: str, period: TimePeriod) -> str:
+        if period is TimePeriod.WEEK:
+            return f"date({column}, 'weekday 0', '-6 days')"
+        if period is TimePeriod.MONTH:
+            return f"date({column}, 'start of month')"
+        return column
+
+    def avg(self, expression: str) -> str:
+        return f"MYSQL_DECIMAL(AVG({expression}), 4)"
+
+    def round_decimal(self, expression: str, scale: int) -> str:
+        return f"MYSQL_DECIMAL({expression}, {scale})"
+
+    def divide(self, numerator: str, denominator: str) -> str:
+        return f"MYSQL_DECIMAL(CAST({numerator} AS REAL) / {denominator}, 4)"
+
+    def register_functions(self, connection):
+        """Register the functions and aggregates the translated SQL relies on."""
+        connection.create_function('MYSQL_DECIMAL', 2, mysql_decimal, deterministic=True)
+        connection.create_aggregate('STDDEV', 1, PopulationStdDev)
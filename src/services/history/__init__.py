@@ -0,0 +1,7 @@
+"""
+History package for room assignment history and occupancy rollups.
+"""
+
+from .assignment_history import AssignmentHistory
+
+__all__ = ['AssignmentHistory']
@@ -0,0 +1,147 @@
+"""
+Assignment History for Student Room Analysis.
+
+Keeps an append-only log of room changes and the daily occupancy rollups
+that occupancy-over-time queries read.
+"""
+
+from datetime import date, timedelta
+from typing import Iterable, List, Optional, Tuple
+from src.config import DEFAULT_SCHEMA
+from src.data.enums import Constants
+from ..connections import DatabaseConnection
+
+HISTORY_TABLE = 'room_assignment_history'
+ROOM_ROLLUP_TABLE = 'room_occupancy_daily'
+BUILDING_ROLLUP_TABLE = 'building_occupancy_daily'
+PARTITIONED_TABLES = (HISTORY_TABLE, ROOM_ROLLUP_TABLE)
+
+
+def month_start(day: date, months: int = 0) -> date:
+    """First day of the month ``months`` after the month of ``day``."""
+    index = day.year * 12 + day.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+class AssignmentHistory:
+    """Room-change history and daily occupancy rollups.
+
+    ``record`` compares incoming (student_id, room_id) pairs with the stored
+    placements before they are upserted and appends a history row for each
+    student that is new or moves. ``roll_up`` stores the end-of-day occupancy
+    of every room and building for ``day``, carrying the last rollup forward
+    over days without a load so every day in range has a row. On MySQL both
+    the history and the room rollup are range-partitioned by month, with
+    partitions added ahead of the dates being written.
+    """
+
+    def __init__(self, connection: DatabaseConnection, day: Optional[date] = None):
+        self.connection = connection
+        self.day = day or date.today()
+
+    def create_tables(self):
+        """Create the history and rollup tables."""
+        dialect = self.connection.dialect
+        for create_table_sql in (DEFAULT_SCHEMA.create_history_table_sql,
+                                 DEFAULT_SCHEMA.create_room_rollup_table_sql,
+                                 DEFAULT_SCHEMA.create_building_rollup_table_sql):
+            for statement in dialect.table_statements(create_table_sql):
+                self.connection.execute(statement)
+        self.ensure_partitions(self.day)
+
+    def ensure_partitions(self, day: date):
+        """Split monthly partitions off the catch-all partition through a few months past ``day``."""
+        dialect = self.connection.dialect
+        bounds_query = dialect.partition_bounds_query()
+        if bounds_query is None:
+            return
+        for table in PARTITIONED_TABLES:
+            bounds = [row[0].strip("'") for row in self.connection.fetch_all(bounds_query, (table,))]
+            latest = max(bounds, default='')
+            for months in range(Constants.HISTORY_PARTITION_MONTHS_AHEAD + 1):
+                start = month_start(day, months)
+                bound = month_start(start, 1).isoformat()
+                if bound > latest:
+                    self.connection.execute(
+                        dialect.add_partition_statement(table, f"p{start:%Y%m}", bound)
+                    )
+                    latest = bound
+
+    def record(self, assignments: Iterable[Tuple[int, int]]) -> int:
+        """Append a history row for every student whose room differs from the stored one.
+
+        Call before the assignments are written; returns the rows appended.
+        Unassigned students (room_id None) are skipped.
+        """
+        assignments = list(assignments)
+        changes = []
+        for start in range(0, len(assignments), Constants.DEFAULT_BATCH_SIZE):
+            chunk = assignments[start:start + Constants.DEFAULT_BATCH_SIZE]
+            current = self._current_rooms([student_id for student_id, _ in chunk])
+            for student_id, room_id in chunk:
+                previous = current.get(student_id)
+                if room_id is not None and previous != room_id:
+                    changes.append((self.day.isoformat(), student_id, room_id, previous))
+                    current[student_id] = room_id
+        if changes:
+            self.connection.execute_many(
+                f"INSERT INTO {HISTORY_TABLE} (changed_on, student_id, room_id, previous_room_id) "
+                "VALUES (%s, %s, %s, %s)",
+                changes
+            )
+        return len(changes)
+
+    def _current_rooms(self, student_ids: List[int]) -> dict:
+        """Stored room of each of the given students."""
+        placeholders = ', '.join(['%s'] * len(student_ids))
+        rows = self.connection.fetch_all(
+            f"SELECT id, room_id FROM students WHERE id IN ({placeholders})", tuple(student_ids)
+        )
+        return dict(rows)
+
+    def roll_up(self, day: Optional[date] = None) -> int:
+        """Store the occupancy of every room and building for ``day``; returns the room rows written."""
+        day = day or self.day
+        self.ensure_partitions(day)
+        with self.connection.transaction():
+            self._carry_forward(day)
+            for table in (ROOM_ROLLUP_TABLE, BUILDING_ROLLUP_TABLE):
+                self.connection.execute(f"DELETE FROM {table} WHERE day = %s", (day.isoformat(),))
+            self.connection.execute(f"""
+            INSERT INTO {ROOM_ROLLUP_TABLE} (day, room_id, building, capacity, occupied)
+            SELECT %s, r.id, r.building, r.capacity, COUNT(s.id)
+            FROM rooms r
+            LEFT JOIN students s ON r.id = s.room_id
+            GROUP BY r.id, r.building, r.capacity
+            """, (day.isoformat(),))
+            self.connection.execute(f"""
+            INSERT INTO {BUILDING_ROLLUP_TABLE} (day, building, rooms, capacity, occupied)
+            SELECT day, building, COUNT(*), SUM(capacity), SUM(occupied)
+            FROM {ROOM_ROLLUP_TABLE}
+            WHERE day = %s
+            GROUP BY day, building
+            """, (day.isoformat(),))
+        return self.connection.fetch_all(
+            f"SELECT COUNT(*) FROM {ROOM_ROLLUP_TABLE} WHERE day = %s", (day.isoformat(),)
+        )[0][0]
+
+    def _carry_forward(self, day: date):
+        """Copy the latest earlier rollup onto each day between it and ``day``."""
+        rows = self.connection.fetch_all(
+            f"SELECT MAX(day) FROM {BUILDING_ROLLUP_TABLE} WHERE day < %s", (day.isoformat(),)
+        )
+        if not rows or rows[0][0] is None:
+            return
+        last = rows[0][0]
+        last = date.fromisoformat(last) if isinstance(last, str) else last
+        gap = day - last
+        for offset in range(1, gap.days):
+            params = ((last + timedelta(days=offset)).isoformat(), last.isoformat())
+            self.connection.execute(f"""
+            INSERT INTO {ROOM_ROLLUP_TABLE} (day, room_id, building, capacity, occupied)
+            SELECT %s, room_id, building, capacity, occupied FROM {ROOM_ROLLUP_TABLE} WHERE day = %s
+            """, params)
+            self.connection.execute(f"""
+            INSERT INTO {BUILDING_ROLLUP_TABLE} (day, building, rooms, capacity, occupied)
+            SELECT %s, building, rooms, capacity, occupied FROM {BUILDING_ROLLUP_TABLE} WHERE day = %s
+            """, params)
@@ -0,0 +1,8 @@
+"""
+Pipeline package for staged workflow scheduling.
+"""
+
+from .pipeline_scheduler import PipelineStage, PipelineScheduler
+from .serialized_output import SerializedOutput
+
+__all__ = ['PipelineStage', 'PipelineScheduler', 'SerializedOutput']
@@ -0,0 +1,124 @@
+"""
+Pipeline Scheduler for overlapping independent workflow stages.
+
+Stages declare their dependencies explicitly; every stage whose dependencies
+have finished is started immediately on a worker thread, so CPU-bound work
+(file parsing) overlaps with I/O-bound work (database round-trips).
+"""
+
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from contextlib import redirect_stdout
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+from .serialized_output import SerializedOutput
+
+
+@dataclass
+class PipelineStage:
+    """A named unit of work with explicit dependencies."""
+    name: str
+    action: Callable[[], Any]
+    depends_on: List[str] = field(default_factory=list)
+
+
+class PipelineScheduler:
+    """Runs pipeline stages as soon as their dependencies complete.
+
+    ``cancelled`` is set as soon as a stage fails, so stages blocked on a
+    bounded hand-off (such as the student batch queue) can give up instead of
+    waiting for a consumer that will never run. Output printed while the
+    stages run is written line by line through SerializedOutput.
+    """
+
+    def __init__(self, stages: List[PipelineStage], profiler=None,
+                 cancelled: Optional[threading.Event] = None):
+        self.stages = {stage.name: stage for stage in stages}
+        self.profiler = profiler
+        self.cancelled = cancelled or threading.Event()
+        self.results: Dict[str, Any] = {}
+        self.timings: Dict[str, tuple] = {}
+        self._validate()
+
+    def _validate(self):
+        """Reject unknown dependencies and dependency cycles."""
+        for stage in self.stages.values():
+            for dependency in stage.depends_on:
+                if dependency not in self.stages:
+                    raise ValueError(f"Stage '{stage.name}' depends on unknown stage '{dependency}'")
+
+        visiting, visited = set(), set()
+
+        def visit(name: str):
+            if name in visited:
+                return
+            if name in visiting:
+                raise ValueError(f"Dependency cycle detected at stage '{name}'")
+            visiting.add(name)
+            for dependency in self.stages[name].depends_on:
+                visit(dependency)
+            visiting.discard(name)
+            visited.add(name)
+
+        for name in self.stages:
+            visit(name)
+
+    def _timed(self, stage: PipelineStage, origin: float) -> Any:
+        """Run a stage and record its start offset and duration."""
+        started = time.perf_counter()
+        try:
+            if self.profiler is None:
+                return stage.action()
+            with self.profiler.stage(stage.name):
+                return stage.action()
+        finally:
+            self.timings[stage.name] = (started - origin, time.perf_counter() - started)
+
+    def run(self) -> Dict[str, Any]:
+        """Run all stages and return their results keyed by stage name."""
+        output = SerializedOutput(sys.stdout)
+        try:
+            with redirect_stdout(output):
+                return self._run()
+        finally:
+            output.close()
+
+    def _run(self) -> Dict[str, Any]:
+        origin = time.perf_counter()
+        pending = dict(self.stages)
+        running = {}
+
+        with ThreadPoolExecutor(max_workers=len(self.stages) or 1) as executor:
+            while pending or running:
+                ready = [
+                    stage for stage in pending.values()
+                    if all(dependency in self.results for dependency in stage.depends_on)
+                ]
+                for stage in ready:
+                    del pending[stage.name]
+                    running[executor.submit(self._timed, stage, origin)] = stage.name
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    error = future.exception()
+                    if error is not None:
+                        self.cancelled.set()
+                        for other in running:
+                            other.cancel()
+                        raise error
+                    self.results[name] = future.result()
+
+        return self.results
+
+    def format_timings(self) -> str:
+        """Format per-stage timing as a table ordered by start time."""
+        header = f"{'Stage':<20} | {'Start (s)':>10} | {'Duration (s)':>12}"
+        separator = "-" * len(header)
+        rows = [
+            f"{name:<20} | {start:>10.3f} | {duration:>12.3f}"
+            for name, (start, duration) in sorted(self.timings.items(), key=lambda item: item[1][0])
+        ]
+        return f"\nPIPELINE STAGE TIMINGS\n{separator}\n{header}\n{separator}\n" + "\n".join(rows)
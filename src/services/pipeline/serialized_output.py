@@ -0,0 +1,47 @@
+"""
+Serialized Output for concurrent pipeline stages.
+
+Stages print status lines from worker threads. ``print`` writes the text and
+the newline separately, so lines from concurrent stages can run together.
+This writer buffers each thread's text until a newline and writes whole lines
+under a lock.
+"""
+
+import threading
+from typing import Dict, TextIO
+
+
+class SerializedOutput:
+    """A stdout stand-in that never interleaves partial lines from different threads."""
+
+    def __init__(self, target: TextIO):
+        self.target = target
+        self.lock = threading.Lock()
+        self.pending: Dict[int, str] = {}
+
+    def write(self, text: str) -> int:
+        thread = threading.get_ident()
+        buffered = self.pending.pop(thread, '') + text
+        lines, newline, rest = buffered.rpartition('\n')
+        if newline:
+            with self.lock:
+                self.target.write(lines + newline)
+        if rest:
+            self.pending[thread] = rest
+        return len(text)
+
+    def flush(self):
+        """Write the calling thread's partial line and flush the target."""
+        rest = self.pending.pop(threading.get_ident(), '')
+        with self.lock:
+            if rest:
+                self.target.write(rest)
+            self.target.flush()
+
+    def close(self):
+        """Write every thread's remaining partial line."""
+        with self.lock:
+            for rest in self.pending.values():
+                self.target.write(rest + '\n')
+            self.pending.clear()
+            self.target.flush()
@@ -2,7 +2,7 @@
 Query Service protocol for database operations.
 """
 
-from typing import List, Tuple
+from typing import List, Tuple, Optional
 from abc import ABC, abstractmethod
 
 
@@ -10,6 +10,6 @@ class QueryService(ABC):
     """Abstract base class for query services."""
     
     @abstractmethod
-    def execute_query(self, query: str, params: tuple = None) -> List[Tuple]:
+    def execute_query(self, query: str, params: tuple = None, timeout: Optional[float] = None) -> List[Tuple]:
         """Execute a query and return results."""
         pass
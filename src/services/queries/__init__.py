@@ -3,5 +3,6 @@ Queries package for database query services.
 """
 
 from .student_room_query_service import StudentRoomQueryService
+from .sharded_query_service import ShardedQueryService
 
-__all__ = ['StudentRoomQueryService']
+__all__ = ['StudentRoomQueryService', 'ShardedQueryService']
@@ -0,0 +1,108 @@
+"""
+Sharded Query Service for analyses spanning several databases.
+
+Each shard (for example one database per campus) holds a disjoint set of
+rooms together with their students. Every analysis is sent to all shards
+concurrently and the partial results are merged into the answer a single
+database holding all the data would return:
+
+- ordered room lists are k-way merged on the SQL sort key
+- top-K rankings are merged from each shard's own top K
+- building statistics are combined from count/sum/sum-of-squares/min/max
+"""
+
+import heapq
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Dict, List, Tuple
+from .student_room_query_service import StudentRoomQueryService
+from src.data.enums import Constants
+
+
+class ShardedQueryService:
+    """Fans StudentRoomQueryService analyses out to shards and merges the results."""
+
+    def __init__(self, services: Dict[str, StudentRoomQueryService]):
+        self.services = services
+        self.latencies: Dict[str, Dict[str, float]] = {name: {} for name in services}
+        self._executor = ThreadPoolExecutor(max_workers=len(services) or 1)
+
+    def _timed(self, shard: str, method: str, *args) -> List[Tuple]:
+        """Run one analysis on one shard and record its latency."""
+        started = time.perf_counter()
+        try:
+            return getattr(self.services[shard], method)(*args)
+        finally:
+            self.latencies[shard][method] = time.perf_counter() - started
+
+    def fan_out(self, method: str, *args) -> List[List[Tuple]]:
+        """Run an analysis on every shard concurrently; results follow shard order."""
+        futures = [
+            self._executor.submit(self._timed, shard, method, *args)
+            for shard in self.services
+        ]
+        return [future.result() for future in futures]
+
+    def get_rooms_with_student_count(self) -> List[Tuple]:
+        """Rooms and student counts, ordered by building and number."""
+        parts = self.fan_out('get_rooms_with_student_count')
+        return list(heapq.merge(*parts, key=lambda row: (row[2], row[1])))
+
+    def get_top_rooms_by_avg_age(self, limit: int = Constants.DEFAULT_QUERY_LIMIT) -> List[Tuple]:
+        """Global top rooms by smallest average age."""
+        parts = self.fan_out('get_top_rooms_by_avg_age', limit)
+        return list(islice(heapq.merge(*parts, key=lambda row: float(row[4])), limit))
+
+    def get_top_rooms_by_age_difference(self, limit: int = Constants.DEFAULT_QUERY_LIMIT) -> List[Tuple]:
+        """Global top rooms by largest age difference."""
+        parts = self.fan_out('get_top_rooms_by_age_difference', limit)
+        return list(islice(heapq.merge(*parts, key=lambda row: -row[4]), limit))
+
+    def get_rooms_with_mixed_sex(self) -> List[Tuple]:
+        """Mixed-sex rooms, ordered by building and number."""
+        parts = self.fan_out('get_rooms_with_mixed_sex')
+        return list(heapq.merge(*parts, key=lambda row: (row[2], row[1])))
+
+    def get_room_occupancy_analysis(self) -> List[Tuple]:
+        """Room occupancy, ordered by occupancy percentage, building and number."""
+        parts = self.fan_out('get_room_occupancy_analysis')
+        return list(heapq.merge(*parts, key=lambda row: (-float(row[6]), row[2], row[1])))
+
+    def get_age_distribution_by_building(self) -> List[Tuple]:
+        """Building age statistics combined from per-shard partial aggregates."""
+        totals: Dict[str, list] = {}
+        for part in self.fan_out('get_age_partials_by_building'):
+            for building, count, age_sum, age_sum_squares, min_age, max_age in part:
+                total = totals.setdefault(building, [0, 0, 0, min_age, max_age])
+                total[0] += count
+                total[1] += int(age_sum)
+                total[2] += int(age_sum_squares)
+                total[3] = min(total[3], min_age)
+                total[4] = max(total[4], max_age)
+
+        rows = []
+        for building in sorted(totals):
+            count, age_sum, age_sum_squares, min_age, max_age = totals[building]
+            mean = age_sum / count
+            variance = max(age_sum_squares / count - mean * mean, 0.0)
+            rows.append((building, count, round(mean, 2), min_age, max_age, round(math.sqrt(variance), 2)))
+        return rows
+
+    def get_shard_latencies(self) -> List[Tuple]:
+        """Per-shard (shard, queries, total ms, slowest analysis, slowest ms) rows."""
+        rows = []
+        for shard, timings in self.latencies.items():
+            if not timings:
+                continue
+            slowest = max(timings, key=timings.get)
+            rows.append((
+                shard, len(timings), round(sum(timings.values()) * 1000, 1),
+                slowest, round(timings[slowest] * 1000, 1)
+            ))
+        return rows
+
+    def close(self):
+        """Stop the fan-out worker threads."""
+        self._executor.shutdown(wait=True)
@@ -2,23 +2,121 @@
 Student Room Query Service for database analysis queries.
 """
 
-from typing import List, Tuple
+import copy
+from datetime import date
+from typing import Dict, List, Tuple, Optional, Union
 from ..protocols.query_service_protocol import QueryService
+from ..connections.columnar_result import ColumnarResult
 from ..connections.database_connection import DatabaseConnection
-from src.data.enums import QueryType, SortOrder, Constants, Gender
+from src.data.enums import ColumnType, QueryType, SortOrder, Constants, Gender, TimePeriod
+
+INT64, FLOAT64, STRING = ColumnType.INT64, ColumnType.FLOAT64, ColumnType.STRING
+
+# Row tuples, or {column: array} on a columnar() view
+QueryResult = Union[List[Tuple], ColumnarResult]
+
+ROOMS_WITH_STUDENT_COUNT_COLUMNS = {
+    'room_id': INT64, 'number': STRING, 'building': STRING, 'capacity': INT64, 'student_count': INT64
+}
+TOP_ROOMS_BY_AVG_AGE_COLUMNS = {
+    'room_id': INT64, 'number': STRING, 'building': STRING, 'student_count': INT64, 'avg_age': FLOAT64
+}
+TOP_ROOMS_BY_AGE_DIFFERENCE_COLUMNS = {
+    'room_id': INT64, 'number': STRING, 'building': STRING, 'student_count': INT64,
+    'age_difference': INT64, 'min_age': INT64, 'max_age': INT64
+}
+ROOMS_WITH_MIXED_SEX_COLUMNS = {
+    'room_id': INT64, 'number': STRING, 'building': STRING,
+    'male_count': INT64, 'female_count': INT64, 'total_students': INT64
+}
+TOP_ROOMS_BY_AVG_AGE_PER_BUILDING_COLUMNS = {**TOP_ROOMS_BY_AVG_AGE_COLUMNS, 'building_rank': INT64}
+TOP_ROOMS_BY_AGE_DIFFERENCE_PER_BUILDING_COLUMNS = {**TOP_ROOMS_BY_AGE_DIFFERENCE_COLUMNS, 'building_rank': INT64}
+ROOM_OCCUPANCY_COLUMNS = {
+    'room_id': INT64, 'number': STRING, 'building': STRING, 'capacity': INT64,
+    'occupied_spots': INT64, 'available_spots': INT64, 'occupancy_percentage': FLOAT64
+}
+AGE_DISTRIBUTION_BY_BUILDING_COLUMNS = {
+    'building': STRING, 'student_count': INT64, 'avg_age': FLOAT64,
+    'min_age': INT64, 'max_age': INT64, 'std_dev': FLOAT64
+}
+ROOM_AGE_AGGREGATE_COLUMNS = {
+    'room_id': INT64, 'student_count': INT64, 'age_sum': INT64, 'min_age': INT64, 'max_age': INT64
+}
+BUILDING_OCCUPANCY_OVER_TIME_COLUMNS = {
+    'period_start': STRING, 'building': STRING, 'days': INT64,
+    'avg_occupied': FLOAT64, 'capacity': INT64, 'occupancy_percentage': FLOAT64
+}
+ROOM_OCCUPANCY_OVER_TIME_COLUMNS = {
+    'period_start': STRING, 'room_id': INT64, 'building': STRING, 'days': INT64,
+    'avg_occupied': FLOAT64, 'capacity': INT64, 'occupancy_percentage': FLOAT64
+}
+AGE_PARTIALS_BY_BUILDING_COLUMNS = {
+    'building': STRING, 'student_count': INT64, 'age_sum': INT64, 'age_sum_squares': INT64,
+    'min_age': INT64, 'max_age': INT64
+}
 
 
 class StudentRoomQueryService(QueryService):
-    """Concrete implementation for student-room analysis queries."""
+    """Concrete implementation for student-room analysis queries.
+
+    Expressions whose result type differs between backends (averages, exact
+    division) come from the connection's dialect; ORDER BY uses the numeric
+    expression rather than the formatted alias.
 
-    def __init__(self, connection: DatabaseConnection):
+    ``columnar()`` returns a view whose analyses return ``{column: array}``
+    typed by the ``*_COLUMNS`` maps instead of lists of row tuples, hence
+    the ``QueryResult`` return type of every analysis.
+    """
+
+    def __init__(self, connection: DatabaseConnection, timeout: Optional[float] = None):
         self.connection = connection
+        self.dialect = connection.dialect
+        self.timeout = timeout
+        self.columnar_results = False
+
+    def columnar(self) -> 'StudentRoomQueryService':
+        """Return a view of this service whose analyses return typed columns."""
+        view = copy.copy(self)
+        view.columnar_results = True
+        return view
 
-    def execute_query(self, query: str, params: tuple = None) -> List[Tuple]:
-        """Execute a SQL query and return results."""
-        return self.connection.fetch_all(query, params)
+    def execute_query(self, query: str, params: tuple = None, timeout: Optional[float] = None) -> List[Tuple]:
+        """Execute a SQL query and return results.
 
-    def get_rooms_with_student_count(self) -> List[Tuple]:
+        ``timeout`` overrides the service-wide per-analysis deadline.
+        """
+        return self.connection.fetch_all(query, params, timeout=timeout if timeout is not None else self.timeout)
+
+    def execute_columnar(self, query: str, dtypes: Dict[str, ColumnType], params: tuple = None,
+                         timeout: Optional[float] = None) -> ColumnarResult:
+        """Execute a SQL query and return one typed array per column (see DatabaseConnection.fetch_columnar)."""
+        return self.connection.fetch_columnar(
+            query, dtypes, params, timeout=timeout if timeout is not None else self.timeout
+        )
+
+    def _run(self, query: str, dtypes: Dict[str, ColumnType], params: tuple = None) -> QueryResult:
+        """Run an analysis query as rows, or as typed columns on a columnar() view."""
+        if self.columnar_results:
+            return self.execute_columnar(query, dtypes, params)
+        return self.execute_query(query, params)
+
+    @staticmethod
+    def _day_filter(column: str, start: Optional[date], end: Optional[date], *equals) -> Tuple[str, tuple]:
+        """WHERE clause keeping ``column`` within [start, end] and each (expression, value) pair that is set."""
+        conditions, params = [], []
+        if start is not None:
+            conditions.append(f"{column} >= %s")
+            params.append(str(start))
+        if end is not None:
+            conditions.append(f"{column} <= %s")
+            params.append(str(end))
+        for expression, value in equals:
+            if value is not None:
+                conditions.append(f"{expression} = %s")
+                params.append(value)
+        return ("WHERE " + " AND ".join(conditions) if conditions else ""), tuple(params)
+
+    def get_rooms_with_student_count(self) -> QueryResult:
         """Get list of rooms and the number of students in each."""
         query = f"""
         {QueryType.SELECT.value}
@@ -32,9 +130,9 @@ class StudentRoomQueryService(QueryService):
         GROUP BY r.id, r.number, r.building, r.capacity
         ORDER BY r.building, r.number
         """
-        return self.execute_query(query)
+        return self._run(query, ROOMS_WITH_STUDENT_COUNT_COLUMNS)
 
-    def get_top_rooms_by_avg_age(self, limit: int = Constants.DEFAULT_QUERY_LIMIT) -> List[Tuple]:
+    def get_top_rooms_by_avg_age(self, limit: int = Constants.DEFAULT_QUERY_LIMIT) -> QueryResult:
         """Get top rooms with smallest average student age."""
         query = f"""
         {QueryType.SELECT.value}
@@ -42,17 +140,17 @@ class StudentRoomQueryService(QueryService):
             r.number,
             r.building,
             COUNT(s.id) as student_count,
-            AVG(s.age) as avg_age
+            {self.dialect.avg('s.age')} as avg_age
         FROM rooms r
         LEFT JOIN students s ON r.id = s.room_id
         GROUP BY r.id, r.number, r.building
         HAVING COUNT(s.id) > 0
-        ORDER BY avg_age {SortOrder.ASC.value}
+        ORDER BY AVG(s.age) {SortOrder.ASC.value}
         LIMIT {limit}
         """
-        return self.execute_query(query)
+        return self._run(query, TOP_ROOMS_BY_AVG_AGE_COLUMNS)
 
-    def get_top_rooms_by_age_difference(self, limit: int = Constants.DEFAULT_QUERY_LIMIT) -> List[Tuple]:
+    def get_top_rooms_by_age_difference(self, limit: int = Constants.DEFAULT_QUERY_LIMIT) -> QueryResult:
         """Get top rooms with largest age difference among students."""
         query = f"""
         {QueryType.SELECT.value}
@@ -70,9 +168,67 @@ class StudentRoomQueryService(QueryService):
         ORDER BY age_difference {SortOrder.DESC.value}
         LIMIT {limit}
         """
-        return self.execute_query(query)
+        return self._run(query, TOP_ROOMS_BY_AGE_DIFFERENCE_COLUMNS)
+
+    def get_top_rooms_by_avg_age_per_building(self, limit: int = Constants.DEFAULT_QUERY_LIMIT) -> QueryResult:
+        """Get each building's top rooms with smallest average student age, in one windowed query.
 
-    def get_rooms_with_mixed_sex(self) -> List[Tuple]:
+        Ties are broken by room ID; rows come ordered by building, then rank.
+        """
+        query = f"""
+        {QueryType.SELECT.value} id, number, building, student_count, avg_age, building_rank
+        FROM (
+            {QueryType.SELECT.value}
+                r.id,
+                r.number,
+                r.building,
+                COUNT(s.id) as student_count,
+                {self.dialect.avg('s.age')} as avg_age,
+                ROW_NUMBER() OVER (
+                    PARTITION BY r.building
+                    ORDER BY AVG(s.age) {SortOrder.ASC.value}, r.id {SortOrder.ASC.value}
+                ) as building_rank
+            FROM rooms r
+            LEFT JOIN students s ON r.id = s.room_id
+            GROUP BY r.id, r.number, r.building
+            HAVING COUNT(s.id) > 0
+        ) ranked
+        WHERE building_rank <= %s
+        ORDER BY building, building_rank
+        """
+        return self._run(query, TOP_ROOMS_BY_AVG_AGE_PER_BUILDING_COLUMNS, (limit,))
+
+    def get_top_rooms_by_age_difference_per_building(self, limit: int = Constants.DEFAULT_QUERY_LIMIT) -> QueryResult:
+        """Get each building's top rooms with largest age difference, in one windowed query.
+
+        Ties are broken by room ID; rows come ordered by building, then rank.
+        """
+        query = f"""
+        {QueryType.SELECT.value} id, number, building, student_count, age_difference, min_age, max_age, building_rank
+        FROM (
+            {QueryType.SELECT.value}
+                r.id,
+                r.number,
+                r.building,
+                COUNT(s.id) as student_count,
+                MAX(s.age) - MIN(s.age) as age_difference,
+                MIN(s.age) as min_age,
+                MAX(s.age) as max_age,
+                ROW_NUMBER() OVER (
+                    PARTITION BY r.building
+                    ORDER BY MAX(s.age) - MIN(s.age) {SortOrder.DESC.value}, r.id {SortOrder.ASC.value}
+                ) as building_rank
+            FROM rooms r
+            LEFT JOIN students s ON r.id = s.room_id
+            GROUP BY r.id, r.number, r.building
+            HAVING COUNT(s.id) > 1
+        ) ranked
+        WHERE building_rank <= %s
+        ORDER BY building, building_rank
+        """
+        return self._run(query, TOP_ROOMS_BY_AGE_DIFFERENCE_PER_BUILDING_COLUMNS, (limit,))
+
+    def get_rooms_with_mixed_sex(self) -> QueryResult:
         """Get list of rooms where students of different sexes live together."""
         query = f"""
         {QueryType.SELECT.value}
@@ -90,9 +246,9 @@ class StudentRoomQueryService(QueryService):
             AND COUNT(CASE WHEN s.sex = '{Gender.FEMALE.value}' THEN 1 END) > 0
         ORDER BY r.building, r.number
         """
-        return self.execute_query(query)
+        return self._run(query, ROOMS_WITH_MIXED_SEX_COLUMNS)
 
-    def get_room_occupancy_analysis(self) -> List[Tuple]:
+    def get_room_occupancy_analysis(self) -> QueryResult:
         """Get room occupancy analysis with capacity and availability."""
         query = f"""
         {QueryType.SELECT.value}
@@ -102,21 +258,21 @@ class StudentRoomQueryService(QueryService):
             r.capacity,
             COUNT(s.id) as occupied_spots,
             r.capacity - COUNT(s.id) as available_spots,
-            ROUND((COUNT(s.id) / r.capacity) * 100, 2) as occupancy_percentage
+            {self.dialect.round_decimal(self.dialect.divide('COUNT(s.id)', 'r.capacity') + ' * 100', 2)} as occupancy_percentage
         FROM rooms r
         LEFT JOIN students s ON r.id = s.room_id
         GROUP BY r.id, r.number, r.building, r.capacity
-        ORDER BY occupancy_percentage {SortOrder.DESC.value}, r.building, r.number
+        ORDER BY COUNT(s.id) * 1.0 / r.capacity {SortOrder.DESC.value}, r.building, r.number
         """
-        return self.execute_query(query)
+        return self._run(query, ROOM_OCCUPANCY_COLUMNS)
 
-    def get_age_distribution_by_building(self) -> List[Tuple]:
+    def get_age_distribution_by_building(self) -> QueryResult:
         """Get age distribution statistics by building."""
         query = f"""
         {QueryType.SELECT.value}
             r.building,
             COUNT(s.id) as student_count,
-            ROUND(AVG(s.age), 2) as avg_age,
+            {self.dialect.round_decimal(self.dialect.avg('s.age'), 2)} as avg_age,
             MIN(s.age) as min_age,
             MAX(s.age) as max_age,
             ROUND(STDDEV(s.age), 2) as std_dev
@@ -126,4 +282,80 @@ class StudentRoomQueryService(QueryService):
         HAVING COUNT(s.id) > 0
         ORDER BY r.building
         """
-        return self.execute_query(query)
+        return self._run(query, AGE_DISTRIBUTION_BY_BUILDING_COLUMNS)
+
+    def get_room_age_aggregates(self) -> QueryResult:
+        """Get per-room student count, age sum, min and max for occupied rooms."""
+        query = f"""
+        {QueryType.SELECT.value}
+            s.room_id,
+            COUNT(s.id) as student_count,
+            SUM(s.age) as age_sum,
+            MIN(s.age) as min_age,
+            MAX(s.age) as max_age
+        FROM students s
+        WHERE s.room_id IS NOT NULL
+        GROUP BY s.room_id
+        """
+        return self._run(query, ROOM_AGE_AGGREGATE_COLUMNS)
+
+    def get_age_partials_by_building(self) -> QueryResult:
+        """Get mergeable per-building age aggregates (count, sum, sum of squares, min, max)."""
+        query = f"""
+        {QueryType.SELECT.value}
+            r.building,
+            COUNT(s.id) as student_count,
+            SUM(s.age) as age_sum,
+            SUM(s.age * s.age) as age_sum_squares,
+            MIN(s.age) as min_age,
+            MAX(s.age) as max_age
+        FROM rooms r
+        LEFT JOIN students s ON r.id = s.room_id
+        GROUP BY r.building
+        HAVING COUNT(s.id) > 0
+        ORDER BY r.building
+        """
+        return self._run(query, AGE_PARTIALS_BY_BUILDING_COLUMNS)
+
+    def get_building_occupancy_over_time(self, start: Optional[date] = None, end: Optional[date] = None,
+                                         period: TimePeriod = TimePeriod.WEEK,
+                                         building: Optional[str] = None) -> QueryResult:
+        """Get average daily occupancy per building and period from the daily rollups."""
+        bucket = self.dialect.period_start('b.day', period)
+        where, params = self._day_filter('b.day', start, end, ('b.building', building))
+        query = f"""
+        {QueryType.SELECT.value}
+            {bucket} as period_start,
+            b.building,
+            COUNT(*) as days,
+            {self.dialect.avg('b.occupied')} as avg_occupied,
+            MAX(b.capacity) as capacity,
+            {self.dialect.round_decimal(self.dialect.divide('SUM(b.occupied)', 'SUM(b.capacity)') + ' * 100', 2)} as occupancy_percentage
+        FROM building_occupancy_daily b
+        {where}
+        GROUP BY {bucket}, b.building
+        ORDER BY {bucket}, b.building
+        """
+        return self._run(query, BUILDING_OCCUPANCY_OVER_TIME_COLUMNS, params)
+
+    def get_room_occupancy_over_time(self, room_id: Optional[int] = None, start: Optional[date] = None,
+                                     end: Optional[date] = None,
+                                     period: TimePeriod = TimePeriod.WEEK) -> QueryResult:
+        """Get average daily occupancy per room and period from the daily rollups."""
+        bucket = self.dialect.period_start('o.day', period)
+        where, params = self._day_filter('o.day', start, end, ('o.room_id', room_id))
+        query = f"""
+        {QueryType.SELECT.value}
+            {bucket} as period_start,
+            o.room_id,
+            o.building,
+            COUNT(*) as days,
+            {self.dialect.avg('o.occupied')} as avg_occupied,
+            MAX(o.capacity) as capacity,
+            {self.dialect.round_decimal(self.dialect.divide('SUM(o.occupied)', 'SUM(o.capacity)') + ' * 100', 2)} as occupancy_percentage
+        FROM room_occupancy_daily o
+        {where}
+        GROUP BY {bucket}, o.room_id, o.building
+        ORDER BY {bucket}, o.room_id
+        """
+        return self._run(query, ROOM_OCCUPANCY_OVER_TIME_COLUMNS, params)
@@ -0,0 +1,8 @@
+"""
+Rankings package for incrementally maintained room rankings.
+"""
+
+from .age_ranking_index import AgeRankingIndex
+from .group_top_n import top_n_per_group
+
+__all__ = ['AgeRankingIndex', 'top_n_per_group']
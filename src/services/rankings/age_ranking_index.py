@@ -0,0 +1,254 @@
+"""
+Age Ranking Index for streaming top-K room rankings.
+
+Keeps running per-room age aggregates updated from student insert/move/remove
+events and two lazily invalidated heaps, so the rankings produced by
+StudentRoomQueryService.get_top_rooms_by_avg_age and
+get_top_rooms_by_age_difference can be answered for any K in O(K log n)
+without querying the database. The per-building variants partially sort
+each building's rooms with top_n_per_group.
+"""
+
+import heapq
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+from src.data.models import Room, Student, StudentEvent
+from src.data.enums import Constants, StudentEventType
+from .group_top_n import top_n_per_group
+
+
+@dataclass
+class _RoomAggregate:
+    """Running age aggregate for one room."""
+    count: int = 0
+    age_sum: int = 0
+    ages: Counter = field(default_factory=Counter)
+
+    def add(self, age: int):
+        self.count += 1
+        self.age_sum += age
+        self.ages[age] += 1
+
+    def discard(self, age: int):
+        self.count -= 1
+        self.age_sum -= age
+        self.ages[age] -= 1
+        if not self.ages[age]:
+            del self.ages[age]
+
+    @property
+    def avg_age(self) -> float:
+        return self.age_sum / self.count
+
+    @property
+    def min_age(self) -> int:
+        return min(self.ages)
+
+    @property
+    def max_age(self) -> int:
+        return max(self.ages)
+
+
+class AgeRankingIndex:
+    """Incrementally maintained age-based room rankings.
+
+    ``query_service`` is needed by ``reconcile`` and ``student_repository``
+    by ``rebuild``.
+    """
+
+    def __init__(self, rooms: List[Room], students: Iterable[Student] = (),
+                 query_service=None, reconcile_every: int = 0, student_repository=None):
+        self.rooms: Dict[int, Room] = {room.id: room for room in rooms}
+        self.query_service = query_service
+        self.student_repository = student_repository
+        self.reconcile_every = reconcile_every
+        self.batches_applied = 0
+        self._reset()
+        self.apply(StudentEvent.insert(student) for student in students)
+
+    def _reset(self):
+        """Drop all aggregates and heap entries."""
+        self.students: Dict[int, Tuple[int, int]] = {}
+        self.aggregates: Dict[int, _RoomAggregate] = {}
+        self.versions: Dict[int, int] = {}
+        self.avg_heap: List[tuple] = []
+        self.diff_heap: List[tuple] = []
+
+    def _place(self, student_id: int, room_id: Optional[int], age: int):
+        self.students[student_id] = (room_id, age)
+        if room_id is not None:
+            self.aggregates.setdefault(room_id, _RoomAggregate()).add(age)
+
+    def _unplace(self, student_id: int) -> Optional[int]:
+        placement = self.students.pop(student_id, None)
+        if placement is None:
+            return None
+        room_id, age = placement
+        if room_id is not None:
+            self.aggregates[room_id].discard(age)
+        return room_id
+
+    def apply(self, events: Iterable[StudentEvent]):
+        """Apply a batch of events, then refresh each touched room once."""
+        touched = set()
+        for event in events:
+            if event.type is StudentEventType.INSERT:
+                touched.add(self._unplace(event.student_id))
+                self._place(event.student_id, event.room_id, event.age)
+                touched.add(event.room_id)
+            elif event.type is StudentEventType.MOVE:
+                placement = self.students.get(event.student_id)
+                if placement is None:
+                    raise KeyError(f"Cannot move unknown student {event.student_id}")
+                touched.add(self._unplace(event.student_id))
+                self._place(event.student_id, event.room_id, placement[1])
+                touched.add(event.room_id)
+            else:
+                touched.add(self._unplace(event.student_id))
+
+        touched.discard(None)
+        for room_id in touched:
+            self._refresh(room_id)
+        self._compact()
+
+        self.batches_applied += 1
+        if self.query_service and self.reconcile_every and self.batches_applied % self.reconcile_every == 0:
+            self.reconcile(repair=self.student_repository is not None)
+
+    def _refresh(self, room_id: int):
+        """Invalidate a room's heap entries and push its current keys."""
+        version = self.versions.get(room_id, 0) + 1
+        self.versions[room_id] = version
+        aggregate = self.aggregates.get(room_id)
+        if room_id not in self.rooms or aggregate is None or aggregate.count == 0:
+            return
+        heapq.heappush(self.avg_heap, (aggregate.avg_age, room_id, version))
+        if aggregate.count > 1:
+            difference = aggregate.max_age - aggregate.min_age
+            heapq.heappush(self.diff_heap, (-difference, room_id, version))
+
+    def _compact(self):
+        """Rebuild a heap once stale entries outnumber live ones."""
+        live = len(self.versions)
+        for heap in (self.avg_heap, self.diff_heap):
+            if len(heap) > 2 * live + 64:
+                heap[:] = [entry for entry in heap if self.versions[entry[1]] == entry[2]]
+                heapq.heapify(heap)
+
+    def _top(self, heap: List[tuple], limit: int) -> List[tuple]:
+        """Pop the first `limit` live entries, then push them back."""
+        live = []
+        while heap and len(live) < limit:
+            entry = heapq.heappop(heap)
+            if self.versions[entry[1]] == entry[2]:
+                live.append(entry)
+        for entry in live:
+            heapq.heappush(heap, entry)
+        return live
+
+    def get_top_rooms_by_avg_age(self, limit: int = Constants.DEFAULT_QUERY_LIMIT) -> List[Tuple]:
+        """Rooms with the smallest average age, shaped like the SQL result."""
+        rows = []
+        for avg_age, room_id, _ in self._top(self.avg_heap, limit):
+            room = self.rooms[room_id]
+            rows.append((room.id, room.number, room.building, self.aggregates[room_id].count, avg_age))
+        return rows
+
+    def get_top_rooms_by_age_difference(self, limit: int = Constants.DEFAULT_QUERY_LIMIT) -> List[Tuple]:
+        """Rooms with the largest age difference, shaped like the SQL result."""
+        rows = []
+        for negative_difference, room_id, _ in self._top(self.diff_heap, limit):
+            room = self.rooms[room_id]
+            aggregate = self.aggregates[room_id]
+            rows.append((
+                room.id, room.number, room.building, aggregate.count,
+                -negative_difference, aggregate.min_age, aggregate.max_age
+            ))
+        return rows
+
+    def get_top_rooms_by_avg_age_per_building(self, limit: int = Constants.DEFAULT_QUERY_LIMIT) -> List[Tuple]:
+        """Each building's rooms with the smallest average age (ties by room ID), shaped like the SQL result."""
+        room_ids = [room_id for room_id, aggregate in self.aggregates.items()
+                    if aggregate.count and room_id in self.rooms]
+        return self._per_building(
+            room_ids, [self.aggregates[room_id].avg_age for room_id in room_ids], limit,
+            lambda room, aggregate: (aggregate.count, aggregate.avg_age)
+        )
+
+    def get_top_rooms_by_age_difference_per_building(self, limit: int = Constants.DEFAULT_QUERY_LIMIT) -> List[Tuple]:
+        """Each building's rooms with the largest age difference (ties by room ID), shaped like the SQL result."""
+        room_ids = [room_id for room_id, aggregate in self.aggregates.items()
+                    if aggregate.count > 1 and room_id in self.rooms]
+        return self._per_building(
+            room_ids,
+            [self.aggregates[room_id].min_age - self.aggregates[room_id].max_age for room_id in room_ids],
+            limit,
+            lambda room, aggregate: (aggregate.count, aggregate.max_age - aggregate.min_age,
+                                     aggregate.min_age, aggregate.max_age)
+        )
+
+    def _per_building(self, room_ids: List[int], keys: List[float], limit: int, values) -> List[Tuple]:
+        """Rank rooms within their building by key and room ID; append the 1-based rank."""
+        buildings = [self.rooms[room_id].building for room_id in room_ids]
+        rows = []
+        rank, previous = 0, None
+        for position in top_n_per_group(buildings, keys, room_ids, limit):
+            room = self.rooms[room_ids[position]]
+            rank = rank + 1 if room.building == previous else 1
+            previous = room.building
+            rows.append((room.id, room.number, room.building,
+                         *values(room, self.aggregates[room.id]), rank))
+        return rows
+
+    def reconcile(self, limit: int = Constants.DEFAULT_QUERY_LIMIT, repair: bool = False) -> Dict[str, object]:
+        """Compare aggregates and rankings against the SQL results.
+
+        Global rankings are compared on their sort keys, so rooms that tie may
+        be returned in a different order; per-building rankings break ties by
+        room ID and are compared room by room. With ``repair`` the index is rebuilt
+        from the students table when anything disagrees.
+        """
+        expected = {
+            row[0]: (row[1], int(row[2]), row[3], row[4])
+            for row in self.query_service.get_room_age_aggregates()
+        }
+        actual = {
+            room_id: (aggregate.count, aggregate.age_sum, aggregate.min_age, aggregate.max_age)
+            for room_id, aggregate in self.aggregates.items() if aggregate.count
+        }
+        mismatched = sorted(
+            room_id for room_id in expected.keys() | actual.keys()
+            if expected.get(room_id) != actual.get(room_id)
+        )
+
+        sql_avg = [round(float(row[4]), 4) for row in self.query_service.get_top_rooms_by_avg_age(limit)]
+        own_avg = [round(row[4], 4) for row in self.get_top_rooms_by_avg_age(limit)]
+        sql_diff = [row[4] for row in self.query_service.get_top_rooms_by_age_difference(limit)]
+        own_diff = [row[4] for row in self.get_top_rooms_by_age_difference(limit)]
+        sql_building = [row[0] for row in self.query_service.get_top_rooms_by_avg_age_per_building(limit)]
+        own_building = [row[0] for row in self.get_top_rooms_by_avg_age_per_building(limit)]
+
+        report = {
+            'rooms_checked': len(expected),
+            'mismatched_rooms': mismatched,
+            'avg_age_ranking_ok': sql_avg == own_avg,
+            'age_difference_ranking_ok': sql_diff == own_diff,
+            'building_ranking_ok': sql_building == own_building,
+        }
+        consistent = not mismatched and all(value for key, value in report.items() if key.endswith('_ok'))
+        report['consistent'] = consistent
+        if not consistent:
+            print(f"Ranking index drifted from database: {len(mismatched)} rooms differ")
+            if repair:
+                self.rebuild()
+        return report
+
+    def rebuild(self):
+        """Reload every student placement from the database."""
+        rows = self.student_repository.get_placements()
+        self._reset()
+        for student_id, room_id, age in rows:
+            self._place(student_id, room_id, age)
+        for room_id in list(self.aggregates):
+            self._refresh(room_id)
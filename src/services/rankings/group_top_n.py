@@ -0,0 +1,45 @@
+"""
+Per-group top-N selection by partial sort.
+
+The in-memory counterpart of ``ROW_NUMBER() OVER (PARTITION BY ...)`` with a
+``row_number <= N`` filter: within each group only the N best rows are
+ordered, not the whole group.
+"""
+
+import heapq
+from itertools import groupby
+from typing import List, Sequence
+from src.services.connections.columnar_result import numpy_module
+
+
+def top_n_per_group(groups: Sequence, keys: Sequence, ties: Sequence, limit: int) -> List[int]:
+    """Return the positions of the ``limit`` smallest (key, tie) pairs of each group.
+
+    Positions are ordered by group, then key, then tie, like the windowed SQL
+    result ordered by (group, rank). Negate ``keys`` for a descending ranking.
+    Uses ``numpy.partition`` per group when NumPy is installed and
+    ``heapq.nsmallest`` otherwise.
+    """
+    if limit <= 0 or not len(groups):
+        return []
+    numpy = numpy_module()
+    if numpy is None:
+        positions = sorted(range(len(groups)), key=lambda position: groups[position])
+        selected = []
+        for _, members in groupby(positions, key=lambda position: groups[position]):
+            selected.extend(heapq.nsmallest(limit, members, key=lambda position: (keys[position], ties[position])))
+        return selected
+
+    groups = numpy.asarray(groups)
+    keys = numpy.asarray(keys, dtype='float64')
+    ties = numpy.asarray(ties)
+    selected = []
+    for group in sorted(set(groups.tolist())):
+        members = numpy.flatnonzero(groups == group)
+        if len(members) > limit:
+            # Every row tied with the limit-th key stays a candidate for the tie-break
+            kth = numpy.partition(keys[members], limit - 1)[limit - 1]
+            members = members[keys[members] <= kth]
+        order = numpy.lexsort((ties[members], keys[members]))[:limit]
+        selected.extend(members[order].tolist())
+    return selected
@@ -1,7 +1,14 @@
 """
 Reports package for formatted output services.
-"""
 
-from .console_report_generator import ConsoleReportGenerator
+Report backends are imported on first attribute access.
+"""
 
 __all__ = ['ConsoleReportGenerator']
+
+
+def __getattr__(name):
+    if name == 'ConsoleReportGenerator':
+        from .console_report_generator import ConsoleReportGenerator
+        return ConsoleReportGenerator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
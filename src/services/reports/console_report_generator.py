@@ -2,7 +2,7 @@
 Console report generator implementation for formatted output.
 """
 
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 from ..protocols.report_generator_protocol import ReportGenerator
 
 
@@ -69,6 +69,26 @@ class ConsoleReportGenerator(ReportGenerator):
         headers = ["Building", "Students", "Avg Age", "Min Age", "Max Age", "Std Dev"]
         return self._format_table(data, headers, "AGE DISTRIBUTION BY BUILDING")
 
+    def format_age_percentiles_by_building(self, data: List[Tuple],
+                                           error_bounds: Optional[Dict[str, str]] = None) -> str:
+        """Format approximate age percentiles by building data, followed by the error bounds."""
+        headers = ["Building", "Students", "Avg Age", "Min Age", "Max Age", "Std Dev",
+                   "P50", "P90", "P99", "~Rooms"]
+        table = self._format_table(data, headers, "AGE PERCENTILES BY BUILDING (APPROXIMATE)")
+        if data and error_bounds:
+            table += "\n" + "\n".join(f"  {statistic}: {bound}" for statistic, bound in error_bounds.items())
+        return table
+
+    def format_building_occupancy_over_time(self, data: List[Tuple]) -> str:
+        """Format building occupancy over time data."""
+        headers = ["Period", "Building", "Days", "Avg Occupied", "Capacity", "Percentage"]
+        return self._format_table(data, headers, "BUILDING OCCUPANCY BY WEEK")
+
+    def format_shard_latencies(self, data: List[Tuple]) -> str:
+        """Format per-shard latency data."""
+        headers = ["Shard", "Queries", "Total ms", "Slowest", "Slowest ms"]
+        return self._format_table(data, headers, "SHARD LATENCIES")
+
     def display_rooms_with_student_count(self, data: List[Tuple]):
         """Display rooms with student count."""
         print(self.format_rooms_with_student_count(data))
@@ -92,3 +112,16 @@ class ConsoleReportGenerator(ReportGenerator):
     def display_age_distribution_by_building(self, data: List[Tuple]):
         """Display age distribution by building."""
         print(self.format_age_distribution_by_building(data))
+
+    def display_age_percentiles_by_building(self, data: List[Tuple],
+                                            error_bounds: Optional[Dict[str, str]] = None):
+        """Display approximate age percentiles by building."""
+        print(self.format_age_percentiles_by_building(data, error_bounds))
+
+    def display_building_occupancy_over_time(self, data: List[Tuple]):
+        """Display building occupancy over time."""
+        print(self.format_building_occupancy_over_time(data))
+
+    def display_shard_latencies(self, data: List[Tuple]):
+        """Display per-shard latencies."""
+        print(self.format_shard_latencies(data))
@@ -2,8 +2,18 @@
 MySQL Student Repository implementation for database operations.
 """
 
-from typing import List
-from src.data.models import Student
+from typing import List, Optional, Tuple
+from src.data.enums import Constants, NameMatchType
+from src.data.models import NameMatch, Student
+
+LIKE_ESCAPE = '!'
+
+
+def escape_like(term: str) -> str:
+    """Escape LIKE wildcards in a search term (escape character ``!``)."""
+    for char in (LIKE_ESCAPE, '%', '_'):
+        term = term.replace(char, LIKE_ESCAPE + char)
+    return term
 
 
 class MySQLStudentRepository:
@@ -34,6 +44,11 @@ class MySQLStudentRepository:
             for row in results
         ]
     
+    def get_placements(self) -> List[Tuple[int, Optional[int], int]]:
+        """Get (id, room_id, age) of every student; room_id is None for unassigned students."""
+        query = "SELECT id, room_id, age FROM students ORDER BY id"
+        return self.connection.fetch_all(query)
+
     def get_by_room_id(self, room_id: int) -> List[Student]:
         """Get students by room ID."""
         query = "SELECT id, name, age, sex, room_id FROM students WHERE room_id = %s ORDER BY id"
@@ -45,6 +60,14 @@ class MySQLStudentRepository:
     
     def bulk_create(self, students: List[Student]) -> None:
         """Create multiple students."""
+        params_list = [
+            (student.id, student.name, student.age, student.sex, student.room_id)
+            for student in students
+        ]
+        self.bulk_create_rows(params_list)
+
+    def bulk_create_rows(self, rows: List[tuple]) -> None:
+        """Create multiple students from (id, name, age, sex, room_id) rows."""
         query = """
         INSERT INTO students (id, name, age, sex, room_id) 
         VALUES (%s, %s, %s, %s, %s)
@@ -54,8 +77,66 @@ class MySQLStudentRepository:
         sex = VALUES(sex), 
         room_id = VALUES(room_id)
         """
-        params_list = [
-            (student.id, student.name, student.age, student.sex, student.room_id)
-            for student in students
-        ]
-        self.connection.execute_many(query, params_list)
+        self.connection.execute_many(query, rows)
+
+    def bulk_update_rooms(self, rows: List[tuple]) -> None:
+        """Move students to new rooms from (room_id, student_id) rows."""
+        query = "UPDATE students SET room_id = %s WHERE id = %s"
+        self.connection.execute_many(query, rows)
+
+    def search_by_name(self, term: str, limit: int = Constants.DEFAULT_QUERY_LIMIT,
+                       fulltext: bool = False) -> List[NameMatch]:
+        """Find students by name, with their room.
+
+        By default names starting with ``term`` (case-insensitive) are matched
+        through a range scan of ``idx_name`` and returned in name order. With
+        ``fulltext`` the ngram FULLTEXT index matches ``term`` anywhere in the
+        name and results are ranked by relevance; this needs
+        ``create_name_fulltext_index`` and a backend with FULLTEXT indexes.
+        """
+        columns = "s.id, s.name, s.age, s.sex, s.room_id, r.number, r.building"
+        if not fulltext:
+            query = f"""
+            SELECT {columns}
+            FROM students s
+            LEFT JOIN rooms r ON r.id = s.room_id
+            WHERE s.name LIKE %s ESCAPE '{LIKE_ESCAPE}'
+            ORDER BY s.name, s.id
+            LIMIT %s
+            """
+            rows = self.connection.fetch_all(query, (escape_like(term) + '%', limit))
+            return [NameMatch(*row, NameMatchType.PREFIX, 1.0) for row in rows]
+
+        dialect = self.connection.dialect
+        if not dialect.has_fulltext:
+            print(f"FULLTEXT name search is not available on {dialect.name}")
+            raise ValueError(f"FULLTEXT indexes are not supported by {dialect.name}")
+        match = dialect.fulltext_match('s.name')
+        query = f"""
+        SELECT {columns}, {match} as score
+        FROM students s
+        LEFT JOIN rooms r ON r.id = s.room_id
+        WHERE {match}
+        ORDER BY score DESC, s.id
+        LIMIT %s
+        """
+        rows = self.connection.fetch_all(query, (term, term, limit))
+        return [NameMatch(*row[:7], NameMatchType.FULLTEXT, float(row[7])) for row in rows]
+
+    def create_name_fulltext_index(self) -> bool:
+        """Add the ngram FULLTEXT index on student names if the backend supports it.
+
+        Returns True when the index was created.
+        """
+        dialect = self.connection.dialect
+        if not dialect.has_fulltext:
+            return False
+        exists = self.connection.fetch_all(
+            dialect.index_exists_query(), ('students', Constants.NAME_FULLTEXT_INDEX)
+        )[0][0] > 0
+        if exists:
+            return False
+        self.connection.execute(
+            dialect.fulltext_index_statement('students', 'name', Constants.NAME_FULLTEXT_INDEX)
+        )
+        return True
@@ -0,0 +1,7 @@
+"""
+Search package for in-memory student name search.
+"""
+
+from .name_trigram_index import NameTrigramIndex, normalize_name, trigrams
+
+__all__ = ['NameTrigramIndex', 'normalize_name', 'trigrams']
@@ -0,0 +1,176 @@
+"""
+Name Trigram Index for in-memory student name search.
+
+Built once from loaded students and rooms. Prefix lookups binary-search a
+sorted list of distinct lower-cased names (and of the words inside them), so
+their cost depends on the limit rather than on the number of students. Fuzzy
+lookups count shared trigrams through an inverted index and rank names by
+trigram similarity, like PostgreSQL's pg_trgm.
+"""
+
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from operator import attrgetter
+from typing import Dict, Iterable, Iterator, List, Set
+from src.data.enums import Constants, NameMatchType
+from src.data.models import NameMatch, Room, Student
+from ..connections.columnar_result import numpy_module
+
+
+def normalize_name(name: str) -> str:
+    """Lower-case a name and collapse its whitespace."""
+    return ' '.join(name.lower().split())
+
+
+def trigrams(text: str) -> Set[str]:
+    """Trigrams of each word, padded with two leading blanks and one trailing blank."""
+    grams = set()
+    for word in text.split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class NameTrigramIndex:
+    """Prefix and fuzzy student name search over loaded students.
+
+    Students sharing a normalized name are stored once under that name, in ID
+    order. ``prefix`` returns names that start with the term before names
+    with a later word starting with it, each group in name order, then student
+    ID. ``fuzzy`` ranks names by trigram similarity (shared trigrams over the
+    union of both sets) above ``threshold``; ``search`` fills a prefix result
+    up to the limit with fuzzy matches.
+    """
+
+    def __init__(self, students: Iterable[Student], rooms: Iterable[Room] = ()):
+        self.students: List[Student] = sorted(students, key=attrgetter('id'))
+        self.rooms: Dict[int, Room] = {room.id: room for room in rooms}
+        groups: Dict[str, array] = {}
+        for position, student in enumerate(self.students):
+            groups.setdefault(normalize_name(student.name), array('q')).append(position)
+        self.names: List[str] = sorted(groups)
+        self.owners: List[array] = [groups[name] for name in self.names]
+        self._build_word_keys()
+        self._build_postings()
+
+    def _build_word_keys(self):
+        """Sort the suffixes that start at each later word of every name."""
+        keys, owners = [], array('q')
+        for name_index, name in enumerate(self.names):
+            start = name.find(' ')
+            while start != -1:
+                keys.append(name[start + 1:])
+                owners.append(name_index)
+                start = name.find(' ', start + 1)
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        self.word_keys: List[str] = [keys[i] for i in order]
+        self.word_owners = array('q', (owners[i] for i in order))
+
+    def _build_postings(self):
+        """Map every trigram to the distinct names containing it."""
+        self.postings: Dict[str, array] = {}
+        self.trigram_counts = array('q')
+        for name_index, name in enumerate(self.names):
+            grams = trigrams(name)
+            self.trigram_counts.append(len(grams))
+            for gram in grams:
+                posting = self.postings.get(gram)
+                if posting is None:
+                    posting = self.postings[gram] = array('q')
+                posting.append(name_index)
+
+    def __len__(self) -> int:
+        return len(self.students)
+
+    def prefix(self, term: str, limit: int = Constants.DEFAULT_QUERY_LIMIT) -> List[NameMatch]:
+        """Students whose name, or a later word of it, starts with ``term``."""
+        term = normalize_name(term)
+        if not term or limit <= 0:
+            return []
+        matches, seen = [], set()
+        for keys, owner, match_type in ((self.names, None, NameMatchType.PREFIX),
+                                        (self.word_keys, self.word_owners, NameMatchType.WORD_PREFIX)):
+            for name_index in self._prefix_range(keys, owner, term):
+                if name_index in seen:
+                    continue
+                seen.add(name_index)
+                matches.extend(self._matches(name_index, match_type, 1.0, limit - len(matches)))
+                if len(matches) >= limit:
+                    return matches
+        return matches
+
+    @staticmethod
+    def _prefix_range(keys: List[str], owner, term: str) -> Iterator[int]:
+        """Name indexes of the sorted keys starting with ``term``, in key order."""
+        position = bisect_left(keys, term)
+        while position < len(keys) and keys[position].startswith(term):
+            yield position if owner is None else owner[position]
+            position += 1
+
+    def fuzzy(self, term: str, limit: int = Constants.DEFAULT_QUERY_LIMIT,
+              threshold: float = Constants.NAME_SIMILARITY_THRESHOLD) -> List[NameMatch]:
+        """Students whose name is at least ``threshold`` trigram-similar to ``term``.
+
+        Ranked by similarity, then name, then student ID.
+        """
+        grams = trigrams(normalize_name(term))
+        postings = [self.postings[gram] for gram in grams if gram in self.postings]
+        if not postings or limit <= 0:
+            return []
+        matches = []
+        for name_index, similarity in self._ranked_names(postings, len(grams), threshold, limit):
+            matches.extend(self._matches(name_index, NameMatchType.FUZZY, similarity, limit - len(matches)))
+            if len(matches) >= limit:
+                break
+        return matches
+
+    def _ranked_names(self, postings: List[array], term_count: int, threshold: float, limit: int):
+        """The ``limit`` most similar (name_index, similarity) pairs at or above the threshold."""
+        numpy = numpy_module()
+        if numpy is None:
+            shared = Counter()
+            for posting in postings:
+                shared.update(posting)
+            scored = (
+                (name_index, count / (term_count + self.trigram_counts[name_index] - count))
+                for name_index, count in shared.items()
+            )
+            candidates = [(name_index, similarity) for name_index, similarity in scored if similarity >= threshold]
+            candidates.sort(key=lambda candidate: (-candidate[1], candidate[0]))
+            return candidates[:limit]
+
+        shared = numpy.bincount(
+            numpy.concatenate([numpy.frombuffer(posting, dtype='int64') for posting in postings]),
+            minlength=len(self.names)
+        )
+        sizes = numpy.frombuffer(self.trigram_counts, dtype='int64')
+        similarity = shared / (term_count + sizes - shared)
+        candidates = numpy.flatnonzero(similarity >= threshold)
+        order = numpy.lexsort((candidates, -similarity[candidates]))[:limit]
+        return [(int(name_index), float(similarity[name_index])) for name_index in candidates[order]]
+
+    def search(self, term: str, limit: int = Constants.DEFAULT_QUERY_LIMIT) -> List[NameMatch]:
+        """Prefix matches first, then fuzzy matches for the students not already returned."""
+        matches = self.prefix(term, limit)
+        if len(matches) < limit:
+            found = {match.student_id for match in matches}
+            for match in self.fuzzy(term, limit + len(matches)):
+                if match.student_id not in found:
+                    matches.append(match)
+                    if len(matches) >= limit:
+                        break
+        return matches
+
+    def _matches(self, name_index: int, match_type: NameMatchType, score: float, limit: int) -> List[NameMatch]:
+        """Up to ``limit`` results for the students with one distinct name, with their rooms."""
+        matches = []
+        for position in self.owners[name_index][:limit]:
+            student = self.students[position]
+            room = self.rooms.get(student.room_id)
+            matches.append(NameMatch(
+                student.id, student.name, student.age, student.sex, student.room_id,
+                room.number if room else None, room.building if room else None,
+                match_type, score
+            ))
+        return matches
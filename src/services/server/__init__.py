@@ -0,0 +1,13 @@
+"""
+Server package for the long-running HTTP query service.
+"""
+
+from .analysis_endpoints import AnalysisEndpoint, ANALYSIS_ENDPOINTS
+from .connection_pool import ConnectionPool, PoolExhaustedError
+from .request_coalescer import RequestCoalescer
+from .query_http_server import QueryHTTPServer, QueryRequestHandler
+
+__all__ = [
+    'AnalysisEndpoint', 'ANALYSIS_ENDPOINTS', 'ConnectionPool', 'PoolExhaustedError',
+    'RequestCoalescer', 'QueryHTTPServer', 'QueryRequestHandler'
+]
@@ -0,0 +1,51 @@
+"""
+Catalogue of the analyses exposed outside the console report.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Sequence
+from src.data.enums import ColumnType
+from ..queries.student_room_query_service import (
+    ROOMS_WITH_STUDENT_COUNT_COLUMNS, TOP_ROOMS_BY_AVG_AGE_COLUMNS, TOP_ROOMS_BY_AGE_DIFFERENCE_COLUMNS,
+    ROOMS_WITH_MIXED_SEX_COLUMNS, ROOM_OCCUPANCY_COLUMNS, AGE_DISTRIBUTION_BY_BUILDING_COLUMNS
+)
+
+
+JSON_TYPES = {ColumnType.INT64: int, ColumnType.FLOAT64: float, ColumnType.STRING: str}
+
+
+@dataclass(frozen=True)
+class AnalysisEndpoint:
+    """A StudentRoomQueryService analysis, its typed result columns and whether it takes a limit."""
+    method: str
+    columns: Dict[str, ColumnType]
+    takes_limit: bool = False
+
+    def to_json_row(self, row: Sequence) -> Dict[str, Any]:
+        """Map a result row to its column names, with Decimal averages as JSON numbers."""
+        return {
+            name: None if value is None else JSON_TYPES[column_type](value)
+            for (name, column_type), value in zip(self.columns.items(), row)
+        }
+
+
+ANALYSIS_ENDPOINTS: Dict[str, AnalysisEndpoint] = {
+    'rooms-with-student-count': AnalysisEndpoint(
+        'get_rooms_with_student_count', ROOMS_WITH_STUDENT_COUNT_COLUMNS
+    ),
+    'top-rooms-by-avg-age': AnalysisEndpoint(
+        'get_top_rooms_by_avg_age', TOP_ROOMS_BY_AVG_AGE_COLUMNS, takes_limit=True
+    ),
+    'top-rooms-by-age-difference': AnalysisEndpoint(
+        'get_top_rooms_by_age_difference', TOP_ROOMS_BY_AGE_DIFFERENCE_COLUMNS, takes_limit=True
+    ),
+    'rooms-with-mixed-sex': AnalysisEndpoint(
+        'get_rooms_with_mixed_sex', ROOMS_WITH_MIXED_SEX_COLUMNS
+    ),
+    'room-occupancy': AnalysisEndpoint(
+        'get_room_occupancy_analysis', ROOM_OCCUPANCY_COLUMNS
+    ),
+    'age-distribution-by-building': AnalysisEndpoint(
+        'get_age_distribution_by_building', AGE_DISTRIBUTION_BY_BUILDING_COLUMNS
+    ),
+}
@@ -0,0 +1,90 @@
+"""
+Pool of warm database connections with their query services.
+"""
+
+import queue
+from contextlib import contextmanager
+from typing import Callable, Optional
+from src.data.enums import Constants
+from ..connections import DatabaseConnection, QueryTimeoutError
+from ..queries import StudentRoomQueryService
+
+
+class PoolExhaustedError(Exception):
+    """No pooled connection became free within the acquire timeout."""
+
+
+class ConnectionPool:
+    """Fixed-size pool of connected StudentRoomQueryServices.
+
+    Every connection is opened up front, so requests never pay for a connect.
+    A connection whose query fails for any reason other than a deadline is
+    discarded and a fresh one from ``factory`` takes its slot. If that connect
+    fails too, the slot stays empty and the next request to draw it tries
+    again, so a broken connection is never handed out twice.
+    """
+
+    def __init__(self, factory: Callable[[], DatabaseConnection], size: int = Constants.DEFAULT_POOL_SIZE,
+                 timeout: Optional[float] = None):
+        self.factory = factory
+        self.size = size
+        self.timeout = timeout
+        self._idle = queue.Queue()
+        self._services = []
+
+    def open(self):
+        """Connect every pooled connection."""
+        for _ in range(self.size):
+            self._idle.put(self._connect())
+
+    def close(self):
+        """Disconnect every pooled connection."""
+        for service in self._services:
+            service.connection.disconnect()
+        self._services = []
+        self._idle = queue.Queue()
+
+    @contextmanager
+    def acquire(self, timeout: float = Constants.POOL_ACQUIRE_TIMEOUT):
+        """Borrow a query service, waiting up to ``timeout`` seconds for one to free up."""
+        try:
+            service = self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise PoolExhaustedError(f"No database connection free after {timeout}s")
+        if service is None:
+            try:
+                service = self._connect()
+            except Exception:
+                self._idle.put(None)
+                raise
+        try:
+            yield service
+        except QueryTimeoutError:
+            raise
+        except Exception:
+            service = self._replace(service)
+            raise
+        finally:
+            self._idle.put(service)
+
+    def _connect(self) -> StudentRoomQueryService:
+        """Open a new pooled connection and its query service."""
+        connection = self.factory()
+        connection.connect()
+        service = StudentRoomQueryService(connection, self.timeout)
+        self._services.append(service)
+        return service
+
+    def _replace(self, service: StudentRoomQueryService) -> Optional[StudentRoomQueryService]:
+        """Discard a connection that may be broken; return a fresh one, or None if it cannot connect."""
+        if service in self._services:
+            self._services.remove(service)
+        try:
+            service.connection.disconnect()
+        except Exception:
+            pass
+        try:
+            return self._connect()
+        except Exception as e:
+            print(f"Error replacing pooled connection: {e}")
+            return None
@@ -0,0 +1,159 @@
+"""
+HTTP/JSON server for the student-room analyses.
+
+    GET /health
+    GET /analyses
+    GET /analyses/<name>[?limit=N]
+
+Connections are HTTP/1.1 keep-alive. Identical concurrent requests are
+coalesced into one query; responses carry Cache-Control and an ETag, and a
+matching If-None-Match is answered with 304.
+"""
+
+import hashlib
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+from src.data.enums import Constants
+from ..connections import QueryTimeoutError
+from .analysis_endpoints import ANALYSIS_ENDPOINTS
+from .connection_pool import ConnectionPool, PoolExhaustedError
+from .request_coalescer import RequestCoalescer
+
+ANALYSES_PREFIX = '/analyses/'
+IDLE_CONNECTION_TIMEOUT = 30
+
+
+class QueryRequestHandler(BaseHTTPRequestHandler):
+    """Routes GET requests to the analyses.
+
+    Responses are buffered and flushed once per request with TCP_NODELAY,
+    so headers and body leave in one write instead of stalling on Nagle's
+    algorithm against the client's delayed ACK.
+    """
+
+    protocol_version = 'HTTP/1.1'
+    server_version = 'StudentRoomQueryServer/1.0'
+    timeout = IDLE_CONNECTION_TIMEOUT
+    wbufsize = -1
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path == '/health':
+            self._send_json(200, {
+                'status': 'ok',
+                'queries_executed': self.server.coalescer.executed,
+                'requests_coalesced': self.server.coalescer.coalesced,
+            })
+        elif url.path.rstrip('/') == '/analyses':
+            self._send_json(200, {
+                'analyses': [
+                    {'name': name, 'takes_limit': endpoint.takes_limit, 'columns': list(endpoint.columns)}
+                    for name, endpoint in ANALYSIS_ENDPOINTS.items()
+                ]
+            })
+        elif url.path.startswith(ANALYSES_PREFIX):
+            self._serve_analysis(url.path[len(ANALYSES_PREFIX):], parse_qs(url.query))
+        else:
+            self._send_json(404, {'error': f"Unknown path {url.path}"})
+
+    def _serve_analysis(self, name: str, query: dict):
+        """Answer one analysis request."""
+        endpoint = ANALYSIS_ENDPOINTS.get(name)
+        if endpoint is None:
+            self._send_json(404, {'error': f"Unknown analysis '{name}'"})
+            return
+        try:
+            limit = self._parse_limit(query) if endpoint.takes_limit else None
+        except ValueError as e:
+            self._send_json(400, {'error': str(e)})
+            return
+
+        try:
+            body, etag = self.server.fetch(name, limit)
+        except QueryTimeoutError as e:
+            self._send_json(504, {'error': str(e)})
+            return
+        except PoolExhaustedError as e:
+            self._send_json(503, {'error': str(e)})
+            return
+        except Exception as e:
+            self._send_json(500, {'error': f"Error running {name}: {e}"})
+            return
+
+        if etag in self.headers.get('If-None-Match', ''):
+            self._send(304, b'', etag)
+        else:
+            self._send(200, body, etag)
+
+    @staticmethod
+    def _parse_limit(query: dict) -> int:
+        """Validate the ``limit`` query parameter."""
+        values = query.get('limit')
+        if not values:
+            return Constants.DEFAULT_QUERY_LIMIT
+        try:
+            limit = int(values[-1])
+        except ValueError:
+            raise ValueError(f"limit must be an integer, got '{values[-1]}'")
+        if not 1 <= limit <= Constants.MAX_QUERY_LIMIT:
+            raise ValueError(f"limit must be between 1 and {Constants.MAX_QUERY_LIMIT}")
+        return limit
+
+    def _send_json(self, status: int, payload: dict):
+        """Send an uncached JSON response."""
+        self._send(status, json.dumps(payload).encode('utf-8'))
+
+    def _send(self, status: int, body: bytes, etag: Optional[str] = None):
+        """Send a response with a Content-Length so the connection stays open."""
+        self.send_response(status)
+        if etag:
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', f"public, max-age={self.server.max_age}")
+        else:
+            self.send_header('Cache-Control', 'no-store')
+        if status != 304:
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if status != 304:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class QueryHTTPServer(ThreadingHTTPServer):
+    """Threaded HTTP server answering analyses from a warm ConnectionPool."""
+
+    daemon_threads = True
+
+    def __init__(self, pool: ConnectionPool, host: str = Constants.DEFAULT_SERVER_HOST,
+                 port: int = Constants.DEFAULT_SERVER_PORT, max_age: int = Constants.SERVER_CACHE_MAX_AGE,
+                 verbose: bool = False):
+        super().__init__((host, port), QueryRequestHandler)
+        self.pool = pool
+        self.max_age = max_age
+        self.verbose = verbose
+        self.coalescer = RequestCoalescer()
+
+    def fetch(self, name: str, limit: Optional[int] = None) -> Tuple[bytes, str]:
+        """Return the encoded JSON body and ETag of an analysis, coalescing identical requests."""
+        return self.coalescer.run((name, limit), lambda: self._run_analysis(name, limit))
+
+    def _run_analysis(self, name: str, limit: Optional[int]) -> Tuple[bytes, str]:
+        """Run an analysis on a pooled connection and encode the rows."""
+        endpoint = ANALYSIS_ENDPOINTS[name]
+        with self.pool.acquire() as service:
+            method = getattr(service, endpoint.method)
+            rows = method(limit) if endpoint.takes_limit else method()
+        payload = {
+            'analysis': name,
+            'limit': limit,
+            'rows': [endpoint.to_json_row(row) for row in rows],
+        }
+        body = json.dumps(payload).encode('utf-8')
+        return body, f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
@@ -0,0 +1,44 @@
+"""
+Single-flight coalescing of identical concurrent requests.
+"""
+
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable
+
+
+class RequestCoalescer:
+    """Runs one call per key at a time; concurrent callers with the same key share its result.
+
+    Nothing is cached: once the leading call finishes, the next request for
+    the key runs again.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight: Dict[Hashable, Future] = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    def run(self, key: Hashable, call: Callable[[], Any]) -> Any:
+        """Return ``call()``, or the result of an identical call already in flight."""
+        with self._lock:
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._in_flight[key] = future
+                self.executed += 1
+            else:
+                self.coalesced += 1
+        if not leader:
+            return future.result()
+
+        try:
+            future.set_result(call())
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+        return future.result()
@@ -0,0 +1,9 @@
+"""
+Sketches package for approximate, mergeable analytics.
+"""
+
+from .age_histogram import AgeHistogram
+from .hyperloglog import HyperLogLog
+from .building_sketch_analyzer import BuildingSketchAnalyzer
+
+__all__ = ['AgeHistogram', 'HyperLogLog', 'BuildingSketchAnalyzer']
@@ -0,0 +1,26 @@
+"""
+Benchmarks package for performance measurement utilities.
+
+The query load harness and the name search benchmark pull in the service
+layer and the compression benchmark the seeded dataset; they are imported on
+first attribute access.
+"""
+
+from .startup_benchmark import StartupBenchmark
+from .latency_histogram import LatencyHistogram
+
+__all__ = ['StartupBenchmark', 'LatencyHistogram', 'QueryLoadHarness', 'LoadResult', 'AnalysisLoadStats',
+           'CompressionBenchmark', 'NameSearchBenchmark']
+
+
+def __getattr__(name):
+    if name in ('QueryLoadHarness', 'LoadResult', 'AnalysisLoadStats'):
+        from . import query_load_harness
+        return getattr(query_load_harness, name)
+    if name == 'CompressionBenchmark':
+        from .compression_benchmark import CompressionBenchmark
+        return CompressionBenchmark
+    if name == 'NameSearchBenchmark':
+        from .name_search_benchmark import NameSearchBenchmark
+        return NameSearchBenchmark
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
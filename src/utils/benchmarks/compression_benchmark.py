@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Compression Benchmark - Student loading throughput from raw vs. compressed inputs.
+"""
+
+import importlib
+import json
+import os
+import tempfile
+import time
+from dataclasses import asdict
+from typing import Dict, List, Tuple
+from src.data.enums import Compression, Constants
+from src.data.loaders import StudentDataLoader
+from src.utils.plans import generate_seeded_dataset
+
+CODEC_EXTENSIONS = {Compression.GZIP: '.gz', Compression.XZ: '.xz', Compression.BZIP2: '.bz2'}
+
+
+class CompressionBenchmark:
+    """Loads the same seeded students from JSON/NDJSON files, raw and compressed.
+
+    Every input goes through ``StudentDataLoader``, so compressed files are
+    decoded as a stream and never written back to disk.
+    """
+
+    def __init__(self, student_count: int = Constants.COMPRESSION_BENCHMARK_STUDENTS, repeat: int = 3):
+        self.student_count = student_count
+        self.repeat = repeat
+
+    def write_inputs(self, directory: str) -> List[Tuple[str, int]]:
+        """Write the dataset in every format; return (path, raw_bytes) pairs."""
+        _, students = generate_seeded_dataset(student_count=self.student_count)
+        records = [asdict(student) for student in students]
+        payloads = {
+            'students.json': json.dumps(records, indent=2).encode('utf-8'),
+            'students.ndjson': ''.join(json.dumps(record) + '\n' for record in records).encode('utf-8'),
+        }
+        inputs = []
+        for name, payload in payloads.items():
+            path = os.path.join(directory, name)
+            with open(path, 'wb') as file:
+                file.write(payload)
+            inputs.append((path, len(payload)))
+            for compression, extension in CODEC_EXTENSIONS.items():
+                with importlib.import_module(compression.value).open(path + extension, 'wb') as file:
+                    file.write(payload)
+                inputs.append((path + extension, len(payload)))
+        return inputs
+
+    def measure(self, path: str) -> Tuple[float, int]:
+        """Load a file several times; return (best seconds, students loaded)."""
+        best, count = None, 0
+        for _ in range(self.repeat):
+            started = time.perf_counter()
+            count = sum(len(batch) for batch in StudentDataLoader(path).load_model_batches())
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        return best, count
+
+    def run(self) -> List[Dict[str, object]]:
+        """Run the benchmark and print a summary table."""
+        print(f"COMPRESSION BENCHMARK ({self.student_count} students, best of {self.repeat})")
+        print("=" * 86)
+        print(f"{'Input':<22} | {'Size MB':>8} | {'Ratio':>5} | {'Seconds':>7} | "
+              f"{'Rows/s':>9} | {'Raw MB/s':>8} | {'Disk MB/s':>9}")
+        print("-" * 86)
+        results = []
+        with tempfile.TemporaryDirectory() as directory:
+            for path, raw_bytes in self.write_inputs(directory):
+                size = os.path.getsize(path)
+                seconds, count = self.measure(path)
+                result = {
+                    'input': os.path.basename(path),
+                    'bytes': size,
+                    'ratio': raw_bytes / size,
+                    'seconds': seconds,
+                    'rows_per_second': count / seconds,
+                    'raw_mb_per_second': raw_bytes / seconds / 1e6,
+                    'disk_mb_per_second': size / seconds / 1e6,
+                }
+                results.append(result)
+                print(f"{result['input']:<22} | {size / 1e6:>8.2f} | {result['ratio']:>5.1f} | "
+                      f"{seconds:>7.3f} | {result['rows_per_second']:>9.0f} | "
+                      f"{result['raw_mb_per_second']:>8.1f} | {result['disk_mb_per_second']:>9.1f}")
+        return results
+
+
+def main():
+    """Main function."""
+    benchmark = CompressionBenchmark()
+    benchmark.run()
+
+
+if __name__ == "__main__":
+    main()
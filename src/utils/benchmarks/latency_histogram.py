@@ -0,0 +1,85 @@
+"""
+HDR-style latency histogram with bounded relative error.
+"""
+
+from typing import Optional
+
+SUB_BUCKET_BITS = 7
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+HALF_SUB_BUCKETS = SUB_BUCKETS // 2
+MAX_SHIFT = 32
+BUCKET_COUNT = SUB_BUCKETS + MAX_SHIFT * HALF_SUB_BUCKETS
+
+
+class LatencyHistogram:
+    """Log-linear histogram of latencies in microseconds.
+
+    Values below 128 us are exact; above that each power-of-two range is cut
+    into 64 sub-buckets, so any recorded value is off by under 1% while the
+    whole histogram stays a fixed array of ~2k counters regardless of the
+    number of samples. Histograms merge by adding counters.
+    """
+
+    def __init__(self):
+        self.counts = [0] * BUCKET_COUNT
+        self.count = 0
+        self.total_us = 0
+        self.max_us = 0
+        self.min_us: Optional[int] = None
+
+    @staticmethod
+    def _index(value: int) -> int:
+        if value < SUB_BUCKETS:
+            return value
+        shift = min(value.bit_length() - SUB_BUCKET_BITS, MAX_SHIFT)
+        sub_bucket = min(value >> shift, SUB_BUCKETS - 1)
+        return SUB_BUCKETS + (shift - 1) * HALF_SUB_BUCKETS + sub_bucket - HALF_SUB_BUCKETS
+
+    @staticmethod
+    def _value(index: int) -> int:
+        """Midpoint of a bucket's value range."""
+        if index < SUB_BUCKETS:
+            return index
+        shift = (index - SUB_BUCKETS) // HALF_SUB_BUCKETS + 1
+        sub_bucket = (index - SUB_BUCKETS) % HALF_SUB_BUCKETS + HALF_SUB_BUCKETS
+        return (sub_bucket << shift) + (1 << (shift - 1))
+
+    def record(self, seconds: float):
+        """Record one latency."""
+        value = max(0, round(seconds * 1_000_000))
+        self.counts[self._index(value)] += 1
+        self.count += 1
+        self.total_us += value
+        self.max_us = max(self.max_us, value)
+        self.min_us = value if self.min_us is None else min(self.min_us, value)
+
+    def merge(self, other: 'LatencyHistogram'):
+        """Add another histogram's samples into this one."""
+        for index, count in enumerate(other.counts):
+            if count:
+                self.counts[index] += count
+        self.count += other.count
+        self.total_us += other.total_us
+        self.max_us = max(self.max_us, other.max_us)
+        if other.min_us is not None:
+            self.min_us = other.min_us if self.min_us is None else min(self.min_us, other.min_us)
+
+    def percentile(self, percent: float) -> float:
+        """Latency in milliseconds at the given percentile (0-100)."""
+        if not self.count:
+            return 0.0
+        rank = max(1, -(-self.count * percent // 100))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(self._value(index), self.max_us) / 1000
+        return self.max_us / 1000
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_us / self.count / 1000 if self.count else 0.0
+
+    @property
+    def max_ms(self) -> float:
+        return self.max_us / 1000
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Name Search Benchmark - prefix and fuzzy student name lookups, in memory and indexed SQL.
+"""
+
+import random
+import time
+from typing import Callable, Dict, List
+from src.data.enums import Constants, Gender
+from src.data.models import Student
+from src.services.connections import SQLiteConnection
+from src.services.database import DatabaseManager
+from src.services.search import NameTrigramIndex
+from src.utils.plans import generate_seeded_dataset
+from .latency_histogram import LatencyHistogram
+
+FIRST_NAMES = [
+    'Aaliyah', 'Adam', 'Aisha', 'Alice', 'Amir', 'Ana', 'Andrei', 'Anna', 'Ben', 'Carlos', 'Chen', 'Chloe',
+    'Daniel', 'David', 'Elena', 'Emma', 'Fatima', 'Felix', 'Grace', 'Hana', 'Hugo', 'Ines', 'Ivan', 'Jack',
+    'James', 'Jana', 'Kai', 'Karim', 'Laura', 'Leo', 'Lucas', 'Maya', 'Mei', 'Mohammed', 'Nadia', 'Noah',
+    'Olivia', 'Omar', 'Paula', 'Priya', 'Rafael', 'Rosa', 'Sam', 'Sara', 'Sofia', 'Tariq', 'Tom', 'Yuki',
+]
+SURNAME_PARTS = [
+    ['Al', 'Bar', 'Ber', 'Cam', 'Dal', 'Fer', 'Gar', 'Hol', 'Kar', 'Lin', 'Mar', 'Nor', 'Ost', 'Per', 'Ros',
+     'San', 'Tor', 'Val', 'Wil', 'Zim'],
+    ['a', 'e', 'i', 'o', 'u', 'an', 'en', 'in', 'on', 'ar'],
+    ['berg', 'dez', 'ez', 'field', 'ford', 'ini', 'kov', 'lund', 'man', 'ova', 'sen', 'son', 'ton', 'wood'],
+]
+
+
+class NameSearchBenchmark:
+    """Times name lookups over seeded students with realistic, repeating names.
+
+    The in-memory ``NameTrigramIndex`` is timed for prefix and fuzzy lookups.
+    ``MySQLStudentRepository.search_by_name`` is timed on an in-memory SQLite
+    database, where prefix searches range-scan the case-insensitive name index.
+    """
+
+    def __init__(self, student_count: int = Constants.NAME_SEARCH_BENCHMARK_STUDENTS,
+                 queries: int = 2000, fuzzy_queries: int = 200, sql: bool = True):
+        self.student_count = student_count
+        self.queries = queries
+        self.fuzzy_queries = fuzzy_queries
+        self.sql = sql
+        self.rng = random.Random(Constants.PLAN_DATASET_SEED)
+
+    def generate_students(self, room_count: int) -> List[Student]:
+        """Students named '<first> <surname>', drawn from 134,400 combinations."""
+        rng = self.rng
+        return [
+            Student(
+                id=student_id,
+                name=f"{rng.choice(FIRST_NAMES)} {''.join(rng.choice(part) for part in SURNAME_PARTS)}",
+                age=rng.randint(17, 30),
+                sex=rng.choice((Gender.MALE.value, Gender.FEMALE.value)),
+                room_id=rng.randint(1, room_count)
+            )
+            for student_id in range(1, self.student_count + 1)
+        ]
+
+    def prefix_terms(self, students: List[Student], count: int) -> List[str]:
+        """Prefixes of 2-6 characters of first names or surnames."""
+        terms = []
+        for _ in range(count):
+            word = self.rng.choice(self.rng.choice(students).name.split())
+            terms.append(word[:self.rng.randint(2, 6)].lower())
+        return terms
+
+    def fuzzy_terms(self, students: List[Student], count: int) -> List[str]:
+        """Full names with two adjacent letters swapped."""
+        terms = []
+        for _ in range(count):
+            name = self.rng.choice(students).name
+            i = self.rng.randrange(len(name) - 1)
+            terms.append(name[:i] + name[i + 1] + name[i] + name[i + 2:])
+        return terms
+
+    @staticmethod
+    def measure(search: Callable[[str], list], terms: List[str]) -> Dict[str, float]:
+        """Run every term once; return latency percentiles in ms and the mean result count."""
+        histogram, results = LatencyHistogram(), 0
+        for term in terms:
+            started = time.perf_counter()
+            results += len(search(term))
+            histogram.record(time.perf_counter() - started)
+        return {
+            'p50_ms': histogram.percentile(50),
+            'p99_ms': histogram.percentile(99),
+            'max_ms': histogram.max_ms,
+            'mean_results': results / len(terms),
+        }
+
+    def run(self) -> Dict[str, Dict[str, float]]:
+        """Run the benchmark and print a summary table."""
+        rooms, _ = generate_seeded_dataset(student_count=0)
+        students = self.generate_students(len(rooms))
+        started = time.perf_counter()
+        index = NameTrigramIndex(students, rooms)
+        build_seconds = time.perf_counter() - started
+        prefix_terms = self.prefix_terms(students, self.queries)
+        fuzzy_terms = self.fuzzy_terms(students, self.fuzzy_queries)
+
+        results = {
+            'memory prefix': self.measure(index.prefix, prefix_terms),
+            'memory fuzzy': self.measure(index.fuzzy, fuzzy_terms),
+            'memory search (fuzzy fill)': self.measure(index.search, fuzzy_terms),
+        }
+        if self.sql:
+            results.update(self.measure_sql(rooms, students, prefix_terms))
+
+        print(f"NAME SEARCH BENCHMARK ({self.student_count} students, {len(index.names)} distinct names)")
+        print(f"In-memory index built in {build_seconds:.2f}s "
+              f"({len(index.word_keys)} word keys, {len(index.postings)} trigrams)")
+        print("=" * 72)
+        print(f"{'Lookup':<28} | {'Queries':>7} | {'p50 ms':>7} | {'p99 ms':>7} | {'Max ms':>7} | {'Rows':>5}")
+        print("-" * 72)
+        for name, result in results.items():
+            queries = len(fuzzy_terms) if 'fuzzy' in name else len(prefix_terms)
+            print(f"{name:<28} | {queries:>7} | {result['p50_ms']:>7.3f} | {result['p99_ms']:>7.3f} | "
+                  f"{result['max_ms']:>7.3f} | {result['mean_results']:>5.1f}")
+        return results
+
+    def measure_sql(self, rooms, students: List[Student], terms: List[str]) -> Dict[str, Dict[str, float]]:
+        """Load the students into in-memory SQLite and time indexed prefix searches."""
+        connection = SQLiteConnection(':memory:')
+        connection.connect()
+        try:
+            manager = DatabaseManager(connection)
+            manager.create_schema()
+            started = time.perf_counter()
+            with connection.transaction():
+                manager.room_repository.bulk_create(rooms)
+                for start in range(0, len(students), Constants.DEFAULT_BATCH_SIZE):
+                    manager.student_repository.bulk_create(students[start:start + Constants.DEFAULT_BATCH_SIZE])
+            for statement in connection.dialect.analyze_statements():
+                connection.execute(statement)
+            print(f"SQLite loaded in {time.perf_counter() - started:.2f}s")
+            plan = connection.fetch_all(
+                connection.dialect.explain_query(
+                    "SELECT id FROM students s WHERE s.name LIKE %s ESCAPE '!' ORDER BY s.name, s.id LIMIT %s"
+                ),
+                ('ab%', Constants.DEFAULT_QUERY_LIMIT)
+            )
+            print("SQLite prefix plan: " + "; ".join(row[-1] for row in plan))
+            return {'sqlite prefix': self.measure(manager.student_repository.search_by_name, terms)}
+        finally:
+            connection.disconnect()
+
+
+def main():
+    """Main function."""
+    benchmark = NameSearchBenchmark()
+    benchmark.run()
+
+
+if __name__ == "__main__":
+    main()
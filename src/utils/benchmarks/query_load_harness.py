@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Query Load Harness - Latency and throughput of the analyses under concurrency.
+"""
+
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+from src.data.enums import Constants
+from src.services.connections import DatabaseConnection
+from src.services.queries import StudentRoomQueryService
+from src.services.server import ANALYSIS_ENDPOINTS
+from .latency_histogram import LatencyHistogram
+
+
+@dataclass
+class AnalysisLoadStats:
+    """Latencies and errors of one analysis during a load run."""
+    histogram: LatencyHistogram = field(default_factory=LatencyHistogram)
+    errors: int = 0
+
+    def merge(self, other: 'AnalysisLoadStats'):
+        self.histogram.merge(other.histogram)
+        self.errors += other.errors
+
+
+@dataclass
+class LoadResult:
+    """Outcome of one load run at a fixed concurrency."""
+    threads: int
+    rate: Optional[float]
+    elapsed: float
+    stats: Dict[str, AnalysisLoadStats]
+
+    @property
+    def requests(self) -> int:
+        return sum(stat.histogram.count + stat.errors for stat in self.stats.values())
+
+    @property
+    def errors(self) -> int:
+        return sum(stat.errors for stat in self.stats.values())
+
+    @property
+    def throughput(self) -> float:
+        """Completed requests per second."""
+        return (self.requests - self.errors) / self.elapsed if self.elapsed else 0.0
+
+    def overall(self) -> LatencyHistogram:
+        histogram = LatencyHistogram()
+        for stat in self.stats.values():
+            histogram.merge(stat.histogram)
+        return histogram
+
+
+class QueryLoadHarness:
+    """Drives a weighted mix of the analyses from concurrent threads.
+
+    Each thread owns a connection from ``connection_factory`` (any
+    DatabaseConnection) and its own StudentRoomQueryService. With a target
+    ``rate`` the load is open-loop: requests are scheduled at fixed times
+    and latency is measured from the scheduled time, so a stalled server
+    shows up as queueing delay instead of silently lowering the offered
+    load. Without a rate every thread issues requests back to back.
+    """
+
+    def __init__(self, connection_factory: Callable[[], DatabaseConnection],
+                 mix: Optional[Dict[str, float]] = None, limit: int = Constants.DEFAULT_QUERY_LIMIT,
+                 timeout: Optional[float] = None, seed: Optional[int] = None):
+        self.connection_factory = connection_factory
+        self.mix = mix or {name: 1.0 for name in ANALYSIS_ENDPOINTS}
+        unknown = set(self.mix) - set(ANALYSIS_ENDPOINTS)
+        if unknown:
+            raise ValueError(f"Unknown analyses in mix: {', '.join(sorted(unknown))}")
+        self.limit = limit
+        self.timeout = timeout
+        self.seed = seed
+
+    def run(self, threads: int, duration: float = Constants.LOAD_TEST_DURATION,
+            rate: Optional[float] = None) -> LoadResult:
+        """Run the mix from ``threads`` threads for ``duration`` seconds."""
+        services = []
+        for _ in range(threads):
+            connection = self.connection_factory()
+            connection.connect()
+            services.append(StudentRoomQueryService(connection, self.timeout))
+
+        per_thread = [{name: AnalysisLoadStats() for name in self.mix} for _ in range(threads)]
+        start_barrier = threading.Barrier(threads + 1)
+        workers = [
+            threading.Thread(
+                target=self._worker,
+                args=(index, threads, services[index], per_thread[index], start_barrier, duration, rate),
+                daemon=True
+            )
+            for index in range(threads)
+        ]
+        try:
+            for worker in workers:
+                worker.start()
+            start_barrier.wait()
+            started = time.perf_counter()
+            for worker in workers:
+                worker.join()
+            elapsed = time.perf_counter() - started
+        finally:
+            for service in services:
+                service.connection.disconnect()
+
+        stats = {name: AnalysisLoadStats() for name in self.mix}
+        for thread_stats in per_thread:
+            for name, stat in thread_stats.items():
+                stats[name].merge(stat)
+        return LoadResult(threads, rate, elapsed, stats)
+
+    def _worker(self, index: int, threads: int, service: StudentRoomQueryService,
+                stats: Dict[str, AnalysisLoadStats], start_barrier: threading.Barrier,
+                duration: float, rate: Optional[float]):
+        """Issue requests until the run ends, recording per-analysis latency."""
+        rng = random.Random(None if self.seed is None else self.seed + index)
+        names = list(self.mix)
+        weights = [self.mix[name] for name in names]
+        interval = threads / rate if rate else 0.0
+
+        start_barrier.wait()
+        started = time.perf_counter()
+        deadline = started + duration
+        scheduled = started + (index / rate if rate else 0.0)
+        while True:
+            if rate:
+                now = time.perf_counter()
+                if scheduled > now:
+                    time.sleep(scheduled - now)
+            else:
+                scheduled = time.perf_counter()
+            if scheduled >= deadline:
+                break
+
+            name = rng.choices(names, weights)[0]
+            endpoint = ANALYSIS_ENDPOINTS[name]
+            method = getattr(service, endpoint.method)
+            try:
+                method(self.limit) if endpoint.takes_limit else method()
+                stats[name].histogram.record(time.perf_counter() - scheduled)
+            except Exception:
+                stats[name].errors += 1
+            scheduled += interval
+
+    def find_saturation(self, duration: float = Constants.LOAD_TEST_DURATION,
+                        max_threads: int = Constants.LOAD_TEST_MAX_THREADS,
+                        min_gain: float = Constants.LOAD_SATURATION_MIN_GAIN) -> Tuple[List[LoadResult], bool]:
+        """Double the concurrency until throughput stops growing by ``min_gain``.
+
+        Returns the steps and whether throughput saturated. If it did, the
+        last result is the first step past saturation and the one before it
+        is the saturation point; otherwise throughput was still growing at
+        the last step, ``max_threads``.
+        """
+        results = []
+        threads = 1
+        while threads <= max_threads:
+            result = self.run(threads, duration)
+            results.append(result)
+            print(self.format_step(result))
+            if len(results) > 1 and result.throughput < results[-2].throughput * (1 + min_gain):
+                return results, True
+            threads *= 2
+        return results, False
+
+    @staticmethod
+    def format_step(result: LoadResult) -> str:
+        """One line summarizing a run."""
+        overall = result.overall()
+        return (f"{result.threads:>4} threads | {result.throughput:>9.1f} req/s | "
+                f"p50 {overall.percentile(50):>8.2f} ms | p99 {overall.percentile(99):>8.2f} ms | "
+                f"errors {result.errors}")
+
+    @staticmethod
+    def format_result(result: LoadResult) -> str:
+        """Per-analysis latency table for a run."""
+        rate = f"{result.rate:.0f} req/s target" if result.rate else "closed loop"
+        header = (f"{'Analysis':<30} | {'Requests':>8} | {'Errors':>6} | {'p50 ms':>8} | "
+                  f"{'p95 ms':>8} | {'p99 ms':>8} | {'max ms':>8}")
+        separator = "-" * len(header)
+        rows = []
+        for name, stat in list(result.stats.items()) + [('TOTAL', None)]:
+            if stat is None:
+                histogram, errors = result.overall(), result.errors
+            else:
+                histogram, errors = stat.histogram, stat.errors
+            rows.append(
+                f"{name:<30} | {histogram.count + errors:>8} | {errors:>6} | "
+                f"{histogram.percentile(50):>8.2f} | {histogram.percentile(95):>8.2f} | "
+                f"{histogram.percentile(99):>8.2f} | {histogram.max_ms:>8.2f}"
+            )
+        return (f"\nQUERY LOAD TEST ({result.threads} threads, {rate}, {result.elapsed:.1f}s)\n"
+                f"{separator}\n{header}\n{separator}\n" + "\n".join(rows) +
+                f"\n{separator}\nThroughput: {result.throughput:.1f} req/s")
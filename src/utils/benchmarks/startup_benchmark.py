@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Startup Benchmark - Measures import cost with ``python -X importtime``.
+"""
+
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+DEFAULT_TARGETS = [
+    'src.config',
+    'src.data.loaders',
+    'src.utils.preview',
+    'src.services.connections',
+    'src.application',
+    'src.application.student_room_analyzer',
+]
+
+HEAVY_MODULES = ['mysql.connector']
+
+
+class StartupBenchmark:
+    """Tracks the import-time cost of the package entry points."""
+
+    def __init__(self, targets: List[str] = None, repeat: int = 5):
+        self.targets = targets or DEFAULT_TARGETS
+        self.repeat = repeat
+
+    def measure(self, module: str) -> Tuple[int, Dict[str, int]]:
+        """Import a module in a fresh interpreter; return (total_us, cumulative_us per module)."""
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        cumulative = {}
+        for line in result.stderr.splitlines():
+            if not line.startswith('import time:') or 'cumulative' in line:
+                continue
+            _, cumulative_us, name = line[len('import time:'):].split('|')
+            cumulative[name.strip()] = int(cumulative_us)
+        return cumulative.get(module, 0), cumulative
+
+    def run_target(self, module: str) -> Dict[str, object]:
+        """Measure a target several times and keep the fastest run."""
+        best_total, best_modules = None, {}
+        for _ in range(self.repeat):
+            total, modules = self.measure(module)
+            if best_total is None or total < best_total:
+                best_total, best_modules = total, modules
+        return {
+            'module': module,
+            'import_us': best_total,
+            'modules_loaded': len(best_modules),
+            'heavy_modules': [name for name in HEAVY_MODULES if name in best_modules]
+        }
+
+    def run(self) -> List[Dict[str, object]]:
+        """Run the benchmark and print a summary table."""
+        print("STARTUP BENCHMARK (python -X importtime, best of "
+              f"{self.repeat})")
+        print("=" * 72)
+        print(f"{'Module':<40} | {'Import ms':>9} | {'Modules':>7} | Heavy")
+        print("-" * 72)
+        results = []
+        for module in self.targets:
+            result = self.run_target(module)
+            results.append(result)
+            heavy = ', '.join(result['heavy_modules']) or '-'
+            print(f"{module:<40} | {result['import_us'] / 1000:>9.2f} | "
+                  f"{result['modules_loaded']:>7} | {heavy}")
+        return results
+
+
+def main():
+    """Main function."""
+    benchmark = StartupBenchmark()
+    benchmark.run()
+
+
+if __name__ == "__main__":
+    main()
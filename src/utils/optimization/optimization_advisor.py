@@ -36,14 +36,15 @@ class OptimizationAdvisor:
             "  - INDEX on students.room_id for JOIN operations",
             "  - INDEX on students.age for age-based queries",
             "  - INDEX on students.sex for gender-based queries",
-            "  - COMPOSITE INDEX on students.age, students.sex for combined queries"
+            "  - COMPOSITE INDEX on students.age, students.sex for combined queries",
+            "  - INDEX on students.name (case-insensitive) for prefix name searches"
         ])
 
     def _add_additional_recommendations(self):
         """Add additional optimization recommendations."""
         self.recommendations.extend([
             "Consider adding these indexes for specific use cases:",
-            "  - INDEX on students.name for name-based searches",
+            "  - ngram FULLTEXT INDEX on students.name for substring name searches (--name-fulltext)",
             "  - INDEX on rooms.number for room number searches",
             "  - COMPOSITE INDEX on rooms.building, rooms.number for building+room queries"
         ])
@@ -0,0 +1,8 @@
+"""
+Plans package for query plan snapshots and regression checks.
+"""
+
+from .query_plan_snapshot import QueryPlanSnapshot, QueryRecorder
+from .seeded_dataset import generate_seeded_dataset
+
+__all__ = ['QueryPlanSnapshot', 'QueryRecorder', 'generate_seeded_dataset']
@@ -0,0 +1,154 @@
+"""
+Query Plan Snapshot - Records the analysis query plans and flags regressions.
+"""
+
+import difflib
+import inspect
+import json
+import os
+import re
+from typing import Any, Dict, List, Optional, Tuple
+from src.data.enums import Constants
+from src.services.connections import DatabaseConnection
+from src.services.queries import StudentRoomQueryService
+
+
+class QueryRecorder(DatabaseConnection):
+    """Stand-in connection that records the SQL a query service would run."""
+
+    def __init__(self, dialect):
+        super().__init__()
+        self.dialect = dialect
+        self.queries: List[Tuple[str, Optional[tuple]]] = []
+
+    def connect(self):
+        pass
+
+    def disconnect(self):
+        pass
+
+    def execute(self, query: str, params: tuple = None):
+        self.queries.append((query, params))
+
+    def fetch_all(self, query: str, params: tuple = None, timeout: Optional[float] = None) -> List[tuple]:
+        self.queries.append((query, params))
+        return []
+
+
+class QueryPlanSnapshot:
+    """Normalized plans of every StudentRoomQueryService query.
+
+    ``capture`` explains each ``get_*`` query on a live connection and keeps
+    the table order, access type, key, estimated rows and the temp-table and
+    filesort flags. ``check`` compares them with the stored snapshot and
+    fails on regressions: a worse access type, a lost key, a new temporary
+    table or filesort, or a row estimate grown by more than
+    ``PLAN_ROWS_REGRESSION_FACTOR``.
+    """
+
+    def __init__(self, connection: DatabaseConnection, path: Optional[str] = None):
+        self.connection = connection
+        self.dialect = connection.dialect
+        self.path = path or os.path.join(Constants.PLAN_SNAPSHOT_DIR, f"{self.dialect.name}.json")
+
+    def recorded_queries(self) -> Dict[str, Tuple[str, Optional[tuple]]]:
+        """The SQL each query service method sends, keyed by method name."""
+        queries = {}
+        for name, method in inspect.getmembers(StudentRoomQueryService, inspect.isfunction):
+            if not name.startswith('get_'):
+                continue
+            recorder = QueryRecorder(self.dialect)
+            method(StudentRoomQueryService(recorder))
+            queries[name] = recorder.queries[-1]
+        return queries
+
+    def capture(self) -> Dict[str, Any]:
+        """Explain every query and return the snapshot document."""
+        for statement in self.dialect.analyze_statements():
+            self.connection.fetch_all(statement)
+        plans = {}
+        for name, (query, params) in self.recorded_queries().items():
+            rows = self.connection.fetch_all(self.dialect.explain_query(query), params)
+            plans[name] = {
+                'sql': re.sub(r'\s+', ' ', query).strip(),
+                'plan': self.dialect.normalize_plan(rows),
+            }
+        return {'backend': self.dialect.name, 'queries': plans}
+
+    def save(self, snapshot: Dict[str, Any]):
+        """Write the snapshot as stable, diff-friendly JSON."""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, 'w') as file:
+            json.dump(snapshot, file, indent=2, sort_keys=True)
+            file.write('\n')
+        print(f"✓ Saved {len(snapshot['queries'])} query plans to {self.path}")
+
+    def load(self) -> Dict[str, Any]:
+        """Read the stored snapshot."""
+        try:
+            with open(self.path) as file:
+                return json.load(file)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"No plan snapshot at {self.path}; run --mode plan-snapshot first")
+
+    def regressions(self, expected: Dict[str, Any], actual: Dict[str, Any]) -> List[str]:
+        """Human-readable reasons the actual plan is worse than the expected one."""
+        reasons = []
+        before = {table['table']: table for table in expected['tables']}
+        for table in actual['tables']:
+            old = before.get(table['table'])
+            alias = table['table']
+            if old is None:
+                reasons.append(f"{alias}: new table access ({table['access_type']})")
+                continue
+            if self.dialect.access_rank(table['access_type']) > self.dialect.access_rank(old['access_type']):
+                reasons.append(f"{alias}: access type {old['access_type']} -> {table['access_type']}")
+            if old['key'] and not table['key']:
+                reasons.append(f"{alias}: no longer uses key {old['key']}")
+            if old['rows'] and table['rows'] and \
+                    table['rows'] > old['rows'] * Constants.PLAN_ROWS_REGRESSION_FACTOR:
+                reasons.append(f"{alias}: estimated rows {old['rows']} -> {table['rows']}")
+        for flag, label in (('using_temporary', 'temporary table'), ('using_filesort', 'filesort')):
+            if actual[flag] and not expected[flag]:
+                reasons.append(f"now uses a {label}")
+        return reasons
+
+    def check(self, snapshot: Optional[Dict[str, Any]] = None) -> bool:
+        """Compare live plans with the stored snapshot; print a diff for each regression."""
+        stored = self.load()['queries']
+        current = (snapshot or self.capture())['queries']
+        regressed = False
+        print(f"\nQUERY PLAN CHECK ({self.path})")
+        print("=" * 60)
+        for name in sorted(set(stored) | set(current)):
+            if name not in stored:
+                print(f"{name}: NEW (not in snapshot)")
+                continue
+            if name not in current:
+                print(f"{name}: MISSING (query no longer exists)")
+                continue
+            expected, actual = stored[name]['plan'], current[name]['plan']
+            reasons = self.regressions(expected, actual)
+            if reasons:
+                regressed = True
+                print(f"{name}: REGRESSED")
+                for reason in reasons:
+                    print(f"  - {reason}")
+                print(self.format_diff(name, stored[name], current[name]))
+            elif expected != actual or stored[name]['sql'] != current[name]['sql']:
+                print(f"{name}: changed (no regression; refresh with --mode plan-snapshot)")
+            else:
+                print(f"{name}: ok")
+        print("=" * 60)
+        print("Plan regressions found" if regressed else "✓ No plan regressions")
+        return not regressed
+
+    @staticmethod
+    def format_diff(name: str, expected: Dict[str, Any], actual: Dict[str, Any]) -> str:
+        """Unified diff of the pretty-printed snapshot entries."""
+        old = json.dumps(expected, indent=2, sort_keys=True).splitlines()
+        new = json.dumps(actual, indent=2, sort_keys=True).splitlines()
+        diff = difflib.unified_diff(old, new, f"snapshot/{name}", f"current/{name}", lineterm='')
+        return "\n".join(f"    {line}" for line in diff)
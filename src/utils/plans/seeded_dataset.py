@@ -0,0 +1,41 @@
+"""
+Deterministic synthetic dataset for query plan snapshots.
+"""
+
+import random
+from typing import List, Tuple
+from src.data.enums import Building, Constants, Gender
+from src.data.models import Room, Student
+
+BUILDINGS = [building.value for building in Building]
+
+
+def generate_seeded_dataset(seed: int = Constants.PLAN_DATASET_SEED,
+                            room_count: int = Constants.PLAN_DATASET_ROOMS,
+                            student_count: int = Constants.PLAN_DATASET_STUDENTS) -> Tuple[List[Room], List[Student]]:
+    """Rooms spread over the buildings and students spread over the rooms.
+
+    The same seed always yields the same rows, so optimizer statistics, and
+    with them the plans, only change when the schema or the queries do.
+    """
+    rng = random.Random(seed)
+    rooms = [
+        Room(
+            id=room_id,
+            number=str(room_id),
+            building=BUILDINGS[room_id % len(BUILDINGS)],
+            capacity=rng.randint(1, 4)
+        )
+        for room_id in range(1, room_count + 1)
+    ]
+    students = [
+        Student(
+            id=student_id,
+            name=f"Student {student_id}",
+            age=rng.randint(17, 30),
+            sex=rng.choice((Gender.MALE.value, Gender.FEMALE.value)),
+            room_id=rng.randint(1, room_count)
+        )
+        for student_id in range(1, student_count + 1)
+    ]
+    return rooms, students
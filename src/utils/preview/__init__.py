@@ -3,5 +3,7 @@ Preview package for database preview utilities.
 """
 
 from .database_preview import DatabasePreview
+from .student_sampler import StudentSampler
+from .student_summary import StudentSummary
 
-__all__ = ['DatabasePreview']
+__all__ = ['DatabasePreview', 'StudentSampler', 'StudentSummary']
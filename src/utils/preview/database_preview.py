@@ -3,50 +3,88 @@
 Database Preview Script - Shows database structure and sample data.
 """
 
-import json
+from typing import Optional
+from src.data.enums import Constants
+from src.data.loaders import create_file_loader
+from .student_sampler import StudentSampler
+from .student_summary import StudentSummary
 
 
 class DatabasePreview:
-    """Preview of the database structure and data."""
+    """Preview of the database structure and data.
+
+    The default mode streams the students file once and reports exact
+    statistics. ``approximate=True`` reads only a sample bounded by
+    ``sample_size`` records and ``time_budget`` seconds (see StudentSampler).
+    """
     
-    def __init__(self):
-        self.students_data = []
+    def __init__(self, students_file: str = Constants.DEFAULT_STUDENTS_FILE,
+                 rooms_file: str = Constants.DEFAULT_ROOMS_FILE, approximate: bool = False,
+                 sample_size: int = Constants.PREVIEW_SAMPLE_SIZE,
+                 time_budget: float = Constants.PREVIEW_TIME_BUDGET, seed: Optional[int] = None):
+        self.students_file = students_file
+        self.rooms_file = rooms_file
+        self.approximate = approximate
+        self.sample_size = sample_size
+        self.time_budget = time_budget
+        self.seed = seed
         self.rooms_data = []
+        self.summary = StudentSummary()
+        self.total_students = 0
+        self.exact = True
         self.load_data()
     
     def load_data(self):
-        """Load data from JSON files."""
+        """Load rooms and summarize students in a single pass (or a sample)."""
         try:
-            with open('data/students.json', 'r') as f:
-                self.students_data = json.load(f)
-            with open('data/rooms.json', 'r') as f:
-                self.rooms_data = json.load(f)
+            self.rooms_data = create_file_loader(self.rooms_file).load()
+            if self.approximate:
+                sampler = StudentSampler(
+                    self.students_file, self.sample_size, self.time_budget, seed=self.seed
+                )
+                self.summary = sampler.sample()
+                self.total_students = sampler.estimated_total
+                self.exact = sampler.exact
+            else:
+                self.summary = StudentSummary(seed=self.seed)
+                for record in create_file_loader(self.students_file).iter_records():
+                    self.summary.add(record)
+                self.total_students = self.summary.count
         except Exception as e:
             print(f"Error loading data: {e}")
     
     def show_summary(self):
         """Show database summary."""
-        print(f"Database Summary: {len(self.students_data)} students, {len(self.rooms_data)} rooms")
-        
-        ages = [s['age'] for s in self.students_data]
-        male_count = len([s for s in self.students_data if s['sex'] == 'M'])
-        female_count = len([s for s in self.students_data if s['sex'] == 'F'])
-        
-        print(f"   Average age: {sum(ages) / len(ages):.1f}")
-        print(f"   Gender: {male_count}M, {female_count}F")
-        
-        room_occupancy = {}
-        for student in self.students_data:
-            room_id = student['room_id']
-            room_occupancy[room_id] = room_occupancy.get(room_id, 0) + 1
-        
-        print(f"   Occupied rooms: {len(room_occupancy)}/{len(self.rooms_data)}")
+        summary = self.summary
+        if self.exact:
+            print(f"Database Summary: {self.total_students} students, {len(self.rooms_data)} rooms")
+        else:
+            print(f"Database Summary: ~{self.total_students} students "
+                  f"(estimated from {summary.count} sampled), {len(self.rooms_data)} rooms")
+        if not summary.count:
+            return
+
+        if self.exact:
+            print(f"   Average age: {summary.mean:.1f} (std dev {summary.std_dev:.2f})")
+        else:
+            print(f"   Average age: {summary.mean:.1f} ± {summary.mean_margin():.2f} "
+                  f"(95%, std dev {summary.std_dev:.2f})")
+        print(f"   Age range: {summary.min_age}-{summary.max_age}")
+
+        if self.exact:
+            print(f"   Gender: {summary.male_count}M, {summary.female_count}F")
+            print(f"   Occupied rooms: {len(summary.occupied_rooms)}/{len(self.rooms_data)}")
+        else:
+            male_share = summary.male_count / summary.count
+            print(f"   Gender: ~{male_share:.0%} M, ~{summary.female_count / summary.count:.0%} F")
+            print(f"   Occupied rooms: at least {len(summary.occupied_rooms)}/{len(self.rooms_data)} (seen in sample)")
     
     def show_sample_data(self, limit=3):
         """Show sample data."""
-        print(f"\nSample Data (first {limit} records):")
+        label = "random sample" if self.summary.count > limit else "first records"
+        print(f"\nSample Data ({limit} records, {label}):")
         print("Rooms:", self.rooms_data[:limit])
-        print("Students:", self.students_data[:limit])
+        print("Students:", self.summary.rows[:limit])
     
     def show_schema(self):
         """Show database schema."""
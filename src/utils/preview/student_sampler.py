@@ -0,0 +1,118 @@
+"""
+Budgeted sampling of large student files for approximate previews.
+"""
+
+import os
+import random
+import time
+from typing import Optional
+from src.data.enums import Constants
+from src.data.loaders import NdjsonDataLoader, create_file_loader, detect_compression, is_ndjson
+from .student_summary import StudentSummary
+
+
+class StudentSampler:
+    """Estimate student statistics from part of a file.
+
+    NDJSON files are read in byte-range windows, one at a random offset in
+    each of ``windows`` equal slices of the file, visited in random order
+    until ``sample_size`` records are read or ``time_budget`` seconds pass.
+    A window holds the records whose line starts inside it, so the student
+    total is extrapolated from records per sampled byte. A JSON array, or
+    any compressed file, can only be read from the start: it is streamed
+    into a reservoir of ``sample_size`` records until the end or the time
+    budget. If the budget runs out first, the statistics cover the records
+    read so far and the total is extrapolated from records per byte of the
+    file on disk.
+    """
+
+    def __init__(self, file_path: str, sample_size: int = Constants.PREVIEW_SAMPLE_SIZE,
+                 time_budget: float = Constants.PREVIEW_TIME_BUDGET,
+                 windows: int = Constants.PREVIEW_SAMPLE_WINDOWS,
+                 window_bytes: int = Constants.PREVIEW_WINDOW_BYTES,
+                 sample_rows: int = 3, seed: Optional[int] = None):
+        self.file_path = file_path
+        self.sample_size = sample_size
+        self.time_budget = time_budget
+        self.windows = windows
+        self.window_bytes = window_bytes
+        self.summary = StudentSummary(sample_rows, seed)
+        self.estimated_total = 0
+        self.exact = False
+        self._random = random.Random(seed)
+
+    def sample(self) -> StudentSummary:
+        """Read the sample and return the statistics of the sampled records."""
+        if is_ndjson(self.file_path) and detect_compression(self.file_path) is None:
+            self._sample_byte_ranges()
+        else:
+            self._sample_records()
+        return self.summary
+
+    def _sample_records(self):
+        """Reservoir sample (Algorithm R) of a streamed file, stopped at the time budget.
+
+        Reads run ahead of decoding by up to a chunk, so the extrapolation
+        uses the records decoded before the latest read and the file
+        position before it.
+        """
+        loader = create_file_loader(self.file_path)
+        deadline = time.monotonic() + self.time_budget
+        records = loader.iter_records()
+        reservoir, seen, complete = [], 0, True
+        position, anchor_records, anchor_bytes = 0, 0, 0
+        try:
+            for record in records:
+                seen += 1
+                if loader.bytes_read != position:
+                    anchor_records, anchor_bytes = seen - 1, position
+                    position = loader.bytes_read
+                if len(reservoir) < self.sample_size:
+                    reservoir.append(record)
+                else:
+                    slot = self._random.randrange(seen)
+                    if slot < self.sample_size:
+                        reservoir[slot] = record
+                if time.monotonic() > deadline:
+                    complete = False
+                    break
+        finally:
+            records.close()
+
+        for record in reservoir:
+            self.summary.add(record)
+        if complete:
+            self.estimated_total = seen
+        elif anchor_bytes:
+            self.estimated_total = round(anchor_records * os.path.getsize(self.file_path) / anchor_bytes)
+        else:
+            self.estimated_total = round(seen * os.path.getsize(self.file_path) / position) if position else seen
+        self.exact = complete and seen <= self.sample_size
+
+    def _sample_byte_ranges(self):
+        """Byte-range windows spread over an NDJSON file."""
+        size = os.path.getsize(self.file_path)
+        stride = size // self.windows if self.windows else size
+        if stride <= self.window_bytes:
+            for record in NdjsonDataLoader(self.file_path).iter_records():
+                self.summary.add(record)
+            self.estimated_total = self.summary.count
+            self.exact = True
+            return
+
+        deadline = time.monotonic() + self.time_budget
+        starts = [
+            index * stride + self._random.randrange(stride - self.window_bytes + 1)
+            for index in range(self.windows)
+        ]
+        self._random.shuffle(starts)
+
+        sampled_bytes = 0
+        for start in starts:
+            if self.summary.count >= self.sample_size or time.monotonic() > deadline:
+                break
+            for record in NdjsonDataLoader(self.file_path, start, start + self.window_bytes).iter_records():
+                self.summary.add(record)
+            sampled_bytes += self.window_bytes
+
+        self.estimated_total = round(self.summary.count * size / sampled_bytes) if sampled_bytes else 0
@@ -0,0 +1,70 @@
+"""
+Single-pass student statistics for previews.
+"""
+
+import random
+from typing import Any, Dict, List, Optional
+from src.data.enums import Gender
+
+
+class StudentSummary:
+    """Running student statistics in constant memory (plus one id per occupied room).
+
+    Age mean and variance use Welford's update, so one pass over the records
+    is enough and no age list is kept. ``rows`` is a reservoir sample
+    (Algorithm R) of ``sample_rows`` records, uniform over everything added.
+    """
+
+    def __init__(self, sample_rows: int = 3, seed: Optional[int] = None):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min_age = None
+        self.max_age = None
+        self.male_count = 0
+        self.female_count = 0
+        self.occupied_rooms = set()
+        self.sample_rows = sample_rows
+        self.rows: List[Dict[str, Any]] = []
+        self._random = random.Random(seed)
+
+    def add(self, record: Dict[str, Any]):
+        """Fold one raw student record into the statistics."""
+        self.count += 1
+        age = record['age']
+        delta = age - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (age - self.mean)
+        self.min_age = age if self.min_age is None else min(self.min_age, age)
+        self.max_age = age if self.max_age is None else max(self.max_age, age)
+
+        sex = record['sex']
+        if sex == Gender.MALE.value:
+            self.male_count += 1
+        elif sex == Gender.FEMALE.value:
+            self.female_count += 1
+        if record.get('room_id') is not None:
+            self.occupied_rooms.add(record['room_id'])
+
+        if len(self.rows) < self.sample_rows:
+            self.rows.append(record)
+        else:
+            slot = self._random.randrange(self.count)
+            if slot < self.sample_rows:
+                self.rows[slot] = record
+
+    @property
+    def variance(self) -> float:
+        """Population variance of the ages."""
+        return self.m2 / self.count if self.count else 0.0
+
+    @property
+    def std_dev(self) -> float:
+        """Population standard deviation of the ages."""
+        return self.variance ** 0.5
+
+    def mean_margin(self, z: float = 1.96) -> float:
+        """Half-width of the confidence interval of the mean when the records are a sample."""
+        if self.count < 2:
+            return 0.0
+        return z * (self.m2 / (self.count - 1)) ** 0.5 / self.count ** 0.5
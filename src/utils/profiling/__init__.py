@@ -0,0 +1,7 @@
+"""
+Profiling package for stage-level CPU and memory profiling.
+"""
+
+from .stage_profiler import StageProfiler
+
+__all__ = ['StageProfiler']
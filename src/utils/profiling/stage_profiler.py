@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Stage Profiler - Opt-in wall/CPU/memory profiling of application stages.
+
+Each profiled stage records wall time, CPU time of the thread that ran it,
+tracemalloc current/peak memory and the top allocation sites, and can dump a
+cProfile file. Profiles are written as JSON and compared with ``diff``:
+
+    python src/utils/profiling/stage_profiler.py old.json new.json
+
+Stages that overlap (pipeline stages run concurrently) share one tracemalloc
+peak window, so their peaks include each other's allocations. tracemalloc
+runs only while at least one stage is open. A stage nested in another on the
+same thread pauses the outer stage's cProfile, so each dump covers only the
+code outside the stages nested in it. When the profiler is disabled
+``stage()`` returns a shared no-op context manager.
+"""
+
+import cProfile
+import contextlib
+import json
+import os
+import re
+import sys
+import threading
+import time
+import tracemalloc
+from typing import Dict, Optional
+
+_NULL_STAGE = contextlib.nullcontext()
+
+
+class StageProfiler:
+    """Collects per-stage profiles and writes them as JSON."""
+
+    def __init__(self, enabled: bool = False, cprofile_dir: Optional[str] = None,
+                 top_allocations: int = 5):
+        self.enabled = enabled
+        self.cprofile_dir = cprofile_dir
+        self.top_allocations = top_allocations
+        self.stages: Dict[str, dict] = {}
+        self._active = 0
+        self._started_tracing = False
+        self._lock = threading.Lock()
+        self._thread = threading.local()
+
+    def stage(self, name: str):
+        """Return a context manager profiling the named stage."""
+        if not self.enabled:
+            return _NULL_STAGE
+        return self._profile(name)
+
+    @contextlib.contextmanager
+    def _profile(self, name: str):
+        with self._lock:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+            if self._active == 0:
+                tracemalloc.reset_peak()
+            self._active += 1
+        start_memory = tracemalloc.get_traced_memory()[0]
+        start_snapshot = tracemalloc.take_snapshot() if self.top_allocations else None
+        profile = self._start_cprofile()
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall_start
+            cpu = time.thread_time() - cpu_start
+            current, peak = tracemalloc.get_traced_memory()
+            record = {
+                'wall_s': round(wall, 6),
+                'cpu_s': round(cpu, 6),
+                'mem_start_kb': round(start_memory / 1024, 1),
+                'mem_end_kb': round(current / 1024, 1),
+                'mem_peak_kb': round(peak / 1024, 1),
+                'top_allocations': self._top_allocations(start_snapshot),
+            }
+            if profile is not None:
+                record['cprofile'] = self._stop_cprofile(profile, name)
+            with self._lock:
+                self._active -= 1
+                self.stages[name] = record
+                if self._active == 0 and self._started_tracing:
+                    tracemalloc.stop()
+                    self._started_tracing = False
+
+    def _start_cprofile(self) -> Optional[cProfile.Profile]:
+        """Start a cProfile for the current thread, pausing the enclosing stage's."""
+        if not self.cprofile_dir:
+            return None
+        stack = self._thread.__dict__.setdefault('profiles', [])
+        if stack:
+            stack[-1].disable()
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            if stack:
+                stack[-1].enable()
+            return None
+        stack.append(profile)
+        return profile
+
+    def _stop_cprofile(self, profile: cProfile.Profile, name: str) -> str:
+        """Stop and dump a stage's cProfile, then resume the enclosing stage's.
+
+        Disabling any profiler clears the thread's profile hook, so the outer
+        profiler is only resumed after the dump. Returns the dump path.
+        """
+        profile.disable()
+        stack = self._thread.profiles
+        stack.pop()
+        try:
+            return self._dump_cprofile(profile, name)
+        finally:
+            if stack:
+                stack[-1].enable()
+
+    def _dump_cprofile(self, profile: cProfile.Profile, name: str) -> str:
+        """Write a stage's cProfile stats and return the file path."""
+        os.makedirs(self.cprofile_dir, exist_ok=True)
+        path = os.path.join(self.cprofile_dir, re.sub(r'[^\w.-]', '_', name) + '.prof')
+        profile.dump_stats(path)
+        return path
+
+    def _top_allocations(self, start_snapshot) -> list:
+        """Return the allocation sites that grew most during the stage."""
+        if start_snapshot is None:
+            return []
+        differences = tracemalloc.take_snapshot().compare_to(start_snapshot, 'lineno')
+        return [
+            {
+                'site': str(difference.traceback[0]),
+                'size_kb': round(difference.size_diff / 1024, 1),
+                'count': difference.count_diff
+            }
+            for difference in differences[:self.top_allocations]
+            if difference.size_diff > 0
+        ]
+
+    def to_dict(self) -> dict:
+        """Return the profile as a JSON-serializable dictionary."""
+        return {
+            'python': sys.version.split()[0],
+            'recorded_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'stages': self.stages
+        }
+
+    def write(self, path: str):
+        """Write the profile as JSON."""
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(self.to_dict(), file, indent=2, sort_keys=True)
+        print(f"Stage profile written to {path}")
+
+    @staticmethod
+    def diff(old_path: str, new_path: str) -> str:
+        """Format a stage-by-stage comparison of two profile files."""
+        with open(old_path, encoding='utf-8') as file:
+            old = json.load(file)['stages']
+        with open(new_path, encoding='utf-8') as file:
+            new = json.load(file)['stages']
+
+        header = f"{'Stage':<44} | {'Wall old':>9} | {'Wall new':>9} | {'Change':>7} | {'Peak KB old':>11} | {'Peak KB new':>11}"
+        rows = []
+        for name in sorted(old.keys() | new.keys()):
+            before, after = old.get(name), new.get(name)
+            wall_old = f"{before['wall_s']:.3f}" if before else '-'
+            wall_new = f"{after['wall_s']:.3f}" if after else '-'
+            change = '-'
+            if before and after and before['wall_s']:
+                change = f"{(after['wall_s'] / before['wall_s'] - 1) * 100:+.0f}%"
+            peak_old = f"{before['mem_peak_kb']:.0f}" if before else '-'
+            peak_new = f"{after['mem_peak_kb']:.0f}" if after else '-'
+            rows.append(f"{name:<44} | {wall_old:>9} | {wall_new:>9} | {change:>7} | {peak_old:>11} | {peak_new:>11}")
+        separator = "-" * len(header)
+        return f"\nSTAGE PROFILE DIFF\n{separator}\n{header}\n{separator}\n" + "\n".join(rows)
+
+
+def main():
+    """Main function."""
+    if len(sys.argv) != 3:
+        print("Usage: stage_profiler.py OLD_PROFILE.json NEW_PROFILE.json")
+        sys.exit(2)
+    print(StageProfiler.diff(sys.argv[1], sys.argv[2]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Tests for incremental updates and reconciliation of the age ranking index.
+"""
+
+import io
+import random
+import unittest
+from contextlib import redirect_stdout
+from src.data.models import Room, Student, StudentEvent
+from src.services.connections import SQLiteConnection
+from src.services.database import DatabaseManager
+from src.services.queries import StudentRoomQueryService
+from src.services.rankings import AgeRankingIndex
+
+ROOMS = [Room(room_id, str(100 + room_id), 'ABC'[room_id % 3], 4) for room_id in range(1, 13)]
+
+
+def random_students(seed: int, count: int = 40):
+    rng = random.Random(seed)
+    return [Student(student_id, f"Student {student_id}", rng.randint(17, 35), rng.choice('MF'),
+                    rng.choice([None] + [room.id for room in ROOMS]))
+            for student_id in range(1, count + 1)]
+
+
+def expected_aggregates(students):
+    ages = {}
+    for student in students:
+        if student.room_id is not None:
+            ages.setdefault(student.room_id, []).append(student.age)
+    return {room_id: (len(values), sum(values), min(values), max(values)) for room_id, values in ages.items()}
+
+
+def index_aggregates(index: AgeRankingIndex):
+    return {room_id: (aggregate.count, aggregate.age_sum, aggregate.min_age, aggregate.max_age)
+            for room_id, aggregate in index.aggregates.items() if aggregate.count}
+
+
+class AgeRankingIndexApplyTest(unittest.TestCase):
+
+    def test_insert_move_and_remove_keep_aggregates_exact(self):
+        students = random_students(1)
+        index = AgeRankingIndex(ROOMS, students)
+        rng = random.Random(2)
+        for _ in range(20):
+            events = []
+            for student in rng.sample(students, 5):
+                if student.room_id is not None and rng.random() < 0.3:
+                    events.append(StudentEvent.remove(student.id))
+                    students.remove(student)
+                else:
+                    student.room_id = rng.choice(ROOMS).id
+                    events.append(StudentEvent.move(student.id, student.room_id))
+            index.apply(events)
+            self.assertEqual(index_aggregates(index), expected_aggregates(students))
+
+    def test_rankings_follow_updates(self):
+        index = AgeRankingIndex(ROOMS, [
+            Student(1, 'a', 20, 'M', 1), Student(2, 'b', 30, 'M', 1),
+            Student(3, 'c', 18, 'F', 2), Student(4, 'd', 25, 'F', 3),
+        ])
+        self.assertEqual([row[0] for row in index.get_top_rooms_by_avg_age(3)], [2, 1, 3])
+        self.assertEqual(index.get_top_rooms_by_age_difference(1)[0][4:], (10, 20, 30))
+
+        index.apply([StudentEvent.move(3, 3), StudentEvent.remove(2)])
+        self.assertEqual([row[0] for row in index.get_top_rooms_by_avg_age(3)], [1, 3])
+        self.assertEqual(index.get_top_rooms_by_age_difference(3)[0][:5], (3, '103', 'A', 2, 7))
+
+    def test_moving_an_unknown_student_is_rejected(self):
+        index = AgeRankingIndex(ROOMS)
+        with self.assertRaises(KeyError):
+            index.apply([StudentEvent.move(99, 1)])
+
+    def test_stale_heap_entries_are_compacted(self):
+        index = AgeRankingIndex(ROOMS, [Student(1, 'a', 20, 'M', 1)])
+        for step in range(500):
+            index.apply([StudentEvent.move(1, ROOMS[step % len(ROOMS)].id)])
+        self.assertLessEqual(len(index.avg_heap), 2 * len(index.versions) + 64)
+        self.assertEqual(len(index.get_top_rooms_by_avg_age(10)), 1)
+
+
+class AgeRankingIndexReconcileTest(unittest.TestCase):
+
+    def setUp(self):
+        self.connection = SQLiteConnection()
+        with redirect_stdout(io.StringIO()):
+            self.connection.connect()
+            self.manager = DatabaseManager(self.connection)
+            self.manager.create_schema()
+            self.manager.insert_rooms(ROOMS)
+            self.manager.insert_students(random_students(3))
+        self.query_service = StudentRoomQueryService(self.connection)
+
+    def tearDown(self):
+        with redirect_stdout(io.StringIO()):
+            self.connection.disconnect()
+
+    def build_index(self):
+        return AgeRankingIndex(ROOMS, self.manager.student_repository.get_all(), query_service=self.query_service,
+                               student_repository=self.manager.student_repository)
+
+    def test_index_built_from_the_table_is_consistent(self):
+        report = self.build_index().reconcile(limit=100)
+        self.assertTrue(report['consistent'], report)
+        self.assertEqual(report['mismatched_rooms'], [])
+
+    def test_drift_is_reported_and_repaired(self):
+        index = self.build_index()
+        self.connection.execute("UPDATE students SET age = age + 7 WHERE room_id = 1")
+        with redirect_stdout(io.StringIO()):
+            report = index.reconcile(limit=100)
+        self.assertFalse(report['consistent'])
+        self.assertEqual(report['mismatched_rooms'], [1])
+
+        with redirect_stdout(io.StringIO()):
+            index.reconcile(limit=100, repair=True)
+        self.assertTrue(index.reconcile(limit=100)['consistent'])
+
+    def test_published_events_keep_the_index_consistent(self):
+        index = self.build_index()
+        self.manager.add_event_listener(index.apply)
+        with redirect_stdout(io.StringIO()):
+            self.manager.insert_students([Student(100, 'New', 19, 'F', 5), Student(101, 'Newer', 33, 'M', 6)])
+        self.assertTrue(index.reconcile(limit=100)['consistent'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+"""
+Tests for bulk loads with deferred index builds on SQLite.
+"""
+
+import io
+import unittest
+from contextlib import redirect_stdout
+from src.data.models import Room, Student
+from src.services.connections import SQLiteConnection
+from src.services.database import DatabaseManager
+
+
+class BulkLoadTest(unittest.TestCase):
+
+    def setUp(self):
+        self.output = io.StringIO()
+        self.connection = SQLiteConnection()
+        with redirect_stdout(self.output):
+            self.connection.connect()
+        self.addCleanup(self.disconnect)
+        self.manager = DatabaseManager(self.connection)
+
+    def disconnect(self):
+        with redirect_stdout(self.output):
+            self.connection.disconnect()
+
+    def run_quietly(self, action, *args):
+        with redirect_stdout(self.output):
+            return action(*args)
+
+    def indexes(self):
+        rows = self.connection.fetch_all("SELECT name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL")
+        return {row[0] for row in rows}
+
+    def foreign_keys(self) -> int:
+        return self.connection.fetch_all("PRAGMA foreign_keys")[0][0]
+
+    def test_indexes_are_built_after_the_load(self):
+        self.run_quietly(self.manager.create_schema, True)
+        self.assertEqual(self.indexes(), set())
+        self.assertEqual(self.foreign_keys(), 0)
+        self.assertEqual(len(self.manager.deferred_statements), 7)
+
+        self.run_quietly(self.manager.insert_rooms, [Room(1, '101', 'A', 2)])
+        self.run_quietly(self.manager.insert_students, [Student(1, 'Ann', 20, 'F', 1)])
+        self.run_quietly(self.manager.finish_bulk_load)
+        self.assertTrue({'idx_building', 'idx_capacity', 'idx_room_id', 'idx_name'} <= self.indexes())
+        self.assertEqual(self.foreign_keys(), 1)
+        self.assertFalse(self.manager.bulk_loading)
+
+    def test_orphaned_students_fail_the_load(self):
+        self.run_quietly(self.manager.create_schema, True)
+        self.run_quietly(self.manager.insert_rooms, [Room(1, '101', 'A', 2)])
+        self.run_quietly(self.manager.insert_students, [Student(1, 'Ann', 20, 'F', 7)])
+        with self.assertRaisesRegex(ValueError, r"missing room\(s\): 7 \(1 students\)"):
+            self.run_quietly(self.manager.finish_bulk_load)
+        self.assertEqual(self.foreign_keys(), 1)
+
+    def test_existing_tables_keep_their_indexes(self):
+        self.run_quietly(self.manager.create_schema)
+        before = self.indexes()
+        manager = DatabaseManager(self.connection)
+        self.run_quietly(manager.create_schema, True)
+        self.assertEqual(manager.deferred_statements, [])
+        self.assertEqual(self.indexes(), before)
+        self.run_quietly(manager.finish_bulk_load)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+"""
+Tests for replacing broken connections in the query server's pool.
+"""
+
+import io
+import unittest
+from contextlib import redirect_stdout
+from typing import List, Optional
+from src.services.connections import DatabaseConnection, QueryTimeoutError
+from src.services.server import ConnectionPool
+
+
+class FakeConnection(DatabaseConnection):
+    """Connection whose connect fails while ``refuse`` is set."""
+
+    refuse = False
+
+    def __init__(self):
+        super().__init__()
+        self.connected = False
+
+    def connect(self):
+        if FakeConnection.refuse:
+            raise ConnectionError("server unavailable")
+        self.connected = True
+
+    def disconnect(self):
+        self.connected = False
+
+    def execute(self, query: str, params: tuple = None):
+        pass
+
+    def fetch_all(self, query: str, params: tuple = None, timeout: Optional[float] = None) -> List[tuple]:
+        return []
+
+
+class ConnectionPoolTest(unittest.TestCase):
+
+    def setUp(self):
+        FakeConnection.refuse = False
+        self.addCleanup(setattr, FakeConnection, 'refuse', False)
+        self.pool = ConnectionPool(FakeConnection, size=1)
+        self.pool.open()
+
+    def fail(self, error: Exception):
+        with self.assertRaises(type(error)), self.pool.acquire(timeout=1) as service:
+            raise error
+        return service
+
+    def test_failed_query_gets_a_fresh_connection(self):
+        broken = self.fail(RuntimeError("lost connection"))
+        self.assertFalse(broken.connection.connected)
+        with self.pool.acquire(timeout=1) as service:
+            self.assertIsNot(service, broken)
+            self.assertTrue(service.connection.connected)
+        self.assertEqual(self.pool._services, [service])
+
+    def test_timeout_keeps_the_connection(self):
+        timed_out = self.fail(QueryTimeoutError("SELECT 1", 1.0))
+        with self.pool.acquire(timeout=1) as service:
+            self.assertIs(service, timed_out)
+
+    def test_failed_reconnect_never_hands_out_the_broken_connection(self):
+        FakeConnection.refuse = True
+        with redirect_stdout(io.StringIO()):
+            broken = self.fail(RuntimeError("lost connection"))
+        with self.assertRaises(ConnectionError), self.pool.acquire(timeout=1):
+            pass
+        FakeConnection.refuse = False
+        with self.pool.acquire(timeout=1) as service:
+            self.assertIsNot(service, broken)
+            self.assertTrue(service.connection.connected)
+
+
+if __name__ == '__main__':
+    unittest.main()
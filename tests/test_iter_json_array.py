@@ -0,0 +1,102 @@
+"""
+Tests for the incremental JSON array parser.
+"""
+
+import io
+import json
+import unittest
+from src.data.loaders import iter_json_array
+
+DOCUMENT = json.dumps([
+    {'id': 1, 'name': 'Ann [x], "y"', 'tags': [1, [2, 3]], 'room_id': None},
+    12345,
+    -0.5e3,
+    'a string with \\ and é and 😀',
+    float('-inf'),
+    1.5e-7,
+    False,
+    [],
+    {},
+    True,
+    None,
+], indent=1)
+
+
+def parse(text: str, chunk_chars: int):
+    return list(iter_json_array(io.StringIO(text), 'test.json', chunk_chars=chunk_chars))
+
+
+class IterJsonArrayTest(unittest.TestCase):
+
+    def test_every_chunk_boundary(self):
+        expected = json.loads(DOCUMENT)
+        for chunk_chars in range(1, len(DOCUMENT) + 2):
+            with self.subTest(chunk_chars=chunk_chars):
+                self.assertEqual(parse(DOCUMENT, chunk_chars), expected)
+
+    def test_numbers_split_across_chunks(self):
+        text = '[1234567, 89, 1.25e10]'
+        for chunk_chars in range(1, len(text) + 1):
+            with self.subTest(chunk_chars=chunk_chars):
+                self.assertEqual(parse(text, chunk_chars), [1234567, 89, 1.25e10])
+
+    def test_empty_arrays_and_whitespace(self):
+        for text in ('[]', ' \n[ ]\n ', '\t[\n]\t'):
+            for chunk_chars in (1, 2, 64):
+                with self.subTest(text=text, chunk_chars=chunk_chars):
+                    self.assertEqual(parse(text, chunk_chars), [])
+
+    def test_trailing_whitespace_is_accepted(self):
+        self.assertEqual(parse('[1, 2]   \n\n', 1), [1, 2])
+
+    def test_trailing_data_is_rejected(self):
+        for text, position in (('[1,2] x', 6), ('[1,2]\n\n]', 7), ('[][]', 2), ('[1]  0', 5)):
+            for chunk_chars in (1, 3, 64):
+                with self.subTest(text=text, chunk_chars=chunk_chars):
+                    with self.assertRaisesRegex(ValueError, f"extra data at char {position}"):
+                        parse(text, chunk_chars)
+
+    def test_invalid_documents_are_rejected(self):
+        cases = {
+            '{"id": 1}': "Expected list",
+            '[1 2]': "expected ',' or ']'",
+            '[1, 2': "unexpected end of data",
+            '[1,]': "Invalid JSON",
+            '[{"id": 1,}]': "Invalid JSON",
+            '': "unexpected end of data",
+        }
+        for text, message in cases.items():
+            for chunk_chars in (1, 4, 64):
+                with self.subTest(text=text, chunk_chars=chunk_chars):
+                    with self.assertRaisesRegex(ValueError, message):
+                        parse(text, chunk_chars)
+
+    def test_malformed_element_fails_without_reading_ahead(self):
+        text = '[{"id": 1}, {"id": 2 "name": "x"}, ' + ', '.join(['{"id": 3}'] * 10000) + ']'
+        stream = io.StringIO(text)
+        with self.assertRaisesRegex(ValueError, "Expecting ',' delimiter at char 21"):
+            list(iter_json_array(stream, 'test.json', chunk_chars=64))
+        self.assertLessEqual(stream.tell(), 128)
+
+    def test_large_element_is_decoded_a_logarithmic_number_of_times(self):
+        reads = []
+
+        class CountingReader(io.StringIO):
+            def read(self, size=-1):
+                reads.append(size)
+                return super().read(size)
+
+        element = {'name': 'x' * 200_000}
+        records = iter_json_array(CountingReader(json.dumps([element, 1])), 'test.json', chunk_chars=100)
+        self.assertEqual(list(records), [element, 1])
+        self.assertLess(len(reads), 30)
+
+    def test_records_stream_before_the_end(self):
+        records = iter_json_array(io.StringIO('[1, 2, 3'), 'test.json', chunk_chars=2)
+        self.assertEqual([next(records), next(records)], [1, 2])
+        with self.assertRaises(ValueError):
+            list(records)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+"""
+Tests for the log-linear latency histogram bucket math.
+"""
+
+import random
+import unittest
+from src.utils.benchmarks.latency_histogram import BUCKET_COUNT, SUB_BUCKETS, LatencyHistogram
+
+
+class LatencyHistogramTest(unittest.TestCase):
+
+    def test_small_values_are_exact(self):
+        for value in range(SUB_BUCKETS):
+            self.assertEqual(LatencyHistogram._index(value), value)
+            self.assertEqual(LatencyHistogram._value(value), value)
+
+    def test_bucket_midpoint_is_within_one_percent(self):
+        rng = random.Random(3)
+        values = list(range(SUB_BUCKETS, 20_000)) + [rng.randrange(1, 1 << 39) for _ in range(20_000)]
+        for value in values:
+            midpoint = LatencyHistogram._value(LatencyHistogram._index(value))
+            self.assertLessEqual(abs(midpoint - value) / value, 1 / 128, value)
+
+    def test_indexes_are_monotone_and_contiguous(self):
+        previous = 0
+        for value in range(1, 1 << 16):
+            index = LatencyHistogram._index(value)
+            self.assertIn(index - previous, (0, 1), value)
+            previous = index
+        for shift in range(16, 40):
+            self.assertGreaterEqual(LatencyHistogram._index(1 << shift), previous)
+            previous = LatencyHistogram._index(1 << shift)
+
+    def test_indexes_stay_in_range(self):
+        self.assertEqual(LatencyHistogram._index((1 << 39) - 1), BUCKET_COUNT - 1)
+        self.assertEqual(LatencyHistogram._index(1 << 60), BUCKET_COUNT - 1)
+
+    def test_percentiles(self):
+        histogram = LatencyHistogram()
+        for us in range(1, 10_001):
+            histogram.record(us / 1_000_000)
+        self.assertEqual(histogram.count, 10_000)
+        for percent in (1, 50, 90, 99):
+            with self.subTest(percent=percent):
+                self.assertAlmostEqual(histogram.percentile(percent), percent / 10, delta=percent / 10 / 128)
+        self.assertEqual(histogram.percentile(100), 10.0)
+        self.assertAlmostEqual(histogram.mean_ms, 5.0005)
+        self.assertEqual(histogram.max_ms, 10.0)
+
+    def test_percentile_is_capped_at_max(self):
+        histogram = LatencyHistogram()
+        histogram.record(0.000129)
+        self.assertEqual(histogram.percentile(50), 0.129)
+
+    def test_merge(self):
+        left, right, both = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+        for us in range(0, 3000, 7):
+            (left if us % 2 else right).record(us / 1_000_000)
+            both.record(us / 1_000_000)
+        left.merge(right)
+        self.assertEqual(left.counts, both.counts)
+        self.assertEqual((left.count, left.total_us, left.max_us, left.min_us),
+                         (both.count, both.total_us, both.max_us, both.min_us))
+
+    def test_empty_histogram(self):
+        histogram = LatencyHistogram()
+        self.assertEqual((histogram.percentile(50), histogram.mean_ms, histogram.max_ms), (0.0, 0.0, 0.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
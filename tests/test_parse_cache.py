@@ -0,0 +1,123 @@
+"""
+Tests for parse cache hits and invalidation.
+"""
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from src.data.cache import ParseCache
+from src.data.models import Room, Student, StudentBatch
+
+
+def parse_students(path: str) -> StudentBatch:
+    batch = StudentBatch()
+    with open(path, encoding='utf-8') as file:
+        for line in file:
+            student_id, name, age, sex, room_id = line.rstrip('\n').split(',')
+            batch.append(Student(int(student_id), name, int(age), sex, int(room_id) if room_id else None))
+    return batch
+
+
+def parse_rooms(path: str):
+    with open(path, encoding='utf-8') as file:
+        return [Room(int(room_id), number, building, int(capacity))
+                for room_id, number, building, capacity in (line.rstrip('\n').split(',') for line in file)]
+
+
+class ParseCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.cache = ParseCache(os.path.join(self.directory, 'cache'))
+        self.source = os.path.join(self.directory, 'students.csv')
+        self.write_source('1,Ann Żak,20,F,3\n2,Bob,21,M,\n')
+        self.parses = 0
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def write_source(self, text: str, mtime_ns: int = None):
+        with open(self.source, 'w', encoding='utf-8') as file:
+            file.write(text)
+        if mtime_ns is not None:
+            os.utime(self.source, ns=(mtime_ns, mtime_ns))
+
+    def counting_parse(self, path: str) -> StudentBatch:
+        self.parses += 1
+        return parse_students(path)
+
+    def load(self) -> StudentBatch:
+        return self.cache.load_students(self.source, self.counting_parse)
+
+    def entry_path(self) -> str:
+        return self.cache._entry_path(self.source, 'students')
+
+    def test_second_load_is_a_hit_with_identical_columns(self):
+        first = self.load()
+        second = self.load()
+        self.assertEqual((self.parses, self.cache.hits, self.cache.misses), (1, 1, 1))
+        self.assertEqual(second, first)
+        self.assertEqual(second.to_models()[1].room_id, None)
+
+    def test_rooms_round_trip(self):
+        path = os.path.join(self.directory, 'rooms.csv')
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write('1,101,A,2\n2,102,B,3\n')
+        first = self.cache.load_rooms(path, parse_rooms)
+        self.assertEqual(self.cache.load_rooms(path, parse_rooms), first)
+        self.assertEqual(self.cache.hits, 1)
+
+    def test_changed_content_is_reparsed(self):
+        self.load()
+        self.write_source('1,Ann Żak,20,F,3\n2,Bob,22,M,\n', mtime_ns=os.stat(self.source).st_mtime_ns + 10 ** 9)
+        self.assertEqual(list(self.load().ages), [20, 22])
+        self.assertEqual(self.parses, 2)
+
+    def test_changed_size_is_reparsed(self):
+        self.load()
+        self.write_source('1,Ann Żak,20,F,3\n2,Bob,21,M,\n3,Cy,19,M,1\n')
+        self.assertEqual(len(self.load()), 3)
+        self.assertEqual(self.parses, 2)
+
+    def test_touched_file_with_same_content_is_a_hit(self):
+        self.load()
+        mtime_ns = os.stat(self.source).st_mtime_ns + 10 ** 9
+        os.utime(self.source, ns=(mtime_ns, mtime_ns))
+        self.load()
+        self.assertEqual(self.parses, 1)
+        self.assertEqual(self.cache._open(self.entry_path())[0]['mtime_ns'], mtime_ns)
+
+    def test_corrupt_entries_are_discarded(self):
+        self.load()
+        with open(self.entry_path(), 'r+b') as file:
+            file.write(b'NOTCACHE')
+        with redirect_stdout(io.StringIO()) as output:
+            self.assertEqual(len(self.load()), 2)
+        self.assertIn("Discarding parse cache entry", output.getvalue())
+        self.assertEqual(self.parses, 2)
+
+        size = os.path.getsize(self.entry_path())
+        with open(self.entry_path(), 'r+b') as file:
+            file.truncate(size - 16)
+        with redirect_stdout(io.StringIO()):
+            self.assertEqual(len(self.load()), 2)
+        self.assertEqual(self.parses, 3)
+        self.assertEqual(len(self.load()), 2)
+        self.assertEqual(self.parses, 3)
+
+    def test_least_recently_used_entries_are_evicted(self):
+        self.load()
+        first_entry = self.entry_path()
+        self.cache.max_bytes = os.path.getsize(first_entry) + 1
+        other = os.path.join(self.directory, 'other.csv')
+        shutil.copy(self.source, other)
+        self.cache.load_students(other, parse_students)
+        self.assertFalse(os.path.exists(first_entry))
+        self.assertTrue(os.path.exists(self.cache._entry_path(other, 'students')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+"""
+Tests for the staged load pipeline scheduler.
+"""
+
+import io
+import threading
+import unittest
+from contextlib import redirect_stdout
+from src.application import StudentRoomAnalyzer
+from src.services.pipeline import PipelineScheduler, PipelineStage, SerializedOutput
+
+
+class PipelineSchedulerTest(unittest.TestCase):
+
+    def run_pipeline(self, scheduler: PipelineScheduler, timeout: float = 10):
+        """Run the scheduler on a helper thread so a hang fails the test instead of blocking it."""
+        outcome = {}
+
+        def target():
+            try:
+                with redirect_stdout(io.StringIO()):
+                    outcome['results'] = scheduler.run()
+            except BaseException as e:
+                outcome['error'] = e
+
+        thread = threading.Thread(target=target, daemon=True)
+        thread.start()
+        thread.join(timeout)
+        self.assertFalse(thread.is_alive(), "pipeline did not finish")
+        return outcome
+
+    def test_stages_run_after_their_dependencies(self):
+        order = []
+        stages = [
+            PipelineStage('c', lambda: order.append('c') or 3, ['a', 'b']),
+            PipelineStage('a', lambda: order.append('a') or 1),
+            PipelineStage('b', lambda: order.append('b') or 2, ['a']),
+        ]
+        outcome = self.run_pipeline(PipelineScheduler(stages))
+        self.assertEqual(outcome['results'], {'a': 1, 'b': 2, 'c': 3})
+        self.assertEqual(order, ['a', 'b', 'c'])
+
+    def test_failure_cancels_and_skips_dependents(self):
+        ran = []
+
+        def fail():
+            raise ValueError("stage failed")
+
+        scheduler = PipelineScheduler([
+            PipelineStage('fail', fail),
+            PipelineStage('after', lambda: ran.append('after'), ['fail']),
+        ])
+        outcome = self.run_pipeline(scheduler)
+        self.assertIsInstance(outcome['error'], ValueError)
+        self.assertTrue(scheduler.cancelled.is_set())
+        self.assertEqual(ran, [])
+
+    def test_blocked_producer_gives_up_when_the_consumer_fails(self):
+        analyzer = StudentRoomAnalyzer()
+        produced = []
+
+        def produce():
+            for batch in range(1000):
+                analyzer._hand_off(batch)
+                produced.append(batch)
+
+        def consume():
+            analyzer.student_batches.get()
+            raise ValueError("insert failed")
+
+        scheduler = PipelineScheduler([
+            PipelineStage('parse_students', produce),
+            PipelineStage('insert_students', consume),
+        ], cancelled=analyzer.cancelled)
+        outcome = self.run_pipeline(scheduler)
+        self.assertIsInstance(outcome['error'], ValueError)
+        self.assertLess(len(produced), 1000)
+
+    def test_invalid_graphs_are_rejected(self):
+        with self.assertRaisesRegex(ValueError, "unknown stage 'missing'"):
+            PipelineScheduler([PipelineStage('a', lambda: None, ['missing'])])
+        with self.assertRaisesRegex(ValueError, "cycle"):
+            PipelineScheduler([PipelineStage('a', lambda: None, ['b']), PipelineStage('b', lambda: None, ['a'])])
+
+
+class SerializedOutputTest(unittest.TestCase):
+
+    def test_partial_lines_from_threads_are_not_interleaved(self):
+        target = io.StringIO()
+        output = SerializedOutput(target)
+        barrier = threading.Barrier(4)
+
+        def write(name: str):
+            barrier.wait()
+            for index in range(200):
+                output.write(f"{name} line ")
+                output.write(f"{index}\n")
+
+        threads = [threading.Thread(target=write, args=(name,)) for name in 'abcd']
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        output.close()
+        lines = target.getvalue().splitlines()
+        self.assertEqual(len(lines), 800)
+        for line in lines:
+            self.assertRegex(line, r'^[abcd] line \d+$')
+
+
+if __name__ == '__main__':
+    unittest.main()
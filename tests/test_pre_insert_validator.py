@@ -0,0 +1,79 @@
+"""
+Tests for the pre-insert checks of parsed rooms and student batches.
+"""
+
+import io
+import unittest
+from contextlib import redirect_stdout
+from src.data.enums import DuplicatePolicy
+from src.data.loaders import PreInsertValidator
+from src.data.models import Room, Student, StudentBatch
+
+ROOMS = [Room(1, '101', 'A', 2), Room(2, '102', 'B', 1)]
+
+
+def batch(*students) -> StudentBatch:
+    result = StudentBatch()
+    for student_id, room_id in students:
+        result.append(Student(student_id, f"Student {student_id}", 20, 'F', room_id))
+    return result
+
+
+def quietly(action, *args):
+    with redirect_stdout(io.StringIO()):
+        return action(*args)
+
+
+class PreInsertValidatorTest(unittest.TestCase):
+
+    def test_valid_batches_are_returned_in_order(self):
+        validator = PreInsertValidator(ROOMS)
+        batches = [batch((1, 1), (2, None)), batch((3, 2))]
+        self.assertEqual(quietly(validator.validate, iter(batches)), batches)
+        self.assertEqual(validator.report.students, 3)
+        self.assertEqual(validator.report.warnings(), [])
+
+    def test_unknown_room_stops_at_its_batch(self):
+        validator = PreInsertValidator(ROOMS)
+        consumed = []
+
+        def batches():
+            for item in (batch((1, 1)), batch((2, 9)), batch((3, 1))):
+                consumed.append(item)
+                yield item
+
+        with self.assertRaisesRegex(ValueError, r"missing room\(s\): 9 \(x1\)"):
+            quietly(validator.validate, batches())
+        self.assertEqual(len(consumed), 2)
+
+    def test_last_write_wins_keeps_the_last_room(self):
+        validator = PreInsertValidator(ROOMS)
+        quietly(validator.validate, [batch((1, 1), (2, 2)), batch((1, 2))])
+        self.assertEqual(validator.report.duplicate_student_ids, {1: 2})
+        self.assertEqual(validator.student_rooms, {1: 2, 2: 2})
+        self.assertEqual(validator.report.over_capacity, [(2, 1, 2)])
+
+    def test_reject_fails_at_the_first_duplicate(self):
+        validator = PreInsertValidator(ROOMS, DuplicatePolicy.REJECT)
+        quietly(validator.check, batch((1, 1)))
+        with self.assertRaisesRegex(ValueError, r"duplicate student ID\(s\): 1 \(x2\)"):
+            quietly(validator.check, batch((1, 2)))
+
+    def test_duplicate_rooms(self):
+        rooms = ROOMS + [Room(1, '103', 'C', 4)]
+        validator = PreInsertValidator(rooms)
+        self.assertEqual(validator.rooms(), [rooms[2], ROOMS[1]])
+        self.assertEqual(validator.report.duplicate_room_ids, {1: 2})
+        with self.assertRaisesRegex(ValueError, r"duplicate room ID\(s\)"):
+            quietly(PreInsertValidator, rooms, DuplicatePolicy.REJECT)
+
+    def test_over_capacity_is_a_warning(self):
+        validator = PreInsertValidator(ROOMS)
+        quietly(validator.validate, [batch((1, 1), (2, 1), (3, 1), (4, None))])
+        report = validator.report
+        self.assertEqual(report.over_capacity, [(1, 2, 3)])
+        self.assertEqual(report.errors(DuplicatePolicy.REJECT), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+"""
+Tests for the saturation search of the query load harness.
+"""
+
+import io
+import unittest
+from contextlib import redirect_stdout
+from typing import Dict
+from src.utils.benchmarks import AnalysisLoadStats, LoadResult, QueryLoadHarness
+
+
+class ScriptedHarness(QueryLoadHarness):
+    """Harness whose runs complete a scripted number of requests per thread count."""
+
+    def __init__(self, completed: Dict[int, int]):
+        super().__init__(connection_factory=None)
+        self.completed = completed
+
+    def run(self, threads: int, duration: float = 1.0, rate=None) -> LoadResult:
+        stats = AnalysisLoadStats()
+        for _ in range(self.completed[threads]):
+            stats.histogram.record(0.001)
+        return LoadResult(threads, rate, 1.0, {'room-occupancy': stats})
+
+
+class FindSaturationTest(unittest.TestCase):
+
+    def find(self, completed: Dict[int, int], max_threads: int):
+        with redirect_stdout(io.StringIO()):
+            return ScriptedHarness(completed).find_saturation(1.0, max_threads=max_threads)
+
+    def test_stops_at_the_first_flat_step(self):
+        steps, saturated = self.find({1: 100, 2: 190, 4: 200, 8: 400}, max_threads=8)
+        self.assertTrue(saturated)
+        self.assertEqual([step.threads for step in steps], [1, 2, 4])
+
+    def test_reports_no_saturation_when_throughput_keeps_growing(self):
+        steps, saturated = self.find({1: 100, 2: 200, 4: 400}, max_threads=4)
+        self.assertFalse(saturated)
+        self.assertEqual([step.threads for step in steps], [1, 2, 4])
+        self.assertEqual(steps[-1].throughput, 400)
+
+
+if __name__ == '__main__':
+    unittest.main()
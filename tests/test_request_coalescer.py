@@ -0,0 +1,68 @@
+"""
+Tests for single-flight coalescing of identical concurrent requests.
+"""
+
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from src.services.server import RequestCoalescer
+
+CALLERS = 8
+
+
+class RequestCoalescerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.coalescer = RequestCoalescer()
+        self.release = threading.Event()
+        self.calls = 0
+
+    def slow_call(self, result):
+        def call():
+            self.calls += 1
+            self.release.wait(5)
+            return result
+        return call
+
+    def run_concurrently(self, key, call):
+        """Start CALLERS identical requests and release the leader once all are waiting."""
+        with ThreadPoolExecutor(CALLERS) as executor:
+            futures = [executor.submit(self.coalescer.run, key, call) for _ in range(CALLERS)]
+            while self.coalescer.executed + self.coalescer.coalesced < CALLERS:
+                threading.Event().wait(0.001)
+            self.release.set()
+            return futures
+
+    def test_concurrent_identical_requests_run_once(self):
+        futures = self.run_concurrently('rooms', self.slow_call([1, 2]))
+        self.assertEqual([future.result() for future in futures], [[1, 2]] * CALLERS)
+        self.assertEqual(self.calls, 1)
+        self.assertEqual((self.coalescer.executed, self.coalescer.coalesced), (1, CALLERS - 1))
+
+    def test_failures_are_shared_and_not_remembered(self):
+        def failing():
+            self.release.wait(5)
+            raise RuntimeError("query failed")
+
+        futures = self.run_concurrently('rooms', failing)
+        for future in futures:
+            with self.assertRaisesRegex(RuntimeError, "query failed"):
+                future.result()
+        self.assertEqual(self.coalescer.run('rooms', lambda: 'ok'), 'ok')
+
+    def test_results_are_not_cached(self):
+        self.assertEqual(self.coalescer.run('rooms', lambda: 1), 1)
+        self.assertEqual(self.coalescer.run('rooms', lambda: 2), 2)
+        self.assertEqual((self.coalescer.executed, self.coalescer.coalesced), (2, 0))
+
+    def test_different_keys_do_not_wait_for_each_other(self):
+        self.release.clear()
+        with ThreadPoolExecutor(1) as executor:
+            blocked = executor.submit(self.coalescer.run, 'slow', self.slow_call('slow'))
+            self.assertEqual(self.coalescer.run('fast', lambda: 'fast'), 'fast')
+            self.release.set()
+            self.assertEqual(blocked.result(), 'slow')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+"""
+Tests for placing unassigned students into rooms.
+"""
+
+import io
+import random
+import unittest
+from collections import Counter
+from contextlib import redirect_stdout
+from src.data.models import Room, Student
+from src.services.assignment import RoomAssignmentEngine
+from src.services.connections import SQLiteConnection
+from src.services.database import DatabaseManager
+
+
+def student(student_id: int, sex: str = 'M', age: int = 20, room_id=None) -> Student:
+    return Student(student_id, f"Student {student_id}", age, sex, room_id)
+
+
+class RoomAssignmentEngineTest(unittest.TestCase):
+
+    def test_best_fit_prefers_the_fullest_compatible_room(self):
+        rooms = [Room(1, '101', 'A', 4), Room(2, '102', 'A', 2), Room(3, '103', 'B', 3)]
+        students = [student(1, room_id=3), student(2, room_id=3), student(3)]
+        result = RoomAssignmentEngine(rooms, students).assign()
+        self.assertEqual(result.to_update_rows(), [(3, 3)])
+
+    def test_rooms_are_not_mixed_by_default(self):
+        rooms = [Room(1, '101', 'A', 2)]
+        students = [student(1, 'M', room_id=1), student(2, 'F')]
+        result = RoomAssignmentEngine(rooms, students).assign()
+        self.assertEqual(len(result.placed), 0)
+        self.assertEqual([unplaced.id for unplaced in result.unplaced], [2])
+
+        mixed = RoomAssignmentEngine(rooms, students, avoid_mixed_sex=False).assign()
+        self.assertEqual(mixed.to_update_rows(), [(1, 2)])
+
+    def test_capacity_and_sex_hold_on_random_input(self):
+        rng = random.Random(5)
+        rooms = [Room(room_id, str(room_id), rng.choice('ABC'), rng.randint(1, 4)) for room_id in range(1, 51)]
+        students = [student(student_id, rng.choice('MF'), rng.randint(17, 30),
+                            rng.choice([None, None, rng.randint(1, 50)]))
+                    for student_id in range(1, 121)]
+        engine = RoomAssignmentEngine(rooms, students)
+        result = engine.assign()
+
+        placed = {student_id: room_id for room_id, student_id in result.to_update_rows()}
+        self.assertEqual(len(placed) + len(result.unplaced), len(engine.unassigned))
+        self.assertTrue(all(students[student_id - 1].room_id is None for student_id in placed))
+        for room in rooms:
+            placed_here = [students[student_id - 1] for student_id, room_id in placed.items() if room_id == room.id]
+            already = [item for item in students if item.room_id == room.id]
+            if placed_here:
+                self.assertLessEqual(len(placed_here) + len(already), room.capacity)
+                self.assertEqual(len({item.sex for item in placed_here + already}), 1)
+
+    def test_minimize_age_spread_groups_similar_ages(self):
+        rooms = [Room(1, '101', 'A', 2), Room(2, '102', 'A', 2)]
+        students = [student(1, age=18), student(2, age=30), student(3, age=19), student(4, age=31)]
+        engine = RoomAssignmentEngine(rooms, students, minimize_age_spread=True)
+        engine.assign()
+        self.assertEqual(sorted(engine.age_spread().values()), [1, 1])
+
+    def test_assignments_are_applied_to_the_database(self):
+        connection = SQLiteConnection()
+        with redirect_stdout(io.StringIO()):
+            connection.connect()
+            manager = DatabaseManager(connection)
+            manager.create_schema()
+            manager.insert_rooms([Room(1, '101', 'A', 2)])
+            manager.insert_students([student(1), student(2, room_id=1)])
+            engine = RoomAssignmentEngine(manager.room_repository.get_all(), manager.student_repository.get_all())
+            manager.apply_room_assignments(engine.assign())
+            rows = connection.fetch_all("SELECT id, room_id FROM students ORDER BY id")
+            connection.disconnect()
+        self.assertEqual(rows, [(1, 1), (2, 1)])
+
+
+if __name__ == '__main__':
+    unittest.main()
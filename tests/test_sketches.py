@@ -0,0 +1,102 @@
+"""
+Tests for the HyperLogLog and age histogram sketches.
+"""
+
+import random
+import statistics
+import unittest
+from src.data.enums import Constants
+from src.services.sketches import AgeHistogram, HyperLogLog
+
+
+def sketch(keys, precision: int = 12) -> HyperLogLog:
+    hll = HyperLogLog(precision)
+    for key in keys:
+        hll.add(key)
+    return hll
+
+
+class HyperLogLogTest(unittest.TestCase):
+
+    def test_relative_error(self):
+        self.assertAlmostEqual(HyperLogLog(12).relative_error, 1.04 / 64)
+        self.assertAlmostEqual(HyperLogLog(16).relative_error, 1.04 / 256)
+
+    def test_empty_sketch_estimates_zero(self):
+        self.assertEqual(HyperLogLog().estimate(), 0)
+
+    def test_small_cardinalities_use_linear_counting(self):
+        # Linear counting's standard error at n=1000 over 4096 registers is about 1.2%
+        for count in (1, 10, 100, 1000):
+            with self.subTest(count=count):
+                self.assertAlmostEqual(sketch(range(count)).estimate(), count, delta=max(1, count * 0.05))
+
+    def test_large_cardinalities_are_within_three_standard_errors(self):
+        for precision in (10, 12, 14):
+            hll = sketch(range(1, 200_001), precision)
+            with self.subTest(precision=precision):
+                self.assertLess(abs(hll.estimate() / 200_000 - 1), 3 * hll.relative_error)
+
+    def test_duplicates_do_not_count(self):
+        keys = list(range(5000))
+        self.assertEqual(sketch(keys + keys[::-1]).estimate(), sketch(keys).estimate())
+
+    def test_merge_equals_sketch_of_union(self):
+        rng = random.Random(7)
+        left = [rng.randrange(10 ** 9) for _ in range(20_000)]
+        right = [rng.randrange(10 ** 9) for _ in range(20_000)] + left[:5000]
+        merged = sketch(left).merge(sketch(right))
+        self.assertEqual(merged.registers, sketch(left + right).registers)
+        self.assertEqual(merged.estimate(), sketch(left + right).estimate())
+
+    def test_invalid_precision(self):
+        for precision in (3, 17):
+            with self.subTest(precision=precision), self.assertRaises(ValueError):
+                HyperLogLog(precision)
+
+    def test_merge_rejects_different_precision(self):
+        with self.assertRaises(ValueError):
+            HyperLogLog(10).merge(HyperLogLog(12))
+
+
+class AgeHistogramTest(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(11)
+        self.ages = [rng.randint(17, 45) for _ in range(5000)]
+        self.histogram = AgeHistogram()
+        for age in self.ages:
+            self.histogram.add(age)
+
+    def test_quantiles_match_nearest_rank(self):
+        ordered = sorted(self.ages)
+        for q in (0.0, 0.01, 0.25, 0.5, 0.9, 0.99, 1.0):
+            rank = max(1, -(-q * len(ordered) // 1))
+            with self.subTest(q=q):
+                self.assertEqual(self.histogram.quantile(q), ordered[int(rank) - 1])
+
+    def test_moments_are_exact(self):
+        self.assertAlmostEqual(self.histogram.mean(), statistics.fmean(self.ages))
+        self.assertAlmostEqual(self.histogram.stddev(), statistics.pstdev(self.ages))
+        self.assertEqual(self.histogram.min(), min(self.ages))
+        self.assertEqual(self.histogram.max(), max(self.ages))
+
+    def test_merge(self):
+        other = AgeHistogram()
+        other.add(Constants.MIN_AGE, 3)
+        other.add(Constants.MAX_AGE)
+        self.histogram.merge(other)
+        ages = self.ages + [Constants.MIN_AGE] * 3 + [Constants.MAX_AGE]
+        self.assertEqual(self.histogram.total, len(ages))
+        self.assertEqual(self.histogram.min(), Constants.MIN_AGE)
+        self.assertEqual(self.histogram.max(), Constants.MAX_AGE)
+        self.assertAlmostEqual(self.histogram.mean(), statistics.fmean(ages))
+
+    def test_empty_histogram(self):
+        empty = AgeHistogram()
+        for value in (empty.quantile(0.5), empty.mean(), empty.stddev(), empty.min(), empty.max()):
+            self.assertIsNone(value)
+
+
+if __name__ == '__main__':
+    unittest.main()
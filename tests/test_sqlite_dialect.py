@@ -0,0 +1,64 @@
+"""
+Tests for the SQLite dialect's translation of MySQL-syntax SQL.
+"""
+
+import sqlite3
+import unittest
+from src.config import DEFAULT_SCHEMA
+from src.services.dialects import SQLiteDialect
+from src.services.dialects.sqlite_dialect import PopulationStdDev, mysql_decimal
+
+
+class SQLiteDialectTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dialect = SQLiteDialect()
+
+    def test_placeholders(self):
+        self.assertEqual(self.dialect.translate("SELECT * FROM rooms WHERE id = %s AND building = %s"),
+                         "SELECT * FROM rooms WHERE id = ? AND building = ?")
+
+    def test_upsert(self):
+        query = ("INSERT INTO rooms (id, number, capacity) VALUES (%s, %s, %s) "
+                 "ON DUPLICATE KEY UPDATE number = VALUES(number), capacity = VALUES(capacity)")
+        self.assertEqual(self.dialect.translate(query),
+                         "INSERT INTO rooms (id, number, capacity) VALUES (?, ?, ?) "
+                         "ON CONFLICT(id) DO UPDATE SET number = excluded.number, capacity = excluded.capacity")
+
+    def test_inline_indexes_become_create_index(self):
+        table_sql, *indexes = self.dialect.table_statements(DEFAULT_SCHEMA.create_students_table_sql)
+        self.assertNotIn('INDEX', table_sql)
+        self.assertIn('COLLATE NOCASE', table_sql)
+        self.assertIn('FOREIGN KEY (room_id) REFERENCES rooms(id)', table_sql)
+        self.assertIn("CREATE INDEX IF NOT EXISTS idx_age_sex ON students (age, sex)", indexes)
+        self.assertEqual(len(indexes), 5)
+
+    def test_partition_clause_is_dropped(self):
+        table_sql, *indexes = self.dialect.table_statements(DEFAULT_SCHEMA.create_history_table_sql)
+        self.assertNotIn('PARTITION', table_sql)
+        self.assertTrue(table_sql.rstrip().endswith(')'))
+        self.assertEqual(len(indexes), 2)
+
+    def test_schema_statements_run_on_sqlite(self):
+        connection = sqlite3.connect(':memory:')
+        self.addCleanup(connection.close)
+        for statement in self.dialect.schema_statements(DEFAULT_SCHEMA):
+            connection.execute(self.dialect.translate(statement))
+        names = {row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        self.assertTrue({'idx_building', 'idx_room_id', 'idx_name'} <= names)
+
+    def test_mysql_decimal_rounds_half_up(self):
+        self.assertEqual(mysql_decimal(2.345, 2), '2.35')
+        self.assertEqual(mysql_decimal(20, 4), '20.0000')
+        self.assertIsNone(mysql_decimal(None, 2))
+
+    def test_population_stddev(self):
+        aggregate = PopulationStdDev()
+        for value in (2, 4, 4, 4, 5, 5, 7, 9, None):
+            aggregate.step(value)
+        self.assertAlmostEqual(aggregate.finalize(), 2.0)
+        self.assertIsNone(PopulationStdDev().finalize())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+"""
+Tests for budgeted sampling of student files.
+"""
+
+import gzip
+import json
+import os
+import tempfile
+import unittest
+from src.utils.preview import StudentSampler
+
+STUDENTS = [
+    {'id': index, 'name': f"Student {index}", 'age': 18 + index % 10, 'sex': 'MF'[index % 2], 'room_id': 1}
+    for index in range(1, 2001)
+]
+
+
+class StudentSamplerTest(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.json_path = os.path.join(directory.name, 'students.json')
+        with open(self.json_path, 'w') as file:
+            json.dump(STUDENTS, file)
+        self.gzip_path = os.path.join(directory.name, 'students.json.gz')
+        with gzip.open(self.gzip_path, 'wt') as file:
+            json.dump(STUDENTS, file)
+
+    def test_whole_file_within_budget(self):
+        for path in (self.json_path, self.gzip_path):
+            with self.subTest(path=path):
+                sampler = StudentSampler(path, sample_size=5000, time_budget=60, seed=1)
+                summary = sampler.sample()
+                self.assertEqual((sampler.estimated_total, sampler.exact, summary.count), (2000, True, 2000))
+                self.assertAlmostEqual(summary.mean, 22.5)
+
+    def test_reservoir_is_bounded_by_sample_size(self):
+        sampler = StudentSampler(self.gzip_path, sample_size=100, time_budget=60, seed=1)
+        summary = sampler.sample()
+        self.assertEqual((sampler.estimated_total, sampler.exact, summary.count), (2000, False, 100))
+
+    def test_exhausted_budget_reports_a_partial_estimate(self):
+        for path in (self.json_path, self.gzip_path):
+            with self.subTest(path=path):
+                sampler = StudentSampler(path, sample_size=5000, time_budget=0, seed=1)
+                summary = sampler.sample()
+                self.assertFalse(sampler.exact)
+                self.assertEqual(summary.count, 1)
+                self.assertGreater(sampler.estimated_total, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,158 @@
+"""
+Tests for DatabaseConnection units of work and DatabaseManager event publishing.
+"""
+
+import io
+import unittest
+from contextlib import redirect_stdout
+from typing import List, Optional
+from src.data.models import Room, Student, StudentBatch
+from src.services.connections import DatabaseConnection, SQLiteConnection
+from src.services.database import DatabaseManager
+
+
+class FailingCommitConnection(SQLiteConnection):
+    """SQLite connection whose next transaction commit fails."""
+
+    fail_commit = False
+
+    def commit(self):
+        if self.fail_commit:
+            self.fail_commit = False
+            raise RuntimeError("commit failed")
+        super().commit()
+
+
+class LegacyConnection(DatabaseConnection):
+    """A subclass written before transactions: abstract methods only, no super().__init__()."""
+
+    def __init__(self):
+        self.statements: List[str] = []
+
+    def connect(self):
+        pass
+
+    def disconnect(self):
+        pass
+
+    def execute(self, query: str, params: tuple = None):
+        self.statements.append(query)
+
+    def fetch_all(self, query: str, params: tuple = None, timeout: Optional[float] = None) -> List[tuple]:
+        return []
+
+
+class TransactionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.connection = FailingCommitConnection()
+        with redirect_stdout(io.StringIO()):
+            self.connection.connect()
+        self.addCleanup(self.disconnect)
+        self.connection.execute("CREATE TABLE items (id INT PRIMARY KEY)")
+
+    def disconnect(self):
+        with redirect_stdout(io.StringIO()):
+            self.connection.disconnect()
+
+    def ids(self):
+        return [row[0] for row in self.connection.fetch_all("SELECT id FROM items ORDER BY id")]
+
+    def insert(self, item_id: int):
+        self.connection.execute("INSERT INTO items (id) VALUES (%s)", (item_id,))
+
+    def test_commits_once(self):
+        before = self.connection.commit_count
+        with self.connection.transaction():
+            for item_id in range(1, 6):
+                self.insert(item_id)
+        self.assertEqual(self.ids(), [1, 2, 3, 4, 5])
+        self.assertEqual(self.connection.commit_count, before + 1)
+        self.assertFalse(self.connection.in_transaction)
+
+    def test_error_rolls_back_everything(self):
+        with self.assertRaises(ValueError), self.connection.transaction():
+            self.insert(1)
+            raise ValueError("boom")
+        self.assertEqual(self.ids(), [])
+        self.assertFalse(self.connection.in_transaction)
+
+    def test_failed_commit_rolls_back(self):
+        self.connection.fail_commit = True
+        with self.assertRaisesRegex(RuntimeError, "commit failed"), self.connection.transaction():
+            self.insert(1)
+        self.assertFalse(self.connection.connection.in_transaction)
+        self.assertEqual(self.ids(), [])
+
+    def test_savepoint_undoes_only_its_block(self):
+        with self.connection.transaction():
+            self.insert(1)
+            with self.assertRaises(ValueError), self.connection.savepoint():
+                self.insert(2)
+                raise ValueError("boom")
+            with self.connection.transaction():
+                self.insert(3)
+        self.assertEqual(self.ids(), [1, 3])
+
+    def test_savepoint_needs_a_transaction(self):
+        with self.assertRaises(RuntimeError), self.connection.savepoint():
+            pass
+
+    def test_legacy_subclass_keeps_per_statement_behaviour(self):
+        connection = LegacyConnection()
+        with connection.transaction():
+            connection.execute("INSERT INTO items (id) VALUES (1)")
+            with connection.savepoint():
+                connection.execute("INSERT INTO items (id) VALUES (2)")
+        self.assertEqual(connection.statements, ["INSERT INTO items (id) VALUES (1)",
+                                                 "INSERT INTO items (id) VALUES (2)"])
+        self.assertEqual((connection.commit_count, connection.in_transaction), (0, False))
+
+
+class EventPublishingTest(unittest.TestCase):
+
+    def setUp(self):
+        self.connection = FailingCommitConnection()
+        with redirect_stdout(io.StringIO()):
+            self.connection.connect()
+            self.manager = DatabaseManager(self.connection)
+            self.manager.create_schema()
+            self.manager.insert_rooms([Room(1, '101', 'A', 4)])
+        self.addCleanup(self.disconnect)
+        self.received = []
+        self.manager.add_event_listener(self.received.append)
+
+    def disconnect(self):
+        with redirect_stdout(io.StringIO()):
+            self.connection.disconnect()
+
+    def batches(self, fail: bool = False):
+        for start in (1, 3):
+            batch = StudentBatch()
+            for student_id in (start, start + 1):
+                batch.append(Student(student_id, f"Student {student_id}", 20, 'M', 1))
+            yield batch
+            self.assertEqual(self.received, [], "events published inside the transaction")
+        if fail:
+            raise RuntimeError("parser failed")
+
+    def test_events_follow_the_commit(self):
+        with redirect_stdout(io.StringIO()):
+            self.manager.insert_student_batches(self.batches())
+        self.assertEqual([[event.student_id for event in events] for events in self.received], [[1, 2], [3, 4]])
+
+    def test_rolled_back_load_publishes_nothing(self):
+        with redirect_stdout(io.StringIO()), self.assertRaises(RuntimeError):
+            self.manager.insert_student_batches(self.batches(fail=True))
+        self.assertEqual(self.received, [])
+        self.assertEqual(self.connection.fetch_all("SELECT COUNT(*) FROM students"), [(0,)])
+
+    def test_failed_commit_publishes_nothing(self):
+        self.connection.fail_commit = True
+        with redirect_stdout(io.StringIO()), self.assertRaises(RuntimeError):
+            self.manager.insert_student_batches(self.batches())
+        self.assertEqual(self.received, [])
+
+
+if __name__ == '__main__':
+    unittest.main()